@@ -3,79 +3,79 @@ from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+import argparse
+import queue
+import threading
 import time
 import csv
 import os
 import re
 
+from steam_fetch import STORE_BASE_URL, TAG_SELECTOR, TAG_SEPARATOR, FetchError, SteamPageFetcher
+
 # 디렉토리 설정
 csv_dir = "./Crawling_data/"
 os.makedirs(csv_dir, exist_ok=True)
 csv_path = os.path.join(csv_dir, "steam_game.csv")
-
-# CSV 파일 초기화 (헤더 작성)
-try:
-    with open(csv_path, mode='w', newline='', encoding='utf-8-sig') as file:
-        writer = csv.writer(file)
-        writer.writerow(["Title", "Description"])
-    print(f"📁 CSV 파일 초기화: {csv_path}")
-except Exception as e:
-    print(f"❌ CSV 파일 초기화 실패: {e}")
-    exit(1)
+tags_path = os.path.join(csv_dir, "steam_game_tags.csv")  # 사용자 태그 (evaluation.py 오프라인 평가의 관련성 기준)
+checkpoint_path = os.path.join(csv_dir, "crawl_checkpoint.txt")  # 완료된 앱 ID / 목록 오프셋 기록
 
 # 크롤링 설정
 GAMES_PER_PAGE = 12  # 한 페이지당 게임 수
 TOTAL_GAMES = 6397  # 총 크롤링할 게임 수
 PAGES_NEEDED = (TOTAL_GAMES + GAMES_PER_PAGE - 1) // GAMES_PER_PAGE
+LISTING_URL = "https://store.steampowered.com/genre/Free%20to%20Play/?offset={offset}"
+GAME_LINK_XPATH = '//*[@id="SaleSection_377601"]/div[2]/div[2]/div[2]/div/div[2]/div/div/div/div/div[1]/a'
 
-# 속도 최적화 설정
+# 대기 설정 (고정 sleep 대신 조건 대기, 아래 값은 최대 대기시간)
 WAIT_TIMEOUT = 10  # 기본 대기시간
-SCROLL_DELAY = 0.3  # 스크롤 후 대기
-CLICK_DELAY = 1.5  # 클릭 후 대기
-PAGE_LOAD_DELAY = 2  # 페이지 로딩 대기
-WINDOW_SWITCH_DELAY = 1  # 창 전환 후 대기
+ELEMENT_TIMEOUT = 2  # 제목/설명 요소 대기
+REPORT_EVERY = 20  # 워커별 처리량 출력 주기 (게임 수)
+
+parser = argparse.ArgumentParser(description="Steam 무료 게임 크롤링 (병렬 / 재시작 가능)")
+parser.add_argument('--workers', type=int, default=4, help="동시에 띄울 브라우저 세션 수")
+parser.add_argument('--restart', action='store_true', help="체크포인트와 CSV(게임 / 태그)를 지우고 처음부터 다시 수집")
+parser.add_argument('--fetch-mode', choices=['http', 'selenium'], default='http',
+                    help="게임 상세 페이지 수집 방식 (http: 브라우저 없이 가져오고 실패 시 Selenium)")
+parser.add_argument('--store-base-url', default=STORE_BASE_URL, help="HTTP 수집 대상 주소 (로컬 스텁 서버 테스트용)")
+args = parser.parse_args()
+
 
 # 크롬 드라이버 설정 (속도 최적화)
-options = Options()
-options.add_argument("--start-maximized")
-options.add_argument("--no-sandbox")
-options.add_argument("--disable-dev-shm-usage")
-options.add_argument("--disable-blink-features=AutomationControlled")
-options.add_argument("--disable-images")  # 이미지 로딩 비활성화
-options.add_argument("--disable-javascript")  # 불필요한 JS 비활성화
-options.add_argument("--disable-plugins")
-options.add_argument("--disable-extensions")
-options.add_argument("--no-first-run")
-options.add_argument("--disable-default-apps")
-options.add_argument("--disable-gpu")
-options.add_argument("--disable-logging")
-options.add_argument("--log-level=3")
-options.add_argument(
-    "--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
-options.add_experimental_option("excludeSwitches", ["enable-automation", "enable-logging"])
-options.add_experimental_option('useAutomationExtension', False)
-options.add_argument("--page-load-strategy=eager")  # DOM 로딩 완료되면 바로 진행
-
-# ChromeDriver 설정
-try:
-    driver = webdriver.Chrome(options=options)
-except Exception as e:
-    print(f"❌ ChromeDriver 초기화 실패: {e}")
-    exit(1)
+def create_driver():
+    options = Options()
+    options.add_argument("--start-maximized")
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+    options.add_argument("--disable-blink-features=AutomationControlled")
+    options.add_argument("--disable-images")  # 이미지 로딩 비활성화
+    options.add_argument("--disable-javascript")  # 불필요한 JS 비활성화
+    options.add_argument("--disable-plugins")
+    options.add_argument("--disable-extensions")
+    options.add_argument("--no-first-run")
+    options.add_argument("--disable-default-apps")
+    options.add_argument("--disable-gpu")
+    options.add_argument("--disable-logging")
+    options.add_argument("--log-level=3")
+    options.add_argument(
+        "--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
+    options.add_experimental_option("excludeSwitches", ["enable-automation", "enable-logging"])
+    options.add_experimental_option('useAutomationExtension', False)
+    options.add_argument("--page-load-strategy=eager")  # DOM 로딩 완료되면 바로 진행
 
-# 페이지 로드 타임아웃 설정
-driver.set_page_load_timeout(15)
-driver.implicitly_wait(5)
+    driver = webdriver.Chrome(options=options)
+    # 페이지 로드 타임아웃 설정 (암묵적 대기는 조건 대기와 겹치지 않도록 0)
+    driver.set_page_load_timeout(15)
+    driver.implicitly_wait(0)
 
-driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-driver.execute_script("Object.defineProperty(navigator, 'plugins', {get: () => [1, 2, 3, 4, 5]})")
-driver.execute_script("Object.defineProperty(navigator, 'languages', {get: () => ['ko-KR', 'ko']})")
+    driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+    driver.execute_script("Object.defineProperty(navigator, 'plugins', {get: () => [1, 2, 3, 4, 5]})")
+    driver.execute_script("Object.defineProperty(navigator, 'languages', {get: () => ['ko-KR', 'ko']})")
+    return driver
 
-wait = WebDriverWait(driver, WAIT_TIMEOUT)
 
 # 스팀 언어 설정
-def setup_korean_language():
-    print("🔧 한국어 설정 중...")
+def setup_korean_language(driver):
     cookies_to_add = [
         {'name': 'Steam_Language', 'value': 'koreana', 'domain': '.steampowered.com'},
         {'name': 'language', 'value': 'koreana', 'domain': '.steampowered.com'},
@@ -95,18 +95,27 @@ def setup_korean_language():
         """)
     except Exception as e:
         print(f"로컬스토리지 설정 실패: {e}")
-    print("✅ 한국어 설정 완료")
+
 
 # 나이 확인 처리
-def handle_age_check():
+def handle_age_check(driver):
     try:
+        # 나이 확인 창 또는 게임 페이지 중 먼저 뜨는 쪽을 기다린다
+        try:
+            WebDriverWait(driver, WAIT_TIMEOUT).until(
+                EC.any_of(
+                    EC.presence_of_element_located((By.ID, "ageYear")),
+                    EC.presence_of_element_located((By.ID, "game_area_description")),
+                    EC.presence_of_element_located((By.CLASS_NAME, "apphub_AppName"))
+                )
+            )
+        except Exception:
+            pass
         age_elements = driver.find_elements(By.XPATH, '//select[@id="ageYear"] | //input[@id="ageYear"]')
         if not age_elements:
-            print("나이 확인 창이 없습니다.")
             return True
         age_check = age_elements[0]
         if not age_check.is_displayed() or not age_check.is_enabled():
-            print("나이 확인 요소가 비활성화되어 있습니다.")
             return True
         if age_check.tag_name == "select":
             from selenium.webdriver.support.ui import Select
@@ -143,9 +152,20 @@ def handle_age_check():
         print(f"나이 확인 처리 오류: {e}")
         return False
 
-# 게임 정보 추출 함수
-def extract_game_info(game_number):
-    title = None
+
+def _first_text(driver, selectors, min_length=1):
+    """selectors 중 텍스트가 있는 첫 번째 요소의 텍스트 (없으면 None)"""
+    for selector in selectors:
+        by = By.XPATH if selector.startswith('/') else By.CSS_SELECTOR
+        for elem in driver.find_elements(by, selector):
+            text = elem.text.strip()
+            if text and len(text) >= min_length:
+                return text
+    return None
+
+
+# 게임 정보 추출 함수 (제목이나 설명을 찾지 못하면 None → 저장하지 않고 다음 실행에서 다시 수집)
+def extract_game_info(driver, game_number):
     title_selectors = [
         ".apphub_AppName",
         "h1.apphub_AppName",
@@ -154,151 +174,275 @@ def extract_game_info(game_number):
         '//*[@id="tabletGrid"]/div[1]/div[2]/div[1]/div[1]/a[3]/span',
         '//*[@id="tabletGrid"]/div[1]/div[2]/div[1]/div[1]/a[4]/span'
     ]
-    for selector in title_selectors:
-        try:
-            if selector.startswith('/'):
-                title_elem = WebDriverWait(driver, 2).until(
-                    EC.presence_of_element_located((By.XPATH, selector))
-                )
-            else:
-                title_elem = WebDriverWait(driver, 2).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, selector))
-                )
-            title = title_elem.text.strip()
-            if title:
-                break
-        except:
-            continue
+    desc_selectors = [
+        "#game_area_description",
+        ".game_description_snippet",
+        ".game_area_description",
+        ".game_page_autocollapse_ctn",
+        ".game_description"
+    ]
+    # 선택자마다 따로 기다리지 않고, 어느 하나라도 나타날 때까지 한 번만 기다린다
+    try:
+        WebDriverWait(driver, ELEMENT_TIMEOUT).until(
+            lambda d: _first_text(d, title_selectors) is not None
+        )
+    except Exception:
+        pass
+    title = _first_text(driver, title_selectors)
     if not title:
-        title = f"제목_없음_{game_number}"
-    description = "설명 없음"
+        print(f"  ⚠️ 게임 #{game_number}: 제목을 찾을 수 없음")
+        return None
+
     try:
-        driver.execute_script("""
+        clicked = driver.execute_script("""
             var moreButtons = document.querySelectorAll('div, span, a');
             for(var i = 0; i < moreButtons.length; i++) {
                 var text = moreButtons[i].innerText || moreButtons[i].textContent;
                 if(text && (text.includes('더 보기') || text.includes('더보기') || text.includes('Read More'))) {
                     moreButtons[i].click();
-                    break;
+                    return true;
                 }
             }
+            return false;
         """)
-        time.sleep(0.5)
+        if clicked:
+            WebDriverWait(driver, ELEMENT_TIMEOUT).until(
+                lambda d: d.execute_script("return document.readyState") == "complete"
+            )
     except Exception as e:
         print(f"더보기 버튼 처리 오류: {e}")
-    desc_selectors = [
-        "#game_area_description",
-        ".game_description_snippet",
-        ".game_area_description",
-        ".game_page_autocollapse_ctn",
-        ".game_description"
-    ]
-    for selector in desc_selectors:
-        try:
-            desc_elem = WebDriverWait(driver, 2).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, selector))
-            )
-            desc_text = desc_elem.text.strip()
-            if desc_text and len(desc_text) > 20:
-                description = re.sub(r'\s+', ' ', desc_text).strip()
-                break
-        except:
-            continue
-    return title, description
+    try:
+        WebDriverWait(driver, ELEMENT_TIMEOUT).until(
+            lambda d: _first_text(d, desc_selectors, min_length=21) is not None
+        )
+    except Exception:
+        pass
+    desc_text = _first_text(driver, desc_selectors, min_length=21)
+    if not desc_text:
+        print(f"  ⚠️ 게임 #{game_number}: 설명을 찾을 수 없음 ({title})")
+        return None
+    # 접혀 있는 태그는 .text 가 비어 있으므로 textContent 로 읽는다
+    tags = []
+    for elem in driver.find_elements(By.CSS_SELECTOR, TAG_SELECTOR):
+        tag = re.sub(r'\s+', ' ', elem.get_attribute('textContent') or '').strip()
+        if tag and tag not in tags:
+            tags.append(tag)
+    return title, re.sub(r'\s+', ' ', desc_text).strip(), tags
 
-# 메인 크롤링 로직
-print(f"🚀 Steam 게임 크롤링 시작 (총 {TOTAL_GAMES}개 게임, {PAGES_NEEDED}페이지)")
-print("📝 제목과 설명만 수집합니다 (이미지 제외)")
 
-game_counter = 1
+def app_id_from_url(url):
+    match = re.search(r'/app/(\d+)', url or '')
+    return match.group(1) if match else None
 
-for page in range(PAGES_NEEDED):
-    offset = page * GAMES_PER_PAGE
-    page_url = f"https://store.steampowered.com/genre/Free%20to%20Play/?offset={offset}"
-    print(f"\n📄 페이지 {page + 1}/{PAGES_NEEDED} 처리 중 (오프셋: {offset})")
-    print(f"🔗 URL: {page_url}")
-
-    driver.get(page_url)
-    setup_korean_language()
-    time.sleep(PAGE_LOAD_DELAY)
-    driver.execute_script("window.scrollTo(0, 2000);")
-    time.sleep(SCROLL_DELAY)
-
-    main_window = driver.current_window_handle
-    games_this_page = min(GAMES_PER_PAGE, TOTAL_GAMES - (page * GAMES_PER_PAGE))
-
-    for i in range(1, games_this_page + 1):
-        if game_counter > TOTAL_GAMES:
-            break
-        print(f"\n[{game_counter}/{TOTAL_GAMES}] 게임 #{game_counter} 처리 중... (페이지 {page + 1}, 항목 {i})")
+
+# ================================
+# 체크포인트 / CSV 기록 (워커 간 공유)
+# ================================
+class CrawlState:
+    """완료된 앱 ID / 목록 오프셋을 체크포인트 파일에 기록하고 CSV(게임 / 태그)에 결과를 이어서 저장"""
+
+    def __init__(self, csv_path, checkpoint_path, tags_path):
+        self.csv_path = csv_path
+        self.checkpoint_path = checkpoint_path
+        self.tags_path = tags_path
+        self.lock = threading.Lock()
+        self.done_apps = set()
+        self.done_offsets = set()
+        if os.path.exists(checkpoint_path):
+            with open(checkpoint_path, encoding='utf-8') as file:
+                for line in file:
+                    kind, _, value = line.strip().partition('\t')
+                    if kind == 'app':
+                        self.done_apps.add(value)
+                    elif kind == 'offset':
+                        self.done_offsets.add(int(value))
+        # CSV 는 새로 만들 때만 헤더 작성 (재시작 시 기존 결과 유지, 이전 형식이면 열을 맞춰서 이어 씀)
+        self._prepare_csv(csv_path, ["Title", "Description", "AppID"])
+        self._prepare_csv(tags_path, ["Title", "Tags", "AppID"])
+
+    @staticmethod
+    def _prepare_csv(path, header):
+        """헤더가 없으면 새로 쓰고, 이전 형식 헤더(예: Title, Description)면 빠진 열을 빈 값으로 채워 다시 저장"""
+        existing = None
+        if os.path.exists(path):
+            with open(path, newline='', encoding='utf-8-sig') as file:
+                existing = next(csv.reader(file), None)
+        if not existing:
+            with open(path, mode='w', newline='', encoding='utf-8-sig') as file:
+                csv.writer(file).writerow(header)
+            return
+        if existing == header:
+            return
+        if existing != header[:len(existing)]:
+            raise SystemExit(f"❌ {path} 의 헤더 {existing} 가 {header} 와 맞지 않아 이어서 저장할 수 없습니다. "
+                             f"--restart 로 처음부터 다시 수집하세요.")
+        # 이전 형식: 행마다 빠진 열(AppID 등)을 빈 값으로 채워서 임시 파일에 쓴 뒤 교체
+        tmp_path = path + '.tmp'
+        with open(path, newline='', encoding='utf-8-sig') as src, \
+                open(tmp_path, mode='w', newline='', encoding='utf-8-sig') as dst:
+            reader = csv.reader(src)
+            writer = csv.writer(dst)
+            next(reader)
+            writer.writerow(header)
+            rows = 0
+            for row in reader:
+                writer.writerow(row + [''] * (len(header) - len(row)))
+                rows += 1
+        os.replace(tmp_path, path)
+        print(f"🔁 이전 형식 CSV 변환: {path} ({', '.join(existing)} → {', '.join(header)}, {rows}행)")
+
+    def _checkpoint(self, kind, value):
+        with open(self.checkpoint_path, mode='a', encoding='utf-8') as file:
+            file.write(f"{kind}\t{value}\n")
+            file.flush()
+            os.fsync(file.fileno())
+
+    def is_done(self, app_id):
+        with self.lock:
+            return app_id in self.done_apps
+
+    def save_game(self, app_id, title, description, tags):
+        with self.lock:
+            with open(self.csv_path, mode='a', newline='', encoding='utf-8-sig') as file:
+                csv.writer(file).writerow([title, description, app_id])
+            if tags:
+                with open(self.tags_path, mode='a', newline='', encoding='utf-8-sig') as file:
+                    csv.writer(file).writerow([title, TAG_SEPARATOR.join(tags), app_id])
+            # CSV 에 쓴 다음 체크포인트 기록 (중간에 죽으면 해당 게임은 다시 수집)
+            self._checkpoint('app', app_id)
+            self.done_apps.add(app_id)
+
+    def finish_offset(self, offset):
+        with self.lock:
+            self._checkpoint('offset', offset)
+            self.done_offsets.add(offset)
+
+
+# ================================
+# 워커 (브라우저 세션 1개 = 워커 1개)
+# ================================
+def collect_game_links(driver, offset, games_this_page):
+    """목록 페이지에서 게임 상세 페이지 링크를 순서대로 수집"""
+    driver.get(LISTING_URL.format(offset=offset))
+    setup_korean_language(driver)
+
+    def enough_links(d):
+        d.execute_script("window.scrollTo(0, 2000);")  # 지연 로딩 유도
+        links = d.find_elements(By.XPATH, GAME_LINK_XPATH)
+        return links if len(links) >= games_this_page else False
+
+    try:
+        links = WebDriverWait(driver, WAIT_TIMEOUT).until(enough_links)
+    except Exception:
+        links = driver.find_elements(By.XPATH, GAME_LINK_XPATH)
+        print(f"  ⚠️ 오프셋 {offset}: 게임 링크 {len(links)}/{games_this_page}개만 발견")
+    return [link.get_attribute("href") for link in links[:games_this_page]]
+
+
+def fetch_game(driver, fetcher, game_url, app_id, game_number, fetch_counts):
+    """HTTP 로 먼저 시도하고 실패하면 Selenium 으로 게임 정보 추출 (둘 다 실패하면 None)"""
+    if fetcher is not None and app_id_from_url(game_url):
         try:
-            xpath = f'//*[@id="SaleSection_377601"]/div[2]/div[2]/div[2]/div/div[2]/div[{i}]/div/div/div/div[1]/a/div/div[2]/img'
+            result = fetcher.fetch(app_id)
+            fetch_counts['http'] += 1
+            return result
+        except FetchError as e:
+            print(f"  ↪️ HTTP 수집 실패, Selenium 으로 재시도 (app {app_id}): {e}")
+    driver.get(game_url)
+    handle_age_check(driver)
+    fetch_counts['selenium'] += 1
+    return extract_game_info(driver, game_number)
+
+
+def crawl_worker(worker_id, offsets, state, stats):
+    try:
+        driver = create_driver()
+    except Exception as e:
+        print(f"❌ [워커 {worker_id}] ChromeDriver 초기화 실패: {e}")
+        return
+    fetcher = SteamPageFetcher(base_url=args.store_base_url) if args.fetch_mode == 'http' else None
+    fetch_counts = {'http': 0, 'selenium': 0}
+    started = time.perf_counter()
+    collected = 0
+    try:
+        while True:
             try:
-                game_img = wait.until(EC.element_to_be_clickable((By.XPATH, xpath)))
-                driver.execute_script("arguments[0].scrollIntoView(true);", game_img)
-                time.sleep(SCROLL_DELAY)
-                game_img = driver.find_element(By.XPATH, xpath)
-                driver.execute_script("arguments[0].click();", game_img)
-                print(f"  📱 게임 링크 클릭 완료")
-                time.sleep(CLICK_DELAY)
-            except Exception as e:
-                print(f"  ❌ 게임 링크 클릭 실패: {e}")
-                game_counter += 1
-                continue
-            all_windows = driver.window_handles
-            for w in all_windows:
-                if w != main_window:
-                    driver.switch_to.window(w)
-                    break
-            handle_age_check()
-            title, description = extract_game_info(game_counter)
-            print(f"  📝 게임 제목: {title}")
-            print(f"  📄 설명: {description}")
-
-            # 실시간 CSV 저장
+                offset = offsets.get_nowait()
+            except queue.Empty:
+                break
+            games_this_page = min(GAMES_PER_PAGE, TOTAL_GAMES - offset)
+            print(f"\n📄 [워커 {worker_id}] 페이지 {offset // GAMES_PER_PAGE + 1}/{PAGES_NEEDED} 처리 중 (오프셋: {offset})")
             try:
-                with open(csv_path, mode='a', newline='', encoding='utf-8-sig') as file:
-                    writer = csv.writer(file)
-                    writer.writerow([title, description])
-                print(f"  ✅ 데이터 CSV에 저장 완료")
+                game_urls = collect_game_links(driver, offset, games_this_page)
             except Exception as e:
-                print(f"  ❌ CSV 저장 실패: {e}")
-                # 에러 데이터도 저장
+                print(f"  ❌ [워커 {worker_id}] 목록 페이지 로드 실패 (오프셋 {offset}): {e}")
+                continue
+
+            page_complete = len(game_urls) == games_this_page
+            for i, game_url in enumerate(game_urls, start=1):
+                game_number = offset + i
+                app_id = app_id_from_url(game_url) or f"offset{offset}_{i}"
+                if state.is_done(app_id):
+                    continue
                 try:
-                    with open(csv_path, mode='a', newline='', encoding='utf-8-sig') as file:
-                        writer = csv.writer(file)
-                        writer.writerow([f"에러_게임_{game_counter}", f"데이터 수집 실패: {str(e)}"])
-                except Exception as csv_e:
-                    print(f"  ❌ CSV 에러 데이터 저장 실패: {csv_e}")
+                    result = fetch_game(driver, fetcher, game_url, app_id, game_number, fetch_counts)
+                    if result is None:
+                        page_complete = False  # 체크포인트에 남기지 않으므로 다음 실행에서 이 페이지를 다시 수집
+                        continue
+                    title, description, tags = result
+                    state.save_game(app_id, title, description, tags)
+                    collected += 1
+                    print(f"  ✅ [워커 {worker_id}] #{game_number} {title} (app {app_id})")
+                except Exception as e:
+                    page_complete = False
+                    print(f"  ❌ [워커 {worker_id}] 게임 #{game_number} 처리 중 에러: {e}")
+                if collected and collected % REPORT_EVERY == 0:
+                    elapsed = time.perf_counter() - started
+                    print(f"  ⏱️ [워커 {worker_id}] {collected}개 수집, {collected / elapsed * 60:.1f} games/min")
+            if page_complete:
+                state.finish_offset(offset)
+    finally:
+        driver.quit()
+        if fetcher is not None:
+            fetcher.close()
+        stats[worker_id] = (collected, time.perf_counter() - started, fetch_counts)
 
-        except Exception as e:
-            print(f"  ❌ 게임 #{game_counter} 처리 중 에러: {e}")
-            try:
-                with open(csv_path, mode='a', newline='', encoding='utf-8-sig') as file:
-                    writer = csv.writer(file)
-                    writer.writerow([f"에러_게임_{game_counter}", f"데이터 수집 실패: {str(e)}"])
-                print(f"  ✅ 에러 데이터 CSV에 저장 완료")
-            except Exception as csv_e:
-                print(f"  ❌ CSV 에러 데이터 저장 실패: {csv_e}")
-
-        finally:
-            try:
-                if len(driver.window_handles) > 1:
-                    driver.close()
-                driver.switch_to.window(main_window)
-            except:
-                pass
-            time.sleep(WINDOW_SWITCH_DELAY)
-            game_counter += 1
 
-    print(f"✅ 페이지 {page + 1} 완료 ({game_counter - 1}개 게임 수집됨)")
+# 메인 크롤링 로직
+if args.restart:
+    for path in (csv_path, checkpoint_path, tags_path):
+        if os.path.exists(path):
+            os.remove(path)
+state = CrawlState(csv_path, checkpoint_path, tags_path)
+
+offsets = queue.Queue()
+for page in range(PAGES_NEEDED):
+    offset = page * GAMES_PER_PAGE
+    if offset not in state.done_offsets:
+        offsets.put(offset)
+
+print(f"🚀 Steam 게임 크롤링 시작 (총 {TOTAL_GAMES}개 게임, {PAGES_NEEDED}페이지, 워커 {args.workers}개)")
+print(f"📌 체크포인트: 완료된 게임 {len(state.done_apps)}개, 남은 페이지 {offsets.qsize()}개")
+print("📝 제목 / 설명 / 사용자 태그만 수집합니다 (이미지 제외)")
 
-# 드라이버 종료
-driver.quit()
+stats = {}
+crawl_started = time.perf_counter()
+workers = [threading.Thread(target=crawl_worker, args=(worker_id, offsets, state, stats), daemon=True)
+           for worker_id in range(1, args.workers + 1)]
+for worker in workers:
+    worker.start()
+for worker in workers:
+    worker.join()
+crawl_elapsed = time.perf_counter() - crawl_started
 
 print(f"\n🎉 크롤링 완료!")
-print(f"📁 CSV 파일: {csv_path}")
-print(f"📊 수집된 게임 수: {game_counter - 1}개")
+print(f"📁 CSV 파일: {csv_path}, 태그: {tags_path}")
+print(f"📊 누적 수집된 게임 수: {len(state.done_apps)}개 (이번 실행 {crawl_elapsed / 60:.1f}분)")
+for worker_id, (collected, elapsed, fetch_counts) in sorted(stats.items()):
+    print(f"  워커 {worker_id}: {collected}개, {collected / max(elapsed, 1e-9) * 60:.1f} games/min "
+          f"(HTTP {fetch_counts['http']} / Selenium {fetch_counts['selenium']})")
+total_collected = sum(collected for collected, _, _ in stats.values())
+print(f"  전체: {total_collected / max(crawl_elapsed, 1e-9) * 60:.1f} games/min")
 
 # 수집된 게임 목록 출력 (처음 10개만)
 try:
@@ -313,4 +457,4 @@ try:
 except Exception as e:
     print(f"❌ CSV 파일 읽기 실패: {e}")
 
-print("\n작업 완료!")
\ No newline at end of file
+print("\n작업 완료!")
@@ -1,44 +1,59 @@
+import argparse
 import asyncio
+import time
+
 import pandas as pd
-from googletrans import Translator
 from langdetect import detect
-import time
+
+from translation import GoogleTransBackend, StubBackend, TranslationCache, TRANSLATION_CACHE_FILE, translate_all
+
+parser = argparse.ArgumentParser(description="게임 설명 번역 + 중복 제거")
+parser.add_argument('--concurrency', type=int, default=8, help="동시에 보낼 번역 요청 수")
+parser.add_argument('--backend', choices=['google', 'stub'], default='google', help="stub: 네트워크 없이 테스트")
+parser.add_argument('--cache', default=TRANSLATION_CACHE_FILE)
+args = parser.parse_args()
+
 
 async def translate_texts():
-    translator = Translator()
     df = pd.read_csv('./Crawling_data/steam_game.csv')
-    print("✅ 원본 개수:", len(pd.read_csv('./Crawling_data/steam_game.csv')))
+    print("✅ 원본 개수:", len(df))
     df.dropna(subset=['Title', 'Description'], inplace=True)
     df['Description'] = df['Description'].str.replace('게임 정보', '', regex=False).str.strip()
     df['Title'] = df['Title'].astype(str).str.strip().str.lower().str.replace(r'\s+', ' ', regex=True)
     df = df.drop_duplicates(subset=['Title'])
 
-
     print("✅ 전처리 후 개수:", len(df))
 
-    translated_descriptions = []
-    target_langs = ['en', 'ja', 'zh-cn', 'zh-tw' , 'zh']
+    target_langs = ['en', 'ja', 'zh-cn', 'zh-tw', 'zh']
 
-    for count, (_, row) in enumerate(df.iterrows(), start=1):
-        original_text = str(row['Description'])
+    # 언어 감지 (번역 대상이 아니면 None → 원문 유지)
+    items = []
+    for original_text in df['Description'].astype(str):
         try:
             lang = detect(original_text)
         except:
             lang = 'unknown'
+        items.append((original_text, lang if lang in target_langs else None))
 
-        if lang in target_langs:
-            try:
-                translated = await translator.translate(original_text, src=lang, dest='ko')
-                print(f"[{count}] 번역됨 ({lang} → ko): {translated.text[:60]}...")
-                translated_descriptions.append(translated.text)
-            except Exception as e:
-                print(f"[{count}] 번역 실패 ({lang}): {e}")
-                translated_descriptions.append(original_text)
+    def on_progress(batch, translated, error):
+        if error is not None:
+            print(f"번역 실패 ({batch[0][2]}, {len(batch)}개): {error}")
         else:
-            print(f"[{count}] 번역 생략 ({lang})")
-            translated_descriptions.append(original_text)
-
-        time.sleep(0.1)
+            print(f"[{batch[0][0] + 1}] 번역됨 ({batch[0][2]} → ko, {len(batch)}개): {translated[0][:60]}...")
+
+    backend = GoogleTransBackend() if args.backend == 'google' else StubBackend()
+    cache = TranslationCache(args.cache)
+    start = time.perf_counter()
+    try:
+        translated_descriptions, stats = await translate_all(items, backend, cache, dest='ko',
+                                                             concurrency=args.concurrency,
+                                                             on_progress=on_progress)
+    finally:
+        cache.close()
+    elapsed = time.perf_counter() - start
+
+    print(f"✅ 번역 통계: 전체 {stats['total']}, 번역 생략 {stats['skipped']}, 캐시 {stats['cached']}, "
+          f"새로 번역 {stats['translated']}, 실패 {stats['failed']} ({elapsed:.1f}s)")
 
     df['Description'] = translated_descriptions
     df.to_csv('./Crawling_data/steam_game_translated.csv', index=False, encoding='utf-8-sig')
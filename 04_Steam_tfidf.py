@@ -1,30 +1,79 @@
 #TFIDF = (term frequency-inverse document frequency)란
 #코퍼스(corpus, 문서집합)에서 한 단어가 얼마나 중요한지를 수치적으로 나타낸 가중치
+import argparse
+import os
 import pickle
+import time
 
 import pandas as pd
 from sklearn.feature_extraction.text import TfidfVectorizer
 from scipy.io import mmwrite, mmread
 
+from artifacts import BUNDLE_DIR, write_bundle
+from feature_store import CATALOG_FILE, game_id_for
+from incremental_tfidf import TFIDF_STATE_FILE, IncrementalTfidf, unique_keys
+from inverted_index import INVERTED_INDEX_FILE, InvertedIndex
+
+parser = argparse.ArgumentParser(description="TF-IDF 모델 생성")
+parser.add_argument('--incremental', action='store_true',
+                    help="저장된 상태에서 추가/변경/삭제된 게임만 반영 (상태가 없으면 전체로 생성)")
+parser.add_argument('--legacy-files', action='store_true',
+                    help="이전 형식(tfidf_steam.mtx / tfidf_steam.pickle / 역색인 npz)도 함께 저장")
+args = parser.parse_args()
+
 
 
 
 
 
 df_description = pd.read_csv('./Crawling_data/steam_game_token.csv')
-df_description.dropna(inplace=True)
-df_description.to_csv('./Crawling_data/steam_game_token.csv', index=False)
+n_rows = len(df_description)
+df_description = df_description.dropna().reset_index(drop=True)
+if len(df_description) < n_rows:
+    # 빈 행이 있을 때만 정리된 토큰 CSV 로 다시 저장 (05 단계도 같은 행을 읽도록)
+    df_description.to_csv('./Crawling_data/steam_game_token.csv', index=False)
+    print(f"빈 행 {n_rows - len(df_description)}개 제거 후 토큰 CSV 다시 저장")
 
 df_description.info()
 
-df_description = pd.read_csv('./Crawling_data//steam_game_token.csv')
-
-tfidf = TfidfVectorizer(sublinear_tf=True)
-tfidf_matrix = tfidf.fit_transform(df_description['Description'])
+start = time.perf_counter()
+if args.incremental:
+    # 게임 id (번역 CSV 의 AppID, 없으면 제목 해시) 를 키로 바뀐 문서만 반영하고, idf 는 내보낼 때 다시 계산
+    state = IncrementalTfidf.load(TFIDF_STATE_FILE) if os.path.exists(TFIDF_STATE_FILE) else IncrementalTfidf()
+    titles = df_description['Title'].astype(str).str.strip().tolist()
+    app_ids = {}
+    if os.path.exists(CATALOG_FILE):
+        catalog = pd.read_csv(CATALOG_FILE, encoding='utf-8')
+        if 'AppID' in catalog.columns:
+            for title, app_id in zip(catalog['Title'].astype(str).str.strip(), catalog['AppID']):
+                app_ids.setdefault(title, app_id)
+    keys = unique_keys([game_id_for(title, app_ids.get(title)) for title in titles])
+    stats = state.sync(zip(keys, df_description['Description'].astype(str)))
+    print(f"증분 갱신: 추가 {stats['added']}, 변경 {stats['changed']}, 삭제 {stats['removed']}, 유지 {stats['unchanged']}")
+    tfidf_matrix = state.weighted_matrix(keys)
+    tfidf = state.to_vectorizer()
+    state.save(TFIDF_STATE_FILE)
+else:
+    tfidf = TfidfVectorizer(sublinear_tf=True)
+    tfidf_matrix = tfidf.fit_transform(df_description['Description'])
+print(f"TF-IDF 생성 시간: {time.perf_counter() - start:.2f}s")
 print(tfidf_matrix.shape)
 print(tfidf_matrix[0])
 
-with open('./model/tfidf_steam.pickle', 'wb') as f:
-    pickle.dump(tfidf, f)
+vocabulary, idf = tfidf.vocabulary_, tfidf.idf_
+
+# CSR 배열 / 어휘 / idf / 제목 / 역색인을 .npy 번들로 저장 (추천 엔진이 mmap 으로 바로 연다)
+start = time.perf_counter()
+manifest = write_bundle(tfidf_matrix, vocabulary, idf, df_description['Title'].astype(str).tolist(), BUNDLE_DIR)
+print(f"✅ 모델 번들 저장: {BUNDLE_DIR} (build {manifest['build_id']}, {time.perf_counter() - start:.2f}s)")
+
+if args.legacy_files:
+    with open('./model/tfidf_steam.pickle', 'wb') as f:
+        pickle.dump(tfidf, f)
+
+    mmwrite('./model/tfidf_steam.mtx', tfidf_matrix)       # matrix 저장할때 사용
 
-mmwrite('./model/tfidf_steam.mtx', tfidf_matrix)       # matrix 저장할때 사용
+    # 키워드 검색용 역색인 (term → postings)
+    inverted_index = InvertedIndex.from_matrix(tfidf_matrix)
+    inverted_index.save(INVERTED_INDEX_FILE)
+    print(f"역색인 저장: {INVERTED_INDEX_FILE} (단어 {inverted_index.n_terms}개, postings {len(inverted_index.doc_ids)}개)")
@@ -0,0 +1,35 @@
+# 05_Steam_word2vec.py 다음 단계
+# 게임별 특징 저장소(./model/feature_store/)를 만든다 - 추천 시 매번 다시 토큰화 / 벡터화하지 않도록
+#   메타데이터(번역 CSV) + Okt 토큰(토큰 CSV) + TF-IDF 번들 행 + Word2Vec 문서 벡터를 게임 id / 행 번호로 맞춘다.
+#   문서 벡터는 TF-IDF / Word2Vec 을 학습한 것과 같은 Okt 토큰으로 계산한다.
+#   키워드 검색어 확장용 Word2Vec 이웃 단어 표(query_expansion.py)도 여기서 미리 만든다.
+import numpy as np
+import pandas as pd
+from gensim.models import Word2Vec
+
+from artifacts import BUNDLE_DIR, open_bundle
+from ann_index import ANN_INDEX_FILE, IVFIndex
+from feature_store import CATALOG_FILE, FEATURE_STORE_DIR, TOKEN_FILE, build_feature_store, open_feature_store
+
+catalog_df = pd.read_csv(CATALOG_FILE, encoding='utf-8')
+token_df = pd.read_csv(TOKEN_FILE, encoding='utf-8')
+bundle = open_bundle(BUNDLE_DIR)  # 04_Steam_tfidf.py 의 TF-IDF 행 / 어휘 / idf
+print(f"문서 수: 번역 CSV {len(catalog_df)}, 토큰 CSV {len(token_df)}, TF-IDF {bundle.n_docs}")
+
+embedding_model = Word2Vec.load('./model/word2vec_steam.model')
+manifest, dropped = build_feature_store(catalog_df, token_df, bundle, embedding_model, FEATURE_STORE_DIR)
+print(f"✅ 특징 저장소 저장: {FEATURE_STORE_DIR} (build {manifest['build_id']}, 게임 {manifest['n_games']}개)")
+if dropped:
+    print(f"⚠️ 메타데이터 / 토큰이 없거나 id 가 중복되어 제외된 TF-IDF 행: {len(dropped)}개, 예) {dropped[:5]}")
+
+store = open_feature_store(FEATURE_STORE_DIR)
+embedding = np.asarray(store.embedding)
+empty_rows = int((~np.any(embedding, axis=1)).sum())
+print(f"Word2Vec 토큰이 없는 문서 수: {empty_rows}")
+expandable = int((store.neighbor_ids[:, 0] >= 0).sum())
+print(f"이웃 단어 표: 어휘 {store.neighbor_ids.shape[0]}개 중 {expandable}개 확장 가능 (단어당 최대 {store.neighbor_ids.shape[1]}개)")
+
+# 근사 최근접 이웃(IVF) 인덱스 (행 번호 = 특징 저장소 행) - 벤치마크: python benchmark.py ann
+ivf_index = IVFIndex.build(embedding)
+ivf_index.save(ANN_INDEX_FILE)
+print(f"✅ IVF 인덱스 저장: {ANN_INDEX_FILE} (군집 {ivf_index.n_lists}개, 기본 nprobe {ivf_index.nprobe})")
@@ -1,88 +1,81 @@
-import pandas as pd
-import numpy as np
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
-from gensim.models import Word2Vec
-from scipy.io import mmread
-import pickle
 import os
 
+import numpy as np
+
+from artifacts import open_bundle
+from batch_recommend import load_blend_weights, top_n_per_row, valid_rows_mask
+from doc_vectors import cosine_scores
+from feature_store import open_feature_store
+
 # ================================
 # [1] 경로 설정 (유지보수 편의성 ↑)
 # ================================
 BASE_PATH = 'D:/workplace/game_recommendation'
-DATA_FILE = os.path.join(BASE_PATH, 'Crawling_data//steam_game_translated.csv')
-TFIDF_MODEL_FILE = os.path.join(BASE_PATH, 'model/tfidf_steam.pickle')
-TFIDF_MATRIX_FILE = os.path.join(BASE_PATH, 'model/tfidf_steam.mtx')
-W2V_MODEL_FILE = os.path.join(BASE_PATH, 'model/word2vec_steam.model')
+BUNDLE_DIR = os.path.join(BASE_PATH, 'model/bundle')  # 04_Steam_tfidf.py 결과
+FEATURE_STORE_DIR = os.path.join(BASE_PATH, 'model/feature_store')  # 05_1_Steam_doc_vectors.py 결과
+BLEND_WEIGHTS_FILE = os.path.join(BASE_PATH, 'model/blend_weights.json')  # benchmark.py suite --save-weights 결과
 
 # ================================
-# [2] 데이터 및 모델 로딩
+# [2] 특징 저장소 로딩 (제목 / 설명 / TF-IDF 행 / 문서 벡터가 같은 행 번호)
 # ================================
 try:
-    df_description = pd.read_csv(DATA_FILE)
-    tokens = [desc.split() for desc in df_description['Description']]
+    store = open_feature_store(FEATURE_STORE_DIR)
+    titles = store.titles.tolist()
+    descriptions = store.descriptions
 except Exception as e:
-    print(f"데이터 파일 로드 실패: {e}")
+    print(f"특징 저장소 로드 실패 (05_1_Steam_doc_vectors.py 를 먼저 실행하세요): {e}")
     exit()
 
 try:
-    with open(TFIDF_MODEL_FILE, 'rb') as f:
-        tfidf = pickle.load(f)
-    tfidf_matrix = mmread(TFIDF_MATRIX_FILE).tocsr()
+    tfidf_matrix = store.tfidf_matrix(open_bundle(BUNDLE_DIR))
 except Exception as e:
     print(f"TF-IDF 모델 로드 실패: {e}")
     exit()
 
-try:
-    w2v_model = Word2Vec.load(W2V_MODEL_FILE)
-    print(f"✅ Word2Vec 모델 로드 완료 (벡터 크기: {w2v_model.vector_size})")
-except Exception as e:
-    print(f"Word2Vec 모델 로드 실패: {e}")
-    exit()
-
 # ================================
-# [3] 문장 벡터 생성 함수 (가중 평균)
+# [3] 문장 벡터 (Okt 토큰 평균, L2 정규화 완료 - 추천 엔진 / 08 / ANN 인덱스 / 가중치 튜닝과 같은 embedding)
 # ================================
-def get_weighted_sentence_vector(tokens, model, tfidf_vectorizer):
-    vec = np.zeros(model.vector_size)
-    weight_sum = 0
-    for token in tokens:
-        if token in model.wv and token in tfidf_vectorizer.vocabulary_:
-            weight = tfidf_vectorizer.idf_[tfidf_vectorizer.vocabulary_[token]]
-            vec += model.wv[token] * weight
-            weight_sum += weight
-    return vec / weight_sum if weight_sum > 0 else vec
+doc_vectors = store.embedding
+# 추천 후보가 될 수 있는 게임 (빈 TF-IDF 행 / 0 문서 벡터 제외, 추천 엔진과 같음)
+valid_rows = store.valid_rows if store.valid_rows is not None else valid_rows_mask(tfidf_matrix, doc_vectors)
+print(f"✅ 특징 저장소 로드 완료 (게임 {len(titles)}개, 벡터 크기: {doc_vectors.shape[1]})")
+blend_weights = load_blend_weights(BLEND_WEIGHTS_FILE)
+print(f"결합 가중치 (TF-IDF, Word2Vec): {blend_weights}")
 
 # ================================
 # [4] 추천 함수 (인덱스 기반)
 # ================================
 def recommend_games_by_index(ref_idx, top_n=5):
-    if not (0 <= ref_idx < len(df_description)):
-        return f"❌ Error: 유효하지 않은 인덱스입니다 (0 ~ {len(df_description)-1})"
+    if not (0 <= ref_idx < len(titles)):
+        return f"❌ Error: 유효하지 않은 인덱스입니다 (0 ~ {len(titles)-1})"
 
-    game_title = df_description.iloc[ref_idx]['Title']
+    game_title = titles[ref_idx]
     print(f"\n🎮 기준 게임: {game_title} (인덱스 {ref_idx})")
+    if not valid_rows[ref_idx]:
+        return f"❌ Error: '{game_title}'은(는) 설명 토큰이 없어 추천할 수 없습니다."
 
-    # TF-IDF 기반 유사도
+    # TF-IDF 기반 유사도 (행이 L2 정규화되어 있어 내적 = 코사인)
     tfidf_ref = tfidf_matrix[ref_idx]
-    tfidf_sim = cosine_similarity(tfidf_ref, tfidf_matrix)[0]
+    tfidf_sim = (tfidf_matrix @ tfidf_ref.T).toarray().ravel()
 
-    # Word2Vec 기반 유사도
-    ref_vector = get_weighted_sentence_vector(tokens[ref_idx], w2v_model, tfidf)
-    all_vectors = np.array([get_weighted_sentence_vector(tok, w2v_model, tfidf) for tok in tokens])
-    w2v_sim = cosine_similarity([ref_vector], all_vectors)[0]
+    # Word2Vec 기반 유사도 (정규화된 행렬이라 내적 = 코사인)
+    w2v_sim = cosine_scores(doc_vectors, ref_idx)
 
-    # 결합 유사도 (가중치 조절 가능)
-    combined_sim = 0.7 * tfidf_sim + 0.3 * w2v_sim
-    similar_indices = combined_sim.argsort()[::-1][1:top_n+1]
+    # 결합 유사도 (가중치는 다른 진입점과 같은 blend_weights.json)
+    tfidf_weight, w2v_weight = blend_weights
+    combined_sim = tfidf_weight * tfidf_sim + w2v_weight * w2v_sim
+    combined_sim[~valid_rows] = -np.inf
+    combined_sim[ref_idx] = -np.inf  # 자기 자신 제외
+    top_idx, top_scores = top_n_per_row(combined_sim[None, :], top_n)
 
     recommendations = []
-    for idx in similar_indices:
+    for idx, score in zip(top_idx[0], top_scores[0]):
+        if not np.isfinite(score):
+            break  # 유효한 후보가 top_n 보다 적음
         recommendations.append({
-            'Title': df_description.iloc[idx]['Title'],
-            'Similarity': combined_sim[idx],
-            'Description': df_description.iloc[idx]['Description'][:100] + "..."
+            'Title': titles[idx],
+            'Similarity': score,
+            'Description': descriptions[idx][:100] + "..."
         })
     return recommendations
 
@@ -90,10 +83,10 @@ def recommend_games_by_index(ref_idx, top_n=5):
 # [5] 추천 함수 (게임 제목 기반)
 # ================================
 def recommend_games_by_title(game_title, top_n=5):
-    matches = df_description[df_description['Title'].str.lower() == game_title.lower()]
-    if matches.empty:
+    matches = [idx for idx, title in enumerate(titles) if title.lower() == game_title.lower()]
+    if not matches:
         return f"❌ Error: '{game_title}'을(를) 찾을 수 없습니다."
-    return recommend_games_by_index(matches.index[0], top_n)
+    return recommend_games_by_index(matches[0], top_n)
 
 # ================================
 # [6] 테스트 실행
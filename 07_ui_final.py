@@ -1,29 +1,30 @@
 
+import time
+APP_START = time.perf_counter()  # 시작 시간 측정 기준 (무거운 import 전에 기록)
+
 import sys
 import os
 import logging
-from urllib.parse import quote_plus, urlparse, parse_qs
+from urllib.parse import quote_plus
 from pathlib import Path
 import re
+import itertools
 import random
-import numpy as np
-from sklearn.metrics.pairwise import cosine_similarity
-import pandas as pd
+import threading
+from collections import deque, namedtuple
 from PyQt5 import QtWidgets, QtGui, QtCore
 from PyQt5.QtWidgets import *
 from PyQt5.QtGui import *
 from PyQt5.QtCore import QCoreApplication, QStringListModel, QThread, pyqtSignal, Qt, QTimer, QEvent, QPoint, QUrl
-from PyQt5.QtWebEngineWidgets import QWebEngineView
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from gensim.models import Word2Vec
-from sklearn.metrics.pairwise import linear_kernel
-from scipy.io import mmread
-import pickle
 import webbrowser
+from ui_tasks import EventLoopStallMonitor, TaskExecutor
+
+# 무거운 모듈은 처음 쓸 때 import 한다 (창이 먼저 뜨도록)
+# - recommender (numpy / pandas / scipy): ModelLoaderThread 에서
+# - trailer_lookup (requests / selenium): 트레일러를 처음 조회할 때
+# - QtWebEngine: 영상을 처음 띄울 때 (get_webview)
+# 트레일러 조회(HTTP / Selenium)는 모두 ui_tasks.TaskExecutor 스레드 풀에서 실행한다.
+# 다른 게임을 클릭하면 이전 조회는 취소되고, 결과는 시그널로 GUI 스레드에 전달된다.
 
 # 루트 로거 설정
 logger = logging.getLogger()
@@ -86,31 +87,149 @@ class LoadingWidget(QWidget):
         painter.drawArc(-radius, -radius, radius * 2, radius * 2, 0, 270 * 16)
 
 
-class RecommendationThread(QThread):
-    """추천 작업 스레드"""
-    recommendation_finished = pyqtSignal(list)
-    recommendation_error = pyqtSignal(str)
+def elapsed_since_start_ms():
+    return (time.perf_counter() - APP_START) * 1000
+
+
+class ModelLoaderThread(QThread):
+    """게임 목록 / 추천 모델을 백그라운드에서 로드"""
+    progress = pyqtSignal(int, str)      # (진행률 %, 단계 설명)
+    catalog_ready = pyqtSignal(object)   # 게임 목록 로드 완료 (RecommendationEngine)
+    models_ready = pyqtSignal(bool)      # 모델 로드 완료 (models_loaded)
+    load_failed = pyqtSignal(str)
+
+    def run(self):
+        try:
+            self.progress.emit(5, "라이브러리 로드 중")
+            start = time.perf_counter()
+            from recommender import RecommendationEngine
+            logging.debug(f"recommender import: {(time.perf_counter() - start) * 1000:.0f}ms")
+
+            self.progress.emit(20, "게임 목록 로드 중")
+            engine = RecommendationEngine()
+            start = time.perf_counter()
+            engine.load_catalog()
+            logging.debug(f"게임 목록 로드: {(time.perf_counter() - start) * 1000:.0f}ms")
+            self.catalog_ready.emit(engine)
+
+            self.progress.emit(60, "추천 모델 로드 중")
+            start = time.perf_counter()
+            engine.load_models()
+            logging.debug(f"추천 모델 로드: {(time.perf_counter() - start) * 1000:.0f}ms")
+            self.progress.emit(100, "준비 완료")
+            self.models_ready.emit(engine.models_loaded)
+        except Exception as e:
+            error_msg = f"데이터 로드 오류: {str(e)}"
+            logging.error(error_msg)
+            self.load_failed.emit(error_msg)
+
+
+# 추천 요청 (request_id 는 제출 순서대로 증가)
+RecommendationRequest = namedtuple('RecommendationRequest',
+                                   ['request_id', 'input_text', 'is_keyword', 'index', 'semantic', 'submitted_at'])
+
 
-    def __init__(self, app_instance, input_text, is_keyword=False, index=None):
+class RecommendationWorker(QThread):
+    """추천 요청을 하나씩 처리하는 상주 작업 스레드
+
+    새 요청을 넣으면 아직 시작하지 않은 이전 요청은 취소된다 (최신 요청 우선).
+    이미 계산 중인 요청은 끝까지 계산하지만, 그 사이 새 요청이 들어왔으면 결과를 버린다.
+    """
+    recommendation_finished = pyqtSignal(int, list)  # (request_id, 추천 결과)
+    recommendation_error = pyqtSignal(int, str)      # (request_id, 오류 메시지)
+
+    def __init__(self, app_instance, history=200):
         super().__init__()
         self.app_instance = app_instance
-        self.input_text = input_text
-        self.is_keyword = is_keyword
-        self.index = index
+        self.queue = deque()
+        self.condition = threading.Condition()
+        self.request_ids = itertools.count(1)
+        self.latest_id = 0
+        self.running = True
+        self.latencies = deque(maxlen=history)  # 최근 요청의 제출 ~ 완료 시간 (ms)
+        self.submitted = 0
+        self.completed = 0
+        self.superseded = 0  # 시작 전에 새 요청으로 대체됨
+        self.stale = 0       # 계산했지만 새 요청이 있어 결과를 버림
+
+    def submit(self, input_text, is_keyword=False, index=None, semantic=False):
+        """추천 요청을 넣고 request_id 반환 (semantic: 키워드 검색어를 Word2Vec 이웃 단어로 확장)"""
+        with self.condition:
+            request_id = next(self.request_ids)
+            self.superseded += len(self.queue)
+            self.queue.clear()
+            self.queue.append(RecommendationRequest(request_id, input_text, is_keyword, index, semantic,
+                                                    time.perf_counter()))
+            self.latest_id = request_id
+            self.submitted += 1
+            self.condition.notify()
+        return request_id
+
+    def is_current(self, request_id):
+        return request_id == self.latest_id
+
+    def stop(self):
+        with self.condition:
+            self.running = False
+            self.superseded += len(self.queue)
+            self.queue.clear()
+            self.condition.notify()
+        self.wait()
+
+    def stats(self):
+        with self.condition:
+            latencies = sorted(self.latencies)
+            return {
+                'queue_depth': len(self.queue),
+                'submitted': self.submitted,
+                'completed': self.completed,
+                'superseded': self.superseded,
+                'stale': self.stale,
+                'latency_p50_ms': round(latencies[len(latencies) // 2], 1) if latencies else None,
+                'latency_p95_ms': round(latencies[int(len(latencies) * 0.95)], 1) if latencies else None,
+            }
 
     def run(self):
+        while True:
+            with self.condition:
+                while self.running and not self.queue:
+                    self.condition.wait()
+                if not self.running:
+                    return
+                request = self.queue.popleft()
+            self.process(request)
+
+    def process(self, request):
+        started = time.perf_counter()
+        logging.debug(f"추천 요청 #{request.request_id} 시작: 입력={request.input_text}, "
+                      f"키워드 여부={request.is_keyword}, 인덱스={request.index}, "
+                      f"대기 {(started - request.submitted_at) * 1000:.0f}ms")
         try:
-            logging.debug(f"RecommendationThread 시작: 입력={self.input_text}, 키워드 여부={self.is_keyword}, 인덱스={self.index}")
-            if self.is_keyword:
-                recommendations = self.app_instance.keyword_recommendation(self.input_text)
+            if request.is_keyword:
+                recommendations = self.app_instance.keyword_recommendation(request.input_text, request.semantic)
             else:
-                recommendations = self.app_instance.game_title_recommendation(title=self.input_text, index=self.index)
-            logging.debug(f"RecommendationThread 완료: 추천 결과={recommendations}")
-            self.recommendation_finished.emit(recommendations)
+                recommendations = self.app_instance.game_title_recommendation(title=request.input_text,
+                                                                              index=request.index)
+            error_msg = None
         except Exception as e:
-            error_msg = f"RecommendationThread 오류: {str(e)}"
+            recommendations = None
+            error_msg = f"추천 요청 #{request.request_id} 오류: {str(e)}"
             logging.error(error_msg)
-            self.recommendation_error.emit(error_msg)
+
+        finished = time.perf_counter()
+        with self.condition:
+            self.completed += 1
+            self.latencies.append((finished - request.submitted_at) * 1000)
+            if not self.is_current(request.request_id):
+                self.stale += 1
+                logging.debug(f"추천 요청 #{request.request_id} 결과 버림 (새 요청 #{self.latest_id} 있음)")
+                return
+        logging.debug(f"추천 요청 #{request.request_id} 완료: 계산 {(finished - started) * 1000:.0f}ms, "
+                      f"추천 결과={recommendations}")
+        if error_msg is None:
+            self.recommendation_finished.emit(request.request_id, recommendations)
+        else:
+            self.recommendation_error.emit(request.request_id, error_msg)
 
 
 class GameTooltipWidget(QWidget):
@@ -174,10 +293,28 @@ class GameRecommendationApp(QMainWindow):
         super().__init__()
         self.widget_List = []
         self.current_selected_game = None
+        self.engine = None
+        self.game_titles = []
+        self.game_descriptions = {}
+        self.game_images = {}
         self.models_loaded = False
+        self.loading_finished = False   # 로드 성공 / 실패와 무관하게 로더가 끝났는지
+        self.first_paint_logged = False
+        self.first_recommendation_logged = False
+        self.recommendation_started_at = None
+        self.current_request = None  # 화면에 표시할 추천 요청 (request_id, 입력, 키워드 여부)
+        self.trailer_service = None  # 처음 영상을 조회할 때 (작업 스레드에서) 생성
+        self.trailer_service_lock = threading.Lock()
+        self.tasks = TaskExecutor(max_threads=4)
+        self.stall_monitor = EventLoopStallMonitor()
+        self.stall_monitor.start()
+        self.recommendation_worker = RecommendationWorker(self)
+        self.recommendation_worker.recommendation_finished.connect(self.on_recommendation_finished)
+        self.recommendation_worker.recommendation_error.connect(self.on_recommendation_error)
+        self.recommendation_worker.start()
         self.init_ui()
-        self.load_models()
         self.setup_connections()
+        self.load_models()
         self.tooltip_widget = None
         self.tooltip_timer = QTimer()
         self.tooltip_timer.setSingleShot(True)
@@ -223,6 +360,16 @@ class GameRecommendationApp(QMainWindow):
         line.setStyleSheet("QFrame { color: #bdc3c7; margin: 10px 0; }")
         left_layout.addWidget(line)
 
+        # 모델 로드 진행 상태 (준비되면 숨김)
+        self.load_progress = QProgressBar()
+        self.load_progress.setRange(0, 100)
+        self.load_progress.setFixedHeight(30)
+        self.load_progress.setFormat("⏳ 준비 중 %p%")
+        self.load_progress.setAlignment(Qt.AlignCenter)
+        self.load_progress.setStyleSheet(
+            "QProgressBar { border: 2px solid #3498db; border-radius: 12px; background: white; color: #2c3e50; font-size: 12px; } QProgressBar::chunk { background: rgba(52, 152, 219, 0.4); border-radius: 10px; }")
+        left_layout.addWidget(self.load_progress)
+
         combo_section = QWidget()
         combo_layout = QVBoxLayout(combo_section)
         combo_layout.setSpacing(10)
@@ -259,7 +406,13 @@ class GameRecommendationApp(QMainWindow):
         self.recommend_button.setFont(QFont("Malgun Gothic", 12, QFont.Bold))
         self.recommend_button.setStyleSheet(
             "QPushButton { background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #ff6b6b, stop:1 #ff8e8e); color: white; border: none; border-radius: 12px; } QPushButton:hover { background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #ff5252, stop:1 #ff7979); } QPushButton:pressed { background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #e74c3c, stop:1 #c0392b); }")
+        self.recommend_button.setEnabled(False)  # 모델이 준비되면 활성화
+        self.semantic_checkbox = QCheckBox("의미 확장")
+        self.semantic_checkbox.setFont(QFont("Malgun Gothic", 10))
+        self.semantic_checkbox.setToolTip("키워드 검색 시 비슷한 뜻의 단어(Word2Vec)도 함께 검색합니다.")
+        self.semantic_checkbox.setChecked(False)  # 기본은 기존 키워드 검색 (server.py mode=lexical 과 같음)
         input_layout.addWidget(self.game_input, 3)
+        input_layout.addWidget(self.semantic_checkbox)
         input_layout.addWidget(self.recommend_button, 1)
         input_section_layout.addWidget(input_label)
         input_section_layout.addLayout(input_layout)
@@ -316,10 +469,7 @@ class GameRecommendationApp(QMainWindow):
         self.ref_widget_youtube.setMinimumSize(500, 300)
         self.ref_widget_youtube.setStyleSheet("background-color: rgb(84, 84, 84);")
         self.ref_widget_youtube.setObjectName("ref_widget_youtube")
-        self.ref_webview = QWebEngineView(self.ref_widget_youtube)
-        self.ref_webview.setUrl(QUrl("about:blank"))
-        self.ref_webview.setGeometry(QtCore.QRect(0, 0, 500, 300))
-        self.ref_webview.loadFinished.connect(self.on_ref_webview_load_finished)
+        self.ref_webview = None  # get_webview(reference=True) 에서 생성
         middle_layout.addWidget(self.ref_widget_youtube)
 
         self.ref_game_info_widget = GameInfoWidget()
@@ -347,10 +497,7 @@ class GameRecommendationApp(QMainWindow):
         self.widget_youtube.setMinimumSize(500, 300)
         self.widget_youtube.setStyleSheet("background-color: rgb(84, 84, 84);")
         self.widget_youtube.setObjectName("widget_youtube")
-        self.webview = QWebEngineView(self.widget_youtube)
-        self.webview.setUrl(QUrl("about:blank"))
-        self.webview.setGeometry(QtCore.QRect(0, 0, 500, 300))
-        self.webview.loadFinished.connect(self.on_webview_load_finished)
+        self.webview = None  # get_webview() 에서 생성
         right_layout.addWidget(self.widget_youtube)
 
         self.game_info_widget = GameInfoWidget()
@@ -372,99 +519,109 @@ class GameRecommendationApp(QMainWindow):
         main_layout.addWidget(right_panel, 2)
 
     def load_models(self):
-        try:
-            # CSV 로드
-            try:
-                self.game_data = pd.read_csv("./Crawling_data/steam_game_translated.csv", encoding='utf-8')
-            except UnicodeDecodeError:
-                logging.warning("UTF-8로 CSV 로드 실패, cp949로 재시도")
-                self.game_data = pd.read_csv("./Crawling_data/steam_game_translated.csv", encoding='cp949')
-
-            # 데이터 검증
-            required_columns = ['Title', 'Description']
-            missing_columns = [col for col in required_columns if col not in self.game_data.columns]
-            if missing_columns:
-                raise ValueError(f"CSV 파일에 필수 열이 없습니다: {missing_columns}")
-            if self.game_data.empty:
-                raise ValueError("CSV 파일이 비어 있습니다.")
-
-            # 데이터 전처리
-            self.game_data['Title'] = self.game_data['Title'].astype(str).str.strip()
-            self.game_data['Description'] = self.game_data['Description'].fillna('no description')
-
-            # 게임 제목 목록 생성 (CSV 순서 유지, 중복 제거)
-            self.game_titles = list(dict.fromkeys(self.game_data['Title'].dropna().tolist()))
-            if not self.game_titles:
-                raise ValueError("게임 제목 목록이 비어 있습니다.")
-            logging.debug(f"로드된 게임 수: {len(self.game_titles)}, 처음 5개: {self.game_titles[:5]}")
-
-            # 콤보박스 업데이트
-            self.game_combobox.clear()
-            self.game_combobox.addItems(self.game_titles)
-
-            self.game_descriptions = self.game_data.set_index('Title')['Description'].to_dict()
-            self.game_images = self.game_data.set_index('Title').get('image_path', pd.Series(dtype=str)).to_dict()
-
-            # 자동 완성 설정
-            model = QStringListModel(self.game_titles, self)
-            completer = QCompleter(model, self)
-            completer.setCaseSensitivity(Qt.CaseInsensitive)
-            completer.setFilterMode(Qt.MatchContains)
-            completer.setMaxVisibleItems(10)
-            completer.popup().setStyleSheet("""
-                QAbstractItemView {
-                    background: #ffffff;
-                    border: 2px solid #3498db;
-                    border-radius: 8px;
-                    padding: 5px;
-                    font-family: 'Malgun Gothic', Arial, sans-serif;
-                    font-size: 14px;
-                    color: #2c3e50;
-                }
-                QAbstractItemView::item {
-                    padding: 8px;
-                    border-radius: 5px;
-                }
-                QAbstractItemView::item:selected {
-                    background: #3498db;
-                    color: white;
-                }
-            """)
-            self.game_input.setCompleter(completer)
-            logging.debug(f"자동 완성 설정 완료: 게임 제목 수={len(self.game_titles)}")
-
-            self.game_combobox.update()
-            QApplication.processEvents()
-        except Exception as e:
-            logging.error(f"CSV 데이터 로드 오류: {str(e)}")
-            QMessageBox.critical(self, "오류", f"CSV 데이터 로드 중 오류: {str(e)}")
-            self.game_titles = []
-            self.game_descriptions = {}
-            self.game_images = {}
-            return
+        """게임 목록 / 모델 로드를 백그라운드 스레드에서 시작 (창은 바로 표시)"""
+        self.model_loader = ModelLoaderThread()
+        self.model_loader.progress.connect(self.on_load_progress)
+        self.model_loader.catalog_ready.connect(self.on_catalog_ready)
+        self.model_loader.models_ready.connect(self.on_models_ready)
+        self.model_loader.load_failed.connect(self.on_load_failed)
+        self.model_loader.start()
+
+    def on_load_progress(self, percent, message):
+        self.load_progress.setValue(percent)
+        self.load_progress.setFormat(f"⏳ {message} %p%")
+
+    def on_catalog_ready(self, engine):
+        self.engine = engine
+        self.game_titles = engine.game_titles
+        self.game_descriptions = engine.game_descriptions
+        self.game_images = engine.game_images
+
+        # 콤보박스는 전체 제목 모델을 한 번에 설정 (항목을 하나씩 추가하지 않음)
+        start = time.perf_counter()
+        self.title_model = QStringListModel(self.game_titles, self)
+        self.game_combobox.blockSignals(True)  # 첫 항목 선택으로 입력창이 채워지지 않도록
+        self.game_combobox.setModel(self.title_model)
+        self.game_combobox.blockSignals(False)
+
+        # 자동 완성 후보는 엔진의 제목 인덱스에서 입력할 때마다 가져온다 (QCompleter 는 표시만)
+        self.completion_model = QStringListModel(self)
+        completer = QCompleter(self.completion_model, self)
+        completer.setCompletionMode(QCompleter.UnfilteredPopupCompletion)
+        completer.setMaxVisibleItems(10)
+        completer.popup().setStyleSheet("""
+            QAbstractItemView {
+                background: #ffffff;
+                border: 2px solid #3498db;
+                border-radius: 8px;
+                padding: 5px;
+                font-family: 'Malgun Gothic', Arial, sans-serif;
+                font-size: 14px;
+                color: #2c3e50;
+            }
+            QAbstractItemView::item {
+                padding: 8px;
+                border-radius: 5px;
+            }
+            QAbstractItemView::item:selected {
+                background: #3498db;
+                color: white;
+            }
+        """)
+        self.game_input.setCompleter(completer)
+        self.game_input.textEdited.connect(self.update_completions)
+        logging.debug(f"자동 완성 설정 완료: 게임 제목 수={len(self.game_titles)}, "
+                      f"{(time.perf_counter() - start) * 1000:.0f}ms")
+
+    def update_completions(self, text):
+        start = time.perf_counter()
+        suggestions = self.engine.suggest_titles(text, limit=10) if text.strip() else []
+        self.completion_model.setStringList(suggestions)
+        if suggestions:
+            self.game_input.completer().complete()
+        logging.debug(f"자동 완성: 입력={text}, 후보 {len(suggestions)}개, {(time.perf_counter() - start) * 1000:.1f}ms")
+
+    def on_models_ready(self, models_loaded):
+        self.models_loaded = models_loaded
+        self.loading_finished = True
+        self.load_progress.hide()
+        self.recommend_button.setEnabled(True)
+        logging.info(f"⏱️ 모델 준비 완료: {elapsed_since_start_ms():.0f}ms (models_loaded={models_loaded})")
+
+    def on_load_failed(self, error_msg):
+        self.loading_finished = True
+        self.load_progress.hide()
+        self.recommend_button.setEnabled(True)
+        QMessageBox.critical(self, "오류", error_msg)
 
-        # 모델 로드
-        try:
-            self.word2vec_model = Word2Vec.load("./model/word2vec_steam.model")
-            logging.debug("Word2Vec 모델 로드 완료")
-        except Exception as e:
-            logging.error(f"Word2Vec 모델 로드 오류: {str(e)}")
-            self.word2vec_model = None
-
-        try:
-            self.tfidf_matrix = mmread("./model/tfidf_steam.mtx").tocsr()
-            with open("./model/tfidf_steam.pickle", "rb") as f:
-                self.tfidf_vectorizer = pickle.load(f)
-            logging.debug("TF-IDF 모델 로드 완료")
-        except Exception as e:
-            logging.error(f"TF-IDF 모델 로드 오류: {str(e)}")
-            self.tfidf_matrix = None
-            self.tfidf_vectorizer = None
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if not self.first_paint_logged:
+            self.first_paint_logged = True
+            logging.info(f"⏱️ 첫 화면 표시(time-to-first-paint): {elapsed_since_start_ms():.0f}ms")
+
+    def get_webview(self, reference=False):
+        """영상 뷰 (QtWebEngine 은 처음 영상을 띄울 때 import / 생성)"""
+        view = self.ref_webview if reference else self.webview
+        if view is None:
+            from PyQt5.QtWebEngineWidgets import QWebEngineView
+            container = self.ref_widget_youtube if reference else self.widget_youtube
+            view = QWebEngineView(container)
+            view.setGeometry(QtCore.QRect(0, 0, 500, 300))
+            if reference:
+                view.loadFinished.connect(self.on_ref_webview_load_finished)
+                self.ref_webview = view
+            else:
+                view.loadFinished.connect(self.on_webview_load_finished)
+                self.webview = view
+            view.show()
+            logging.debug(f"QWebEngineView 생성 (기준 게임={reference})")
+        return view
 
-        self.models_loaded = (self.word2vec_model is not None and
-                              self.tfidf_matrix is not None and
-                              self.tfidf_vectorizer is not None)
-        logging.debug(f"모델 로드 상태: models_loaded={self.models_loaded}")
+    def clear_webview(self, reference=False):
+        view = self.ref_webview if reference else self.webview
+        if view is not None:
+            view.setUrl(QUrl("about:blank"))
 
     def setup_connections(self):
         try:
@@ -526,6 +683,9 @@ class GameRecommendationApp(QMainWindow):
 
     def start_recommendation(self):
         logging.debug(f"추천 시작: models_loaded={self.models_loaded}")
+        if not self.loading_finished:
+            QMessageBox.information(self, "알림", "추천 모델을 불러오는 중입니다. 잠시 후 다시 시도하세요.")
+            return
         if not self.models_loaded:
             QMessageBox.warning(self, "경고", "추천 모델을 로드하지 못했습니다.")
             logging.warning("모델 로드 실패로 추천 중단")
@@ -538,29 +698,21 @@ class GameRecommendationApp(QMainWindow):
             return
 
         # 대소문자 무시 부분 일치 검색
-        matched_title, index = None, None
-        for i, title in enumerate(self.game_titles):
-            if user_input.lower() in title.lower():
-                matched_title = title
-                index = self.game_data[self.game_data['Title'] == title].index[0]
-                break
+        matched_title, index = self.engine.find_title(user_input)
         is_keyword = matched_title is None
         user_input = matched_title if matched_title else user_input
 
         logging.debug(f"추천 시작: 입력={user_input}, 키워드 여부={is_keyword}, matched_title={matched_title}, 인덱스={index}")
+        self.recommendation_started_at = time.perf_counter()
+        self.stall_monitor.begin("추천")
         self.show_loading(True)
         self.hide_results()
 
-        try:
-            self.recommendation_thread = RecommendationThread(self, user_input, is_keyword, index)
-            self.recommendation_thread.recommendation_finished.connect(self.on_recommendation_finished)
-            self.recommendation_thread.recommendation_error.connect(self.on_recommendation_error)
-            self.recommendation_thread.start()
-            logging.debug("RecommendationThread 시작됨")
-        except Exception as e:
-            logging.error(f"RecommendationThread 시작 오류: {str(e)}")
-            self.show_loading(False)
-            QMessageBox.critical(self, "오류", f"추천 스레드 시작 실패: {str(e)}")
+        # 대기 중인 이전 요청은 취소, 계산 중인 요청의 결과는 도착해도 버린다
+        request_id = self.recommendation_worker.submit(user_input, is_keyword, index,
+                                                       semantic=self.semantic_checkbox.isChecked())
+        self.current_request = (request_id, user_input, is_keyword)
+        logging.debug(f"추천 요청 #{request_id} 제출: {self.recommendation_worker.stats()}")
 
     def show_loading(self, show):
         if show:
@@ -576,14 +728,23 @@ class GameRecommendationApp(QMainWindow):
         self.play_button.hide()
         self.play_button.setEnabled(False)
         self.game_info_widget.hide()
-        self.webview.setUrl(QUrl("about:blank"))
-        self.ref_webview.setUrl(QUrl("about:blank"))
+        self.clear_webview()
+        self.clear_webview(reference=True)
         self.ref_game_info_widget.hide()
 
-    def on_recommendation_finished(self, recommendations):
+    def on_recommendation_finished(self, request_id, recommendations):
+        if self.current_request is None or self.current_request[0] != request_id:
+            logging.debug(f"추천 요청 #{request_id} 결과 무시 (이전 요청)")
+            return
+        _, input_text, is_keyword = self.current_request
+        self.current_request = None
         self.show_loading(False)
-        input_text = self.recommendation_thread.input_text
-        is_keyword = self.recommendation_thread.is_keyword
+        logging.debug(f"추천 응답 시간: {(time.perf_counter() - self.recommendation_started_at) * 1000:.0f}ms, "
+                      f"작업 스레드: {self.recommendation_worker.stats()}, "
+                      f"결과 캐시: {self.engine.query_cache.stats()}")
+        if not self.first_recommendation_logged:
+            self.first_recommendation_logged = True
+            logging.info(f"⏱️ 첫 추천 결과(time-to-first-recommendation): {elapsed_since_start_ms():.0f}ms")
         if recommendations:
             # 기준 게임 이름 또는 키워드 표시
             label_text = f"🎯 추천된 게임 (기준: {input_text})" if not is_keyword else f"🎯 추천된 게임 (키워드: {input_text})"
@@ -594,23 +755,28 @@ class GameRecommendationApp(QMainWindow):
             for game in recommendations[:5]:
                 self.result_list.addItem(game)
             logging.debug(f"추천 완료: 기준={input_text}, 키워드 여부={is_keyword}, 추천={recommendations[:5]}")
+            self.prefetch_trailers(recommendations[:5])
 
             # 기준 게임 정보 업데이트
             if not is_keyword:
                 self.load_reference_game_info(input_text)
                 self.ref_game_info_widget.show()
             else:
-                self.ref_webview.setUrl(QUrl("about:blank"))
+                self.clear_webview(reference=True)
                 self.ref_game_info_widget.hide()
         else:
             QMessageBox.information(self, "알림", "추천할 게임을 찾지 못했습니다.")
-            self.ref_webview.setUrl(QUrl("about:blank"))
+            self.clear_webview(reference=True)
             self.ref_game_info_widget.hide()
             logging.debug(f"추천 결과 없음: 기준={input_text}, 키워드 여부={is_keyword}")
-        QApplication.processEvents()
+        self.stall_monitor.end("추천")
 
-    def on_recommendation_error(self, error_msg):
+    def on_recommendation_error(self, request_id, error_msg):
+        if self.current_request is None or self.current_request[0] != request_id:
+            return
+        self.current_request = None
         self.show_loading(False)
+        self.stall_monitor.end("추천")
         QMessageBox.critical(self, "오류", f"추천 중 오류: {error_msg}")
         logging.error(f"추천 오류: {error_msg}")
 
@@ -623,6 +789,7 @@ class GameRecommendationApp(QMainWindow):
     def on_game_selected(self, item):
         selected_game = item.text()
         self.current_selected_game = selected_game
+        self.stall_monitor.begin("게임 선택")  # 클릭 ~ 영상 URL 설정
         self.load_game_image(selected_game)
         self.update_game_info(selected_game)
         self.play_button.show()
@@ -636,111 +803,65 @@ class GameRecommendationApp(QMainWindow):
         logging.debug(f"게임 정보 업데이트: 이름={game_name}, 설명={description[:50]}...")
 
     def load_reference_game_info(self, game_name):
-        try:
-            # 게임 정보 업데이트
-            description = self.game_descriptions.get(game_name, "설명 없음")
-            self.ref_game_info_widget.set_info(game_name, description)
-            logging.debug(f"기준 게임 정보 업데이트: {game_name}, 설명={description[:50]}...")
-
-            # 유튜브 영상 로드
-            chrome_options = Options()
-            chrome_options.add_argument("--headless")
-            chrome_options.add_argument("--disable-gpu")
-            chrome_options.add_argument("--no-sandbox")
-            chrome_options.binary_location = r"C:\Program Files\Google\Chrome\Application\chrome.exe"
-            driver = webdriver.Chrome(options=chrome_options)
-            logging.debug("Selenium 드라이버 초기화 완료 (기준 게임)")
-
-            search_query = quote_plus(f"{game_name} trailershort")
-            search_url = f"https://www.youtube.com/results?search_query={search_query}"
-            driver.get(search_url)
-            logging.debug(f"유튜브 검색 페이지 로드 (기준): {search_url}")
-
-            wait = WebDriverWait(driver, 10)
-            thumbnails = wait.until(
-                EC.presence_of_all_elements_located((By.XPATH, '//*[@id="thumbnail"]/yt-image/img')))
-            if len(thumbnails) >= 3:
-                third_thumbnail = thumbnails[2]
-                video_link = third_thumbnail.find_element(By.XPATH, "./ancestor::a[@id='thumbnail']").get_attribute(
-                    "href")
-                logging.debug(f"추출된 영상 URL (기준): {video_link}")
-
-                parsed_url = urlparse(video_link)
-                if "shorts" in parsed_url.path:
-                    video_id = parsed_url.path.split("/shorts/")[1]
-                elif "watch" in parsed_url.path:
-                    video_id = parse_qs(parsed_url.query).get("v", [None])[0]
-                else:
-                    raise ValueError("알 수 없는 URL 형식")
-
-                if not video_id:
-                    raise ValueError("video_id 추출 실패")
+        # 게임 정보 업데이트
+        description = self.game_descriptions.get(game_name, "설명 없음")
+        self.ref_game_info_widget.set_info(game_name, description)
+        logging.debug(f"기준 게임 정보 업데이트: {game_name}, 설명={description[:50]}...")
 
-                embed_url = f"https://www.youtube.com/embed/{video_id}?autoplay=1"
-                logging.debug(f"기준 게임 영상 임베드 URL: {embed_url}")
-                self.ref_webview.setUrl(QUrl(embed_url))
-            else:
-                logging.warning(f"기준 게임의 3번째 쇼츠 영상을 찾을 수 없습니다: {game_name}")
-                self.ref_webview.setUrl(QUrl(search_url))
-        except Exception as e:
-            logging.error(f"기준 게임 영상 로드 오류: {str(e)}")
-            self.ref_webview.setUrl(QUrl(search_url))
-        finally:
-            if 'driver' in locals():
-                driver.quit()
-                logging.debug("Selenium 드라이버 종료 (기준 게임)")
+        # 유튜브 영상 로드 (백그라운드 조회, 결과는 show_trailer)
+        self.request_trailer(game_name, reference=True)
 
     def load_game_image(self, game_name):
-        try:
-            chrome_options = Options()
-            chrome_options.add_argument("--headless")
-            chrome_options.add_argument("--disable-gpu")
-            chrome_options.add_argument("--no-sandbox")
-            chrome_options.binary_location = r"C:\Program Files\Google\Chrome\Application\chrome.exe"
-            driver = webdriver.Chrome(options=chrome_options)
-            logging.debug("Selenium 드라이버 초기화 완료")
-
-            search_query = quote_plus(f"{game_name} trailershort")
-            search_url = f"https://www.youtube.com/results?search_query={search_query}"
-            driver.get(search_url)
-            logging.debug(f"유튜브 검색 페이지 로드: {search_url}")
-
-            wait = WebDriverWait(driver, 10)
-            thumbnails = wait.until(
-                EC.presence_of_all_elements_located((By.XPATH, '//*[@id="thumbnail"]/yt-image/img')))
-            if len(thumbnails) >= 3:
-                third_thumbnail = thumbnails[2]
-                video_link = third_thumbnail.find_element(By.XPATH, "./ancestor::a[@id='thumbnail']").get_attribute(
-                    "href")
-                logging.debug(f"추출된 영상 URL: {video_link}")
-
-                parsed_url = urlparse(video_link)
-                if "shorts" in parsed_url.path:
-                    video_id = parsed_url.path.split("/shorts/")[1]
-                elif "watch" in parsed_url.path:
-                    video_id = parse_qs(parsed_url.query).get("v", [None])[0]
-                else:
-                    raise ValueError("알 수 없는 URL 형식")
-
-                if not video_id:
-                    raise ValueError("video_id 추출 실패")
-
-                embed_url = f"https://www.youtube.com/embed/{video_id}?autoplay=1"
-                logging.debug(f"3번째 쇼츠 영상 임베드 URL: {embed_url}")
-                self.webview.setUrl(QUrl(embed_url))
-            else:
-                logging.warning(f"3번째 쇼츠 영상을 찾을 수 없음: {game_name}")
-                self.webview.setUrl(QUrl(search_url))
+        self.request_trailer(game_name)
+
+    def get_trailer_service(self):
+        """작업 스레드에서 호출 (requests / sqlite 준비도 GUI 스레드 밖에서)"""
+        with self.trailer_service_lock:
+            if self.trailer_service is None:
+                from trailer_lookup import create_trailer_service
+                self.trailer_service = create_trailer_service()
+            return self.trailer_service
+
+    def lookup_trailer(self, game_name, cancel=None):
+        return self.get_trailer_service().lookup(game_name, cancel=cancel)
+
+    def request_trailer(self, game_name, reference=False):
+        """영상 id 조회를 스레드 풀에 맡기고, 끝나면 해당 뷰에 표시
+
+        같은 뷰의 이전 조회는 취소된다 (다른 게임을 클릭하면 이전 결과는 버림).
+        """
+        self.tasks.submit(self.lookup_trailer, game_name, group=('trailer', reference), priority=1,
+                          on_result=lambda video_id: self.show_trailer(game_name, video_id, reference),
+                          on_error=lambda error_msg: self.show_trailer(game_name, None, reference))
+
+    def prefetch_trailers(self, game_names):
+        """추천 결과가 나오면 클릭 전에 미리 조회해서 캐시에 넣어둔다 (이전 추천의 미리 조회는 취소)"""
+        self.tasks.cancel_group('prefetch')
+        for game_name in game_names:
+            self.tasks.submit(self.lookup_trailer, game_name, group='prefetch', supersede=False)
+        logging.debug(f"트레일러 미리 조회: {game_names}")
+
+    def show_trailer(self, game_name, video_id, reference=False):
+        from trailer_lookup import embed_url, search_url
+
+        view = self.get_webview(reference=reference)
+        if video_id:
+            logging.debug(f"영상 임베드 URL (기준={reference}): {embed_url(video_id)}")
+            view.setUrl(QUrl(embed_url(video_id)))
+        else:
+            logging.warning(f"쇼츠 영상을 찾을 수 없음 (기준={reference}): {game_name}")
+            view.setUrl(QUrl(search_url(game_name)))
+        if not reference:
+            self.stall_monitor.end("게임 선택")
+            if not video_id:
                 QMessageBox.warning(self, "알림", f"'{game_name}'의 쇼츠 영상을 찾을 수 없습니다.")
-        except Exception as e:
-            logging.error(f"영상 로드 오류: {str(e)}")
-            search_url = f"https://www.youtube.com/results?search_query={quote_plus(game_name + ' trailershort')}"
-            self.webview.setUrl(QUrl(search_url))
-            QMessageBox.critical(self, "오류", f"유튜브 영상을 불러올 수 없습니다: {str(e)}")
-        finally:
-            if 'driver' in locals():
-                driver.quit()
-                logging.debug("Selenium 드라이버 종료")
+
+    def closeEvent(self, event):
+        self.recommendation_worker.stop()
+        self.tasks.shutdown()
+        if self.trailer_service is not None:
+            self.trailer_service.close()
+        super().closeEvent(event)
 
     def on_ref_webview_load_finished(self, success):
         if success:
@@ -774,125 +895,39 @@ class GameRecommendationApp(QMainWindow):
             logging.error(f"플레이 버튼 오류: {str(e)}")
             QMessageBox.critical(self, "오류", f"Steam 페이지를 열 수 없습니다: {str(e)}")
 
-    def get_sentence_vector(self, tokens, model):
-        """Word2Vec 토큰 리스트로 문장 벡터 생성"""
-        valid_tokens = [token for token in tokens if token in model.wv]
-        if not valid_tokens:
-            logging.debug("유효한 Word2Vec 토큰이 없음, 0 벡터 반환")
-            return np.zeros(model.vector_size)
-        return np.mean([model.wv[token] for token in valid_tokens], axis=0)
-
     def game_title_recommendation(self, title=None, index=None):
         logging.debug(f"game_title_recommendation 시작: 제목={title}, 인덱스={index}")
-        if not self.models_loaded or self.tfidf_matrix is None or self.tfidf_matrix.shape[0] == 0 or \
-                self.tfidf_vectorizer is None or self.word2vec_model is None:
-            logging.warning("필수 모델이 로드되지 않았습니다.")
-            return []
-
         try:
-            # 게임 인덱스 결정
-            if index is not None:
-                if not (0 <= index < len(self.game_data)):
-                    logging.warning(f"유효하지 않은 인덱스: {index}")
-                    return []
-                game_idx = index
-                game_title = self.game_data.iloc[game_idx]['Title']
-            else:
-                if title is None or title not in self.game_data['Title'].values:
-                    logging.warning(f"제목 '{title}'이 데이터에 없습니다.")
-                    return []
-                game_idx = self.game_data[self.game_data['Title'] == title].index[0]
-                game_title = title
-            logging.debug(f"선택된 게임: {game_title}, 인덱스: {game_idx}")
-
-            # TF-IDF 기반 코사인 유사도
-            tfidf_ref = self.tfidf_matrix[game_idx]
-            if tfidf_ref.nnz == 0:
-                logging.warning(f"TF-IDF 벡터가 비어 있습니다: {game_title}")
-                return []
-            tfidf_cosine_sim = cosine_similarity(tfidf_ref, self.tfidf_matrix).flatten()  # 1D 배열 보장
-            logging.debug(f"TF-IDF 코사인 유사도 형상: {tfidf_cosine_sim.shape}, 처음 5개 값: {tfidf_cosine_sim[:5]}")
-
-            # Word2Vec 기반 코사인 유사도
-            tokens = [desc.split() for desc in self.game_data['Description'].fillna('no description')]
-            ref_vector = self.get_sentence_vector(tokens[game_idx], self.word2vec_model)
-            if np.all(ref_vector == 0):
-                logging.warning(f"Word2Vec 참조 벡터가 0입니다: {game_title}")
-                return []
-            all_vectors = np.array([self.get_sentence_vector(tok, self.word2vec_model) for tok in tokens])
-            w2v_cosine_sim = cosine_similarity([ref_vector], all_vectors).flatten()  # 1D 배열 보장
-            logging.debug(f"Word2Vec 코사인 유사도 형상: {w2v_cosine_sim.shape}, 처음 5개 값: {w2v_cosine_sim[:5]}")
-
-            # 유효한 인덱스 필터링
-            valid_indices = [
-                i for i, (tok, tfidf) in enumerate(zip(tokens, self.tfidf_matrix))
-                if any(t in self.word2vec_model.wv for t in tok) and tfidf.nnz > 0
-            ]
-            if not valid_indices:
-                logging.warning("유효한 벡터가 없습니다.")
-                return []
-            logging.debug(f"유효 인덱스 수: {len(valid_indices)}")
-
-            # 슬라이싱
-            tfidf_cosine_sim = tfidf_cosine_sim[valid_indices]
-            w2v_cosine_sim = w2v_cosine_sim[valid_indices]
-            valid_df = self.game_data.iloc[valid_indices]
-            logging.debug(f"슬라이싱 후 TF-IDF 형상: {tfidf_cosine_sim.shape}, Word2Vec 형상: {w2v_cosine_sim.shape}")
-
-            # TF-IDF와 Word2Vec 결합
-            combined_sim = 0.5 * tfidf_cosine_sim + 0.5 * w2v_cosine_sim
-            logging.debug(f"결합된 유사도 형상: {combined_sim.shape}, 처음 5개 값: {combined_sim[:5]}")
-
-            # 자기 자신 제외 및 상위 100개 추천
-            sim_scores = []
-            for i, score in enumerate(combined_sim):
-                orig_idx = valid_indices[i]
-                if orig_idx != game_idx:
-                    sim_scores.append((i, float(score)))  # 스칼라로 변환
+            # 상위 10개 후보
+            sim_scores = self.engine.rank_similar(title=title, index=index, limit=10)
             if not sim_scores:
                 logging.warning("유효한 유사도 점수가 없습니다.")
                 return []
-
-            # 상위 100개 선택 (또는 가능한 최대 개수)
-            sim_scores = sorted(sim_scores, key=lambda x: x[1], reverse=True)[:10]
             if len(sim_scores) < 5:
                 logging.warning(f"상위 추천이 5개 미만입니다: {len(sim_scores)}개")
-                game_indices = [valid_indices[score[0]] for score in sim_scores]
+                game_indices = [idx for idx, _ in sim_scores]
             else:
-                # 상위 100개 중 무작위 5개 선택
-                random_selection = random.sample(sim_scores, 5)
-                game_indices = [valid_indices[score[0]] for score in random_selection]
+                # 상위 10개 중 무작위 5개 선택
+                game_indices = [idx for idx, _ in random.sample(sim_scores, 5)]
 
-            recommendations = valid_df.iloc[[valid_df.index.get_loc(idx) for idx in game_indices]]['Title'].tolist()
+            recommendations = [self.engine.titles[idx] for idx in game_indices]
             logging.debug(f"game_title_recommendation 완료: 추천={recommendations}")
             return recommendations
         except Exception as e:
             logging.error(f"게임 추천 오류: {str(e)}")
             return []
 
-    def keyword_recommendation(self, keyword):
-        logging.debug(f"keyword_recommendation 시작: 키워드={keyword}")
-        if not self.models_loaded or not self.tfidf_matrix or not self.tfidf_vectorizer:
-            logging.warning("TF-IDF 모델이 로드되지 않았습니다.")
-            return []
+    def keyword_recommendation(self, keyword, semantic=False):
+        logging.debug(f"keyword_recommendation 시작: 키워드={keyword}, 의미 확장={semantic}")
         try:
-            keyword_vector = self.tfidf_vectorizer.transform([keyword])
-            logging.debug(f"키워드 벡터 형상: {keyword_vector.shape}")
-            cosine_similarities = linear_kernel(keyword_vector, self.tfidf_matrix).flatten()
-            logging.debug(f"코사인 유사도 형상: {cosine_similarities.shape}")
-
-            # 상위 100개 인덱스 선택
-            similar_indices = np.argsort(cosine_similarities)[-10:][::-1]
-            # 유사도가 0보다 큰 항목 필터링
-            valid_indices = [i for i in similar_indices if cosine_similarities[i] > 0 and i < len(self.game_titles)]
-
+            valid_indices = [idx for idx, _ in self.engine.rank_keyword(keyword, limit=10, semantic=semantic)]
             if len(valid_indices) < 5:
                 logging.warning(f"유효한 추천이 5개 미만입니다: {len(valid_indices)}개")
-                recommendations = [self.game_titles[i] for i in valid_indices]
+                recommendations = [self.engine.titles[i] for i in valid_indices]
             else:
-                # 상위 100개 중 무작위 5개 선택
+                # 상위 10개 중 무작위 5개 선택
                 random_indices = random.sample(valid_indices, 5)
-                recommendations = [self.game_titles[i] for i in random_indices]
+                recommendations = [self.engine.titles[i] for i in random_indices]
 
             logging.debug(f"keyword_recommendation 완료: 추천={recommendations}")
             return recommendations
@@ -902,6 +937,8 @@ class GameRecommendationApp(QMainWindow):
 
 
 if __name__ == "__main__":
+    # QtWebEngine 을 QApplication 생성 후에 import 하려면 미리 설정해야 한다
+    QCoreApplication.setAttribute(Qt.AA_ShareOpenGLContexts)
     app = QApplication(sys.argv)
     app.setStyle('Fusion')
     main_window = GameRecommendationApp()
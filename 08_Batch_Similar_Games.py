@@ -0,0 +1,39 @@
+# 카탈로그 전체(또는 지정한 게임들)의 "비슷한 게임" 목록을 한 번에 생성해서 CSV 로 저장
+# 사용 예) python 08_Batch_Similar_Games.py --top-n 10 --chunk-size 512
+#         python 08_Batch_Similar_Games.py --indices 0 2 15
+import argparse
+import time
+
+from artifacts import BUNDLE_DIR, open_bundle
+from batch_recommend import iter_similar_games, load_blend_weights, write_similar_games_csv
+from feature_store import FEATURE_STORE_DIR, open_feature_store
+
+parser = argparse.ArgumentParser(description="유사 게임 목록 배치 생성")
+parser.add_argument('--indices', type=int, nargs='+', default=None, help="기준 게임 인덱스 (옵션 생략 시 전체)")
+parser.add_argument('--top-n', type=int, default=5)
+parser.add_argument('--chunk-size', type=int, default=256, help="한 번에 계산할 기준 게임 수 (메모리 ~ chunk x 전체 게임 수)")
+blend_weights = load_blend_weights()  # ./model/blend_weights.json (없으면 기본값)
+parser.add_argument('--tfidf-weight', type=float, default=blend_weights[0])
+parser.add_argument('--w2v-weight', type=float, default=blend_weights[1])
+parser.add_argument('--output', default='./Crawling_data/steam_game_similar.csv')
+args = parser.parse_args()
+
+# 인덱스 = 특징 저장소 행 번호 (제목 / TF-IDF 행 / 문서 벡터가 맞춰져 있음)
+store = open_feature_store(FEATURE_STORE_DIR)
+titles = store.titles.tolist()
+tfidf_matrix = store.tfidf_matrix(open_bundle(BUNDLE_DIR))
+doc_vectors = store.embedding  # 추천 엔진과 같은 embedding (결합 가중치도 이 벡터로 튜닝됨)
+
+total = len(args.indices) if args.indices is not None else len(titles)
+print(f"🚀 유사 게임 배치 생성 시작: 기준 게임 {total}개, 상위 {args.top_n}개, chunk {args.chunk_size}")
+
+start = time.perf_counter()
+chunks = iter_similar_games(tfidf_matrix, doc_vectors, ref_indices=args.indices, top_n=args.top_n,
+                            chunk_size=args.chunk_size, weights=(args.tfidf_weight, args.w2v_weight),
+                            valid_rows=store.valid_rows)
+written = write_similar_games_csv(args.output, titles, chunks,
+                                  on_chunk=lambda n: print(f"  {n}/{total} 완료 ({time.perf_counter() - start:.1f}s)"))
+elapsed = time.perf_counter() - start
+
+print(f"✅ 완료: {written}개 게임, {elapsed:.1f}s ({written / max(elapsed, 1e-9):.0f} games/s)")
+print(f"📁 결과 파일: {args.output}")
@@ -0,0 +1,113 @@
+# 게임 임베딩(정규화된 문서 벡터) 최근접 이웃 인덱스
+# - BruteForceIndex : 전체 행렬과 내적 (정확한 결과, 기준값)
+# - IVFIndex        : 순수 NumPy IVF (구면 k-means 로 군집 → 질의와 가까운 nprobe 개 군집만 탐색)
+# 두 인덱스 모두 search(query, k, exclude) 인터페이스가 같아서 바꿔 끼울 수 있다.
+# nprobe 를 키우면 recall 이 올라가고 지연시간도 늘어난다 (nprobe = n_lists 이면 brute-force 와 동일).
+import numpy as np
+
+ANN_INDEX_FILE = './model/w2v_ivf_index.npz'
+
+
+def _top_k(ids, scores, k):
+    """(ids, scores) 중 점수 상위 k 개를 내림차순으로 반환"""
+    if len(scores) > k:
+        part = np.argpartition(-scores, k - 1)[:k]
+        ids, scores = ids[part], scores[part]
+    order = np.argsort(-scores, kind='stable')
+    return ids[order], scores[order]
+
+
+class BruteForceIndex:
+    """전체 탐색 (정확한 코사인 상위 k)"""
+
+    def __init__(self, vectors):
+        self.vectors = vectors
+
+    def search(self, query, k=10, exclude=None):
+        scores = np.asarray(self.vectors @ query, dtype=np.float32)
+        if exclude is not None:
+            scores[exclude] = -np.inf
+        return _top_k(np.arange(len(scores)), scores, k)
+
+
+class IVFIndex:
+    """Inverted File 근사 최근접 이웃 인덱스 (코사인, 정규화된 벡터 기준)"""
+
+    def __init__(self, vectors, centroids, list_offsets, list_ids, nprobe=8):
+        self.vectors = vectors
+        self.centroids = centroids
+        self.list_offsets = list_offsets  # 군집 c 의 문서 = list_ids[list_offsets[c]:list_offsets[c + 1]]
+        self.list_ids = list_ids
+        self.nprobe = nprobe
+
+    @property
+    def n_lists(self):
+        return len(self.centroids)
+
+    @classmethod
+    def build(cls, vectors, n_lists=None, n_iter=20, sample_size=None, seed=42, nprobe=8):
+        """구면 k-means 로 군집 중심을 학습하고 전체 문서를 군집에 배정"""
+        vectors = np.asarray(vectors, dtype=np.float32)
+        n_docs = len(vectors)
+        if n_lists is None:
+            n_lists = max(1, int(4 * np.sqrt(n_docs)))
+        n_lists = min(n_lists, n_docs)
+        rng = np.random.default_rng(seed)
+
+        # 학습은 샘플로 (군집당 최대 64개 정도면 충분)
+        sample_size = min(n_docs, sample_size or 64 * n_lists)
+        sample = vectors[rng.choice(n_docs, sample_size, replace=False)]
+        centroids = sample[rng.choice(sample_size, n_lists, replace=False)].copy()
+
+        for _ in range(n_iter):
+            assign = np.argmax(sample @ centroids.T, axis=1)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, assign, sample)
+            counts = np.bincount(assign, minlength=n_lists)
+            empty = counts == 0
+            if empty.any():  # 빈 군집은 임의의 샘플로 다시 시작
+                sums[empty] = sample[rng.choice(sample_size, int(empty.sum()), replace=False)]
+            norms = np.linalg.norm(sums, axis=1, keepdims=True)
+            norms[norms == 0] = 1.0
+            centroids = sums / norms
+
+        # 전체 문서 배정 (메모리 제한을 위해 나눠서)
+        assign = np.empty(n_docs, dtype=np.int32)
+        for start in range(0, n_docs, 8192):
+            assign[start:start + 8192] = np.argmax(vectors[start:start + 8192] @ centroids.T, axis=1)
+        list_ids = np.argsort(assign, kind='stable').astype(np.int32)
+        list_offsets = np.zeros(n_lists + 1, dtype=np.int64)
+        np.cumsum(np.bincount(assign, minlength=n_lists), out=list_offsets[1:])
+        return cls(vectors, centroids.astype(np.float32), list_offsets, list_ids, nprobe=nprobe)
+
+    def search(self, query, k=10, exclude=None, nprobe=None):
+        nprobe = min(nprobe or self.nprobe, self.n_lists)
+        centroid_scores = self.centroids @ query
+        probe = np.argpartition(-centroid_scores, nprobe - 1)[:nprobe]
+        ids = np.concatenate([self.list_ids[self.list_offsets[c]:self.list_offsets[c + 1]] for c in probe])
+        if exclude is not None:
+            ids = ids[ids != exclude]
+        if len(ids) == 0:
+            return ids, np.zeros(0, dtype=np.float32)
+        scores = np.asarray(self.vectors[ids] @ query, dtype=np.float32)
+        return _top_k(ids, scores, k)
+
+    def save(self, path=ANN_INDEX_FILE):
+        np.savez(path, centroids=self.centroids, list_offsets=self.list_offsets, list_ids=self.list_ids,
+                 nprobe=np.int32(self.nprobe))
+
+    @classmethod
+    def load(cls, vectors, path=ANN_INDEX_FILE, nprobe=None):
+        data = np.load(path)
+        if int(data['list_offsets'][-1]) != len(vectors):
+            raise ValueError(f"인덱스 문서 수 불일치: 인덱스 {int(data['list_offsets'][-1])} / 벡터 {len(vectors)}")
+        return cls(vectors, data['centroids'], data['list_offsets'], data['list_ids'],
+                   nprobe=nprobe or int(data['nprobe']))
+
+
+def recall_at_k(exact_ids, approx_ids, k=10):
+    """정확한 상위 k 중 근사 결과에 포함된 비율"""
+    exact = set(int(i) for i in exact_ids[:k])
+    if not exact:
+        return 1.0
+    return len(exact.intersection(int(i) for i in approx_ids[:k])) / len(exact)
@@ -0,0 +1,309 @@
+# 메모리 매핑 가능한 모델 번들 (tfidf_steam.mtx + tfidf_steam.pickle 대체)
+# ./model/bundle/
+#   CURRENT                                현재 빌드 폴더 이름 (새 빌드를 다 쓴 뒤 이 파일만 원자적으로 교체)
+#   builds/<build_id>/                     빌드별 폴더 (아래 파일들, 이전 빌드는 다음 빌드 때 지울 수 있으면 지움)
+#   manifest.json                          형식 버전, 빌드 id, 파일별 sha256 / dtype / shape
+#   tfidf_indptr / indices / data .npy     TF-IDF CSR 행렬
+#   vocab_offsets / vocab_blob .npy        어휘 문자열 테이블 (UTF-8 바이트 순 정렬)
+#   vocab_columns.npy                      정렬된 어휘 i 번째 단어의 TF-IDF 열 번호
+#   idf.npy                                열 번호별 idf
+#   titles_offsets / titles_blob .npy      행 번호별 게임 제목 문자열 테이블
+#   postings_*.npy                         키워드 검색용 역색인 (inverted_index.InvertedIndex)
+# 모든 배열은 np.load(mmap_mode='r') 로 열기 때문에 시작이 빠르고, 여러 서버 프로세스가 OS 페이지 캐시를 공유한다.
+import hashlib
+import json
+import os
+import re
+import shutil
+import time
+
+import numpy as np
+import scipy.sparse as sp
+
+from inverted_index import InvertedIndex
+
+BUNDLE_DIR = './model/bundle'
+BUNDLE_FORMAT = 'game-recommendation-bundle'
+BUNDLE_VERSION = 1
+CURRENT_FILE = 'CURRENT'  # write_array_dir 로 쓴 폴더의 현재 빌드 포인터
+BUILDS_DIR = 'builds'
+KEEP_BUILDS = 2  # 현재 + 직전 빌드 (포인터를 막 읽은 프로세스가 직전 빌드를 열 수 있도록)
+TOKEN_PATTERN = r"(?u)\b\w\w+\b"  # TfidfVectorizer 기본값
+
+
+class BundleError(Exception):
+    """번들이 없거나 형식 / 체크섬이 맞지 않음"""
+
+
+# ================================
+# 문자열 테이블 (offsets + UTF-8 blob)
+# ================================
+def encode_strings(strings):
+    encoded = [s.encode('utf-8') for s in strings]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(b) for b in encoded], out=offsets[1:])
+    blob = np.frombuffer(b''.join(encoded), dtype=np.uint8)
+    return offsets, blob
+
+
+class StringTable:
+    """mmap 된 offsets / blob 위의 읽기 전용 문자열 배열"""
+
+    def __init__(self, offsets, blob):
+        self.offsets = offsets
+        self.blob = blob
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def raw(self, i):
+        return self.blob[self.offsets[i]:self.offsets[i + 1]].tobytes()
+
+    def __getitem__(self, i):
+        return self.raw(i).decode('utf-8')
+
+    def tolist(self):
+        data = self.blob.tobytes()
+        offsets = self.offsets.tolist()
+        return [data[offsets[i]:offsets[i + 1]].decode('utf-8') for i in range(len(self))]
+
+    def find_sorted(self, value):
+        """정렬된 테이블에서 이진 탐색 → 위치 (없으면 -1)"""
+        key = value.encode('utf-8')
+        lo, hi = 0, len(self)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.raw(mid) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo if lo < len(self) and self.raw(lo) == key else -1
+
+
+# ================================
+# 질의 변환 (pickle 없이 TfidfVectorizer(sublinear_tf=True).transform 과 같은 결과)
+# ================================
+class BundleVectorizer:
+    def __init__(self, vocab, vocab_columns, idf):
+        self.vocab = vocab
+        self.vocab_columns = vocab_columns
+        self.idf_ = idf
+        self.token_pattern = re.compile(TOKEN_PATTERN)
+        self._vocabulary = None
+
+    @property
+    def vocabulary_(self):
+        """단어 → 열 번호 dict (doc_vectors 처럼 전체 어휘를 훑는 배치 작업용, 처음 접근할 때 생성)"""
+        if self._vocabulary is None:
+            self._vocabulary = dict(zip(self.vocab.tolist(), self.vocab_columns.tolist()))
+        return self._vocabulary
+
+    def build_analyzer(self):
+        return lambda text: self.token_pattern.findall(text.lower())
+
+    def lookup(self, term):
+        """단어 → TF-IDF 열 번호 (없으면 -1)"""
+        pos = self.vocab.find_sorted(term)
+        return int(self.vocab_columns[pos]) if pos >= 0 else -1
+
+    def transform(self, texts):
+        data, indices, indptr = [], [], [0]
+        for text in texts:
+            counts = {}
+            for token in self.token_pattern.findall(text.lower()):
+                column = self.lookup(token)
+                if column >= 0:
+                    counts[column] = counts.get(column, 0) + 1
+            columns = np.array(sorted(counts), dtype=np.int64)
+            weights = np.array([1 + np.log(counts[c]) for c in columns], dtype=np.float64)
+            if len(columns):
+                weights *= self.idf_[columns]
+                weights /= np.linalg.norm(weights)
+            indices.extend(columns.tolist())
+            data.extend(weights.tolist())
+            indptr.append(len(indices))
+        return sp.csr_matrix((np.array(data, dtype=np.float64), np.array(indices, dtype=np.int32),
+                              np.array(indptr, dtype=np.int32)), shape=(len(texts), len(self.idf_)))
+
+
+# ================================
+# 번들 읽기 / 쓰기
+# ================================
+def _sha256(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as file:
+        for chunk in iter(lambda: file.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _index_dtype(max_value):
+    return np.int32 if max_value < np.iinfo(np.int32).max else np.int64
+
+
+def write_bundle(tfidf_matrix, vocabulary, idf, titles, path=BUNDLE_DIR):
+    """vocabulary: 단어 → 열 번호 dict (TfidfVectorizer.vocabulary_)
+
+    새 빌드 폴더에 다 쓴 뒤 포인터를 바꾸므로, 쓰는 도중에 읽는 프로세스는 이전 번들을 본다.
+    """
+    matrix = sp.csr_matrix(tfidf_matrix)
+    matrix.sort_indices()
+    if matrix.shape[0] != len(titles):
+        raise BundleError(f"행 수 불일치: TF-IDF {matrix.shape[0]} / 제목 {len(titles)}")
+    index_dtype = _index_dtype(max(matrix.nnz, matrix.shape[1]))
+    terms = sorted(vocabulary, key=lambda term: term.encode('utf-8'))
+    vocab_offsets, vocab_blob = encode_strings(terms)
+    title_offsets, title_blob = encode_strings([str(t) for t in titles])
+    postings = InvertedIndex.from_matrix(matrix)
+
+    arrays = {
+        'tfidf_indptr': matrix.indptr.astype(index_dtype),
+        'tfidf_indices': matrix.indices.astype(index_dtype),
+        'tfidf_data': matrix.data.astype(np.float32),
+        'vocab_offsets': vocab_offsets,
+        'vocab_blob': vocab_blob,
+        'vocab_columns': np.array([vocabulary[t] for t in terms], dtype=np.int32),
+        'idf': np.asarray(idf, dtype=np.float64),
+        'titles_offsets': title_offsets,
+        'titles_blob': title_blob,
+        'postings_indptr': postings.indptr,
+        'postings_doc_ids': postings.doc_ids,
+        'postings_weights': postings.weights,
+        'postings_max_scores': postings.max_scores,
+    }
+
+    return write_array_dir(arrays, path, BUNDLE_FORMAT, BUNDLE_VERSION, {
+        'tfidf_shape': list(matrix.shape),
+        'sublinear_tf': True,
+        'token_pattern': TOKEN_PATTERN,
+    })
+
+
+def write_array_dir(arrays, path, format_name, version, extra=None):
+    """.npy 배열들 + manifest.json 을 path/builds/<build_id>/ 에 쓰고 path/CURRENT 를 교체 → manifest
+
+    build_id 는 파일 체크섬으로 정해지므로 내용이 같으면 같은 값이 나온다 (같은 빌드 폴더를 다시 씀).
+    열려 있는(mmap) 이전 빌드 폴더는 옮기거나 지우지 않으므로 Windows 에서도 읽는 프로세스와 충돌하지 않는다.
+    """
+    builds_path = os.path.join(path, BUILDS_DIR)
+    os.makedirs(builds_path, exist_ok=True)
+    tmp_path = os.path.join(builds_path, f".tmp-{os.getpid()}")
+    shutil.rmtree(tmp_path, ignore_errors=True)
+    os.makedirs(tmp_path)
+    files = {}
+    for name, array in arrays.items():
+        file_path = os.path.join(tmp_path, f"{name}.npy")
+        np.save(file_path, np.ascontiguousarray(array))
+        files[name] = {'sha256': _sha256(file_path), 'dtype': str(array.dtype), 'shape': list(array.shape)}
+    build_id = hashlib.sha256(json.dumps(files, sort_keys=True).encode('utf-8')).hexdigest()[:16]
+    manifest = {
+        'format': format_name,
+        'version': version,
+        'build_id': build_id,
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        **(extra or {}),
+        'files': files,
+    }
+    with open(os.path.join(tmp_path, 'manifest.json'), 'w', encoding='utf-8') as file:
+        json.dump(manifest, file, ensure_ascii=False, indent=2)
+
+    build_path = os.path.join(builds_path, build_id)
+    if os.path.exists(os.path.join(build_path, 'manifest.json')):
+        shutil.rmtree(tmp_path, ignore_errors=True)  # 같은 내용의 빌드가 이미 있음 (열려 있을 수 있어 그대로 둔다)
+    else:
+        shutil.rmtree(build_path, ignore_errors=True)  # 중간에 멈춘 이전 시도
+        os.replace(tmp_path, build_path)
+    _switch_current(path, build_id)
+    _remove_old_builds(path, build_id)
+    return manifest
+
+
+def _switch_current(path, build_id):
+    """CURRENT 포인터를 임시 파일에 쓴 뒤 os.replace 로 교체 (읽는 쪽은 이전 값 또는 새 값만 본다)"""
+    tmp_file = os.path.join(path, f"{CURRENT_FILE}.tmp-{os.getpid()}")
+    with open(tmp_file, 'w', encoding='utf-8') as file:
+        file.write(f"{BUILDS_DIR}/{build_id}\n")
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(tmp_file, os.path.join(path, CURRENT_FILE))
+
+
+def _remove_old_builds(path, current_id, keep=KEEP_BUILDS):
+    """현재 빌드 + 최근 빌드 keep 개만 남기고 지움 (아직 열려 있어 지울 수 없는 폴더는 다음 빌드 때 다시 시도)"""
+    builds_path = os.path.join(path, BUILDS_DIR)
+    builds = [name for name in os.listdir(builds_path)
+              if name != current_id and not name.startswith('.') and os.path.isdir(os.path.join(builds_path, name))]
+    builds.sort(key=lambda name: os.path.getmtime(os.path.join(builds_path, name)), reverse=True)
+    for name in builds[keep - 1:]:
+        try:
+            shutil.rmtree(os.path.join(builds_path, name))
+        except OSError:
+            pass
+    # 포인터 이전 형식 (path 바로 아래 manifest.json + .npy) 도 같은 방식으로 정리
+    for name in os.listdir(path):
+        if name == 'manifest.json' or name.endswith('.npy'):
+            try:
+                os.remove(os.path.join(path, name))
+            except OSError:
+                pass
+
+
+def resolve_array_dir(path):
+    """CURRENT 포인터가 가리키는 빌드 폴더 (포인터가 없으면 이전 형식으로 보고 path 그대로)"""
+    try:
+        with open(os.path.join(path, CURRENT_FILE), encoding='utf-8') as file:
+            return os.path.join(path, file.read().strip())
+    except FileNotFoundError:
+        return path
+
+
+def open_array_dir(path, format_name, version, verify=False, error=BundleError):
+    """write_array_dir 로 쓴 폴더 열기 → (manifest, {이름: mmap 배열})
+
+    verify=True 면 모든 파일 sha256 확인 (파일 전체를 읽으므로 느림)
+    """
+    build_path = resolve_array_dir(path)
+    manifest_path = os.path.join(build_path, 'manifest.json')
+    if not os.path.exists(manifest_path):
+        raise error(f"폴더가 없습니다: {build_path}")
+    with open(manifest_path, encoding='utf-8') as file:
+        manifest = json.load(file)
+    if manifest.get('format') != format_name or manifest.get('version') != version:
+        raise error(f"지원하지 않는 형식: {manifest.get('format')} v{manifest.get('version')}")
+
+    arrays = {}
+    for name, info in manifest['files'].items():
+        file_path = os.path.join(build_path, f"{name}.npy")
+        if verify and _sha256(file_path) != info['sha256']:
+            raise error(f"체크섬 불일치: {name}")
+        array = np.load(file_path, mmap_mode='r')
+        if list(array.shape) != info['shape'] or str(array.dtype) != info['dtype']:
+            raise error(f"배열 형식 불일치: {name} {array.dtype}{array.shape}")
+        arrays[name] = array
+    return manifest, arrays
+
+
+class ArtifactBundle:
+    def __init__(self, path, manifest, arrays):
+        self.path = path
+        self.manifest = manifest
+        self.arrays = arrays
+        self.build_id = manifest['build_id']
+        n_docs, n_terms = manifest['tfidf_shape']
+        self.tfidf_matrix = sp.csr_matrix(
+            (arrays['tfidf_data'], arrays['tfidf_indices'], arrays['tfidf_indptr']), shape=(n_docs, n_terms))
+        self.vectorizer = BundleVectorizer(StringTable(arrays['vocab_offsets'], arrays['vocab_blob']),
+                                           arrays['vocab_columns'], arrays['idf'])
+        self.titles = StringTable(arrays['titles_offsets'], arrays['titles_blob'])
+        self.inverted_index = InvertedIndex(arrays['postings_indptr'], arrays['postings_doc_ids'],
+                                            arrays['postings_weights'], arrays['postings_max_scores'], n_docs)
+
+    @property
+    def n_docs(self):
+        return self.manifest['tfidf_shape'][0]
+
+
+def open_bundle(path=BUNDLE_DIR, verify=False):
+    """번들 열기 (verify=True 면 모든 파일 sha256 확인 - 파일 전체를 읽으므로 느림)"""
+    manifest, arrays = open_array_dir(path, BUNDLE_FORMAT, BUNDLE_VERSION, verify=verify)
+    return ArtifactBundle(path, manifest, arrays)
@@ -0,0 +1,225 @@
+# 게임 제목 자동 완성 (오타 허용, 한글 자모 단위 매칭)
+# 제목과 입력을 모두 자모 분해 키로 바꿔서 비교한다.
+#   "배틀그라운드" → "ㅂㅐㅌㅡㄹㄱㅡㄹㅏㅇㅜㄴㄷㅡ"
+#   입력 중인 "배틀글" → "ㅂㅐㅌㅡㄹㄱㅡㄹ" (앞부분 일치)
+# 후보 생성
+#   1) 앞부분: 제목 / 단어 시작 위치부터의 키를 정렬한 배열에서 이진 탐색 (배열로 펼친 prefix trie)
+#      일치 범위 전체를 순위 매긴다. 범위가 PREFIX_SCAN_LIMIT 보다 큰 짧은 앞부분 (한두 자모) 은
+#      인덱스를 만들 때 상위 PREFIX_TOP_K 개를 미리 계산해 둔다.
+#   2) 부분 일치: TitleIndex 3-gram postings
+#   3) 오타: 3-gram 겹침 상위 후보만 편집 거리(대각선 띠 안에서만 계산)로 다시 확인
+# 점수: 정확 > 앞부분 > 단어 시작 > 중간 일치 > 오타 (편집 거리 작은 순)
+import heapq
+import time
+from bisect import bisect_left
+
+from title_index import NGRAM_SIZE, TitleIndex, TitleMatch, normalize_title
+
+PREFIX_SCAN_LIMIT = 2000  # 일치 후보가 이보다 많은 앞부분은 상위 후보를 미리 계산
+PREFIX_TOP_K = 50         # 미리 계산하는 후보 수 (server.py MAX_SUGGESTIONS 와 같음)
+KEY_MAX = chr(0x10FFFF)   # key + KEY_MAX = key 로 시작하는 모든 키보다 뒤
+TYPO_CANDIDATES = 20
+TYPO_MIN_SIMILARITY = 0.1
+TYPO_MAX_GRAMS = 6        # 오타 후보는 드문 3-gram 몇 개로만 찾는다
+
+# ================================
+# 한글 자모 분해
+# ================================
+CHOSEONG = 'ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ'
+JUNGSEONG = 'ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ'
+JONGSEONG = ['', 'ㄱ', 'ㄲ', 'ㄳ', 'ㄴ', 'ㄵ', 'ㄶ', 'ㄷ', 'ㄹ', 'ㄺ', 'ㄻ', 'ㄼ', 'ㄽ', 'ㄾ', 'ㄿ', 'ㅀ',
+             'ㅁ', 'ㅂ', 'ㅄ', 'ㅅ', 'ㅆ', 'ㅇ', 'ㅈ', 'ㅊ', 'ㅋ', 'ㅌ', 'ㅍ', 'ㅎ']
+# 겹받침 / 겹모음은 입력 순서대로 풀어 쓴다 (입력 중 "닭" 이 "달ㄱ" 과 같게)
+COMPOUND_JAMO = {'ㄳ': 'ㄱㅅ', 'ㄵ': 'ㄴㅈ', 'ㄶ': 'ㄴㅎ', 'ㄺ': 'ㄹㄱ', 'ㄻ': 'ㄹㅁ', 'ㄼ': 'ㄹㅂ', 'ㄽ': 'ㄹㅅ',
+                 'ㄾ': 'ㄹㅌ', 'ㄿ': 'ㄹㅍ', 'ㅀ': 'ㄹㅎ', 'ㅄ': 'ㅂㅅ', 'ㅘ': 'ㅗㅏ', 'ㅙ': 'ㅗㅐ', 'ㅚ': 'ㅗㅣ',
+                 'ㅝ': 'ㅜㅓ', 'ㅞ': 'ㅜㅔ', 'ㅟ': 'ㅜㅣ', 'ㅢ': 'ㅡㅣ'}
+
+
+def _build_jamo_table():
+    table = {ord(jamo): parts for jamo, parts in COMPOUND_JAMO.items()}
+    for code in range(0xAC00, 0xD7A4):
+        offset = code - 0xAC00
+        cho, jung, jong = offset // 588, (offset % 588) // 28, offset % 28
+        table[code] = ''.join(COMPOUND_JAMO.get(jamo, jamo)
+                              for jamo in (CHOSEONG[cho], JUNGSEONG[jung], JONGSEONG[jong]))
+    return table
+
+
+JAMO_TABLE = _build_jamo_table()
+
+
+def jamo_key(text):
+    """정규화 + 한글 음절을 자모로 분해한 비교용 키 (영문 / 한자 등은 그대로)"""
+    return normalize_title(text).translate(JAMO_TABLE)
+
+
+def prefix_edit_distance(query, text, max_distance):
+    """text 의 앞부분 중 query 와 가장 가까운 것과의 편집 거리 (max_distance 초과면 None)
+
+    |i - j| <= max_distance 인 대각선 띠만 계산한다.
+    """
+    text = text[:len(query) + max_distance]
+    too_far = max_distance + 1
+    previous = [j if j <= max_distance else too_far for j in range(len(text) + 1)]
+    for i, q_char in enumerate(query, 1):
+        current = [too_far] * (len(text) + 1)
+        if i <= max_distance:
+            current[0] = i
+        for j in range(max(1, i - max_distance), min(len(text), i + max_distance) + 1):
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (q_char != text[j - 1]))
+        if min(current) > max_distance:
+            return None
+        previous = current
+    best = min(previous)
+    return best if best <= max_distance else None
+
+
+def max_typos(key_length):
+    """허용 편집 거리 (자모 기준 입력 길이에 비례)"""
+    if key_length <= 4:
+        return 1
+    return 2 if key_length <= 9 else 3
+
+
+class TitleAutocomplete:
+    def __init__(self, titles):
+        """titles: 행 번호 순서의 제목 목록"""
+        self.index = TitleIndex(titles, normalize=jamo_key)
+        self.row_ids = {row: title_id for title_id, row in enumerate(self.index.rows)}
+
+        # 제목 시작 / 단어 시작 위치부터의 키를 정렬 (tier 1 = 제목 시작, 2 = 단어 시작)
+        entries = []
+        for title_id, key in enumerate(self.index.normalized):
+            entries.append((key, title_id, 1))
+            entries.extend((key[pos + 1:], title_id, 2) for pos, char in enumerate(key) if char == ' ')
+        entries.sort()
+        self.prefix_keys = [key for key, _, _ in entries]
+        self.prefix_ids = [title_id for _, title_id, _ in entries]
+        self.prefix_tiers = [tier for _, _, tier in entries]
+        self.prefix_top = self._build_prefix_top()
+
+    def __len__(self):
+        return len(self.index)
+
+    def _match(self, title_id, kind, score):
+        return TitleMatch(self.index.titles[title_id], self.index.rows[title_id], kind, score)
+
+    def _prefix_range(self, key, lo=0, hi=None):
+        """key 로 시작하는 정렬 배열 구간 [start, end)"""
+        hi = len(self.prefix_keys) if hi is None else hi
+        start = bisect_left(self.prefix_keys, key, lo, hi)
+        return start, bisect_left(self.prefix_keys, key + KEY_MAX, start, hi)
+
+    def _rank_range(self, key, start, end, limit):
+        """구간 안의 일치를 (tier, 제목 길이) 순으로 상위 limit 개 [(tier, 제목 id), ...]"""
+        best = {}
+        for pos in range(start, end):
+            title_id = self.prefix_ids[pos]
+            tier = 0 if self.index.normalized[title_id] == key else self.prefix_tiers[pos]
+            best[title_id] = min(tier, best.get(title_id, tier))
+        ranked = heapq.nsmallest(limit, ((tier, len(self.index.normalized[title_id]), title_id)
+                                         for title_id, tier in best.items()))
+        return [(tier, title_id) for tier, _, title_id in ranked]
+
+    def _build_prefix_top(self):
+        """일치 구간이 PREFIX_SCAN_LIMIT 보다 큰 앞부분 → 상위 PREFIX_TOP_K 개
+
+        구간이 큰 앞부분 안에서만 한 글자 더 긴 앞부분을 확인하므로, 큰 구간만 순위 계산한다.
+        """
+        prefix_top = {}
+        pending = [(0, len(self.prefix_keys), 1)]  # (구간, 앞부분 길이)
+        while pending:
+            lo, hi, length = pending.pop()
+            pos = lo
+            while pos < hi:
+                if len(self.prefix_keys[pos]) < length:  # 앞부분 자체인 키 (구간 맨 앞)
+                    pos += 1
+                    continue
+                prefix = self.prefix_keys[pos][:length]
+                start, end = self._prefix_range(prefix, pos, hi)
+                if end - start > PREFIX_SCAN_LIMIT:
+                    prefix_top[prefix] = self._rank_range(prefix, start, end, PREFIX_TOP_K)
+                    pending.append((start, end, length + 1))
+                pos = end
+        return prefix_top
+
+    def _prefix_ids(self, key, limit):
+        """앞부분 / 단어 시작 일치 상위 [(tier, 제목 id), ...] (미리 계산한 앞부분은 최대 PREFIX_TOP_K 개)"""
+        top = self.prefix_top.get(key)
+        if top is not None:
+            return top[:limit]
+        start, end = self._prefix_range(key)  # 미리 계산하지 않았으면 구간이 PREFIX_SCAN_LIMIT 이하
+        return self._rank_range(key, start, end, limit)
+
+    def _typo_ids(self, key, limit, exclude):
+        """오타 허용 후보 [(편집 거리, 제목 id), ...]"""
+        max_distance = max_typos(len(key))
+        scored = []
+        candidates = self.index.fuzzy_ids(key, TYPO_CANDIDATES, exclude, TYPO_MIN_SIMILARITY, max_grams=TYPO_MAX_GRAMS)
+        for title_id, similarity in candidates:
+            text = self.index.normalized[title_id]
+            starts = [0] + [pos + 1 for pos, char in enumerate(text) if char == ' ']
+            distances = [d for d in (prefix_edit_distance(key, text[start:], max_distance) for start in starts)
+                         if d is not None]
+            if distances:
+                scored.append((min(distances), -similarity, len(text), title_id))
+        return [(distance, title_id) for distance, _, _, title_id in heapq.nsmallest(limit, scored)]
+
+    def suggest(self, query, limit=10):
+        """자동 완성 후보 [TitleMatch, ...] (kind: exact / prefix / word / substring / typo)"""
+        key = jamo_key(query)
+        if not key or limit <= 0:
+            return []
+        kinds = ('exact', 'prefix', 'word')
+        matches = [self._match(title_id, kinds[tier], 1.0 / (1 + tier))
+                   for tier, title_id in self._prefix_ids(key, limit)]
+        seen = {match.row for match in matches}
+
+        if len(matches) < limit and len(key) >= NGRAM_SIZE:
+            for match in self.index.search(query, limit=limit, fuzzy=False):
+                if match.row not in seen and len(matches) < limit:
+                    matches.append(match)
+                    seen.add(match.row)
+
+        if len(matches) < limit and len(key) >= NGRAM_SIZE:
+            exclude = {self.row_ids[row] for row in seen}
+            matches += [self._match(title_id, 'typo', 0.2 / (1 + distance))
+                        for distance, title_id in self._typo_ids(key, limit - len(matches), exclude)]
+        return matches
+
+
+if __name__ == "__main__":
+    # 서로 다른 합성 제목 10만 개로 입력 1회당 지연 시간 측정: python autocomplete.py
+    import random
+    import string
+
+    random.seed(0)
+    hangul = [chr(code) for code in range(0xAC00, 0xD7A4, 97)]
+    words = [''.join(random.choice(string.ascii_lowercase) for _ in range(random.randint(3, 9))) for _ in range(3000)]
+    words += [''.join(random.choice(hangul) for _ in range(random.randint(2, 4))) for _ in range(3000)]
+    unique_titles = set()
+    while len(unique_titles) < 100000:
+        unique_titles.add(' '.join(random.choice(words) for _ in range(random.randint(1, 4))))
+    titles = sorted(unique_titles)
+    random.shuffle(titles)
+
+    start = time.perf_counter()
+    engine = TitleAutocomplete(titles)
+    print(f"인덱스 생성: {len(engine)}개 제목, {time.perf_counter() - start:.2f}s")
+
+    queries = []
+    for title in random.sample(titles, 200):
+        cut = random.randint(1, len(title))
+        typed = title[:cut]
+        if len(typed) > 4 and random.random() < 0.5:  # 절반은 한 글자 오타
+            pos = random.randrange(len(typed))
+            typed = typed[:pos] + random.choice(string.ascii_lowercase) + typed[pos + 1:]
+        queries.append(typed)
+    timings = []
+    for query in queries:
+        start = time.perf_counter()
+        engine.suggest(query)
+        timings.append((time.perf_counter() - start) * 1000)
+    timings.sort()
+    print(f"입력 {len(timings)}회: p50 {timings[len(timings) // 2]:.2f}ms, "
+          f"p95 {timings[int(len(timings) * 0.95)]:.2f}ms, max {timings[-1]:.2f}ms")
@@ -0,0 +1,105 @@
+# 여러 기준 게임에 대한 유사 게임 목록을 한 번에 계산 (카탈로그 전체 야간 배치용)
+# 기준 게임을 chunk 단위로 묶어서 TF-IDF(희소) / Word2Vec(밀집) 유사도를 행렬곱으로 구하고
+# argpartition 으로 행마다 상위 N개만 뽑는다. 메모리는 chunk_size x 전체 게임 수 로 제한된다.
+# 결합 가중치는 모든 진입점(06, 07, 08, server.py)이 load_blend_weights() 로 같은 값을 쓴다.
+# benchmark.py suite --save-weights 가 오프라인 평가로 고른 값을 BLEND_WEIGHTS_FILE 에 저장한다.
+import csv
+import json
+import logging
+import os
+
+import numpy as np
+
+DEFAULT_WEIGHTS = (0.7, 0.3)  # (TF-IDF, Word2Vec) - 가중치 파일이 없을 때
+BLEND_WEIGHTS_FILE = './model/blend_weights.json'
+
+
+def load_blend_weights(path=BLEND_WEIGHTS_FILE):
+    """(TF-IDF, Word2Vec) 결합 가중치 (파일이 없거나 읽을 수 없으면 DEFAULT_WEIGHTS)"""
+    if not os.path.exists(path):
+        return DEFAULT_WEIGHTS
+    try:
+        with open(path, encoding='utf-8') as file:
+            data = json.load(file)
+        return float(data['tfidf']), float(data['w2v'])
+    except Exception as e:
+        logging.warning(f"결합 가중치 파일을 읽을 수 없어 기본값 사용: {path}, {str(e)}")
+        return DEFAULT_WEIGHTS
+
+
+def save_blend_weights(weights, path=BLEND_WEIGHTS_FILE, **info):
+    """info: 함께 기록할 평가 결과 (예: ndcg=0.41, build='...')"""
+    with open(path, 'w', encoding='utf-8') as file:
+        json.dump({'tfidf': float(weights[0]), 'w2v': float(weights[1]), **info}, file, ensure_ascii=False, indent=2)
+
+
+def top_n_per_row(scores, top_n):
+    """행마다 점수 상위 top_n 개의 (인덱스, 점수) 를 내림차순으로 반환"""
+    top_n = min(top_n, scores.shape[1])
+    part = np.argpartition(-scores, top_n - 1, axis=1)[:, :top_n]
+    part_scores = np.take_along_axis(scores, part, axis=1)
+    order = np.argsort(-part_scores, axis=1, kind='stable')
+    return np.take_along_axis(part, order, axis=1), np.take_along_axis(part_scores, order, axis=1)
+
+
+def valid_rows_mask(tfidf_matrix, doc_vectors):
+    """추천 후보가 될 수 있는 행 (TF-IDF 행이 비어 있지 않고 문서 벡터가 0 이 아님)"""
+    return (np.diff(tfidf_matrix.indptr) > 0) & np.any(doc_vectors, axis=1)
+
+
+def blended_scores(tfidf_matrix, doc_vectors, ref_indices, weights=DEFAULT_WEIGHTS):
+    """ref_indices 행들과 전체 게임의 결합 유사도 (len(ref_indices) x N)
+
+    tfidf_matrix 행과 doc_vectors 행은 모두 L2 정규화되어 있다고 가정한다 (내적 = 코사인).
+    """
+    tfidf_weight, w2v_weight = weights
+    tfidf_sim = (tfidf_matrix[ref_indices] @ tfidf_matrix.T).toarray()
+    w2v_sim = np.asarray(doc_vectors[ref_indices], dtype=np.float32) @ np.asarray(doc_vectors, dtype=np.float32).T
+    return tfidf_weight * tfidf_sim + w2v_weight * w2v_sim
+
+
+def iter_similar_games(tfidf_matrix, doc_vectors, ref_indices=None, top_n=5, chunk_size=256,
+                       weights=DEFAULT_WEIGHTS, valid_rows=None):
+    """chunk 단위로 (기준 인덱스 배열, 상위 인덱스 행렬, 상위 점수 행렬) 을 생성
+
+    ref_indices 가 None 이면 카탈로그 전체. 자기 자신은 결과에서 제외한다.
+    valid_rows (생략 시 valid_rows_mask) 밖의 게임은 추천하지 않고, 기준 게임이 유효하지 않으면 결과가 없다
+    (추천 엔진과 같음). 제외된 칸은 점수 -inf 로 남으므로 쓸 때 걸러야 한다 (write_similar_games_csv).
+    """
+    n_docs = tfidf_matrix.shape[0]
+    if doc_vectors.shape[0] != n_docs:
+        raise ValueError(f"문서 수 불일치: TF-IDF {n_docs} / 문서 벡터 {doc_vectors.shape[0]}")
+    if ref_indices is None:
+        ref_indices = np.arange(n_docs)
+    ref_indices = np.asarray(ref_indices, dtype=np.int64)
+    if ref_indices.size and (ref_indices.min() < 0 or ref_indices.max() >= n_docs):
+        raise ValueError(f"유효하지 않은 인덱스가 포함되어 있습니다 (0 ~ {n_docs - 1})")
+    valid_rows = (np.asarray(valid_rows, dtype=bool) if valid_rows is not None
+                  else valid_rows_mask(tfidf_matrix, doc_vectors))
+
+    for start in range(0, len(ref_indices), chunk_size):
+        chunk = ref_indices[start:start + chunk_size]
+        scores = blended_scores(tfidf_matrix, doc_vectors, chunk, weights)
+        scores[:, ~valid_rows] = -np.inf
+        scores[~valid_rows[chunk]] = -np.inf            # 유효하지 않은 기준 게임은 결과 없음
+        scores[np.arange(len(chunk)), chunk] = -np.inf  # 자기 자신 제외
+        top_idx, top_scores = top_n_per_row(scores, top_n)
+        yield chunk, top_idx, top_scores
+
+
+def write_similar_games_csv(path, titles, chunks, on_chunk=None):
+    """iter_similar_games 결과를 chunk 마다 바로 CSV 에 기록 (전체 결과를 메모리에 들고 있지 않음, -inf 칸은 생략)"""
+    written = 0
+    with open(path, mode='w', newline='', encoding='utf-8-sig') as file:
+        writer = csv.writer(file)
+        writer.writerow(["RefIndex", "RefTitle", "Rank", "Index", "Title", "Similarity"])
+        for chunk, top_idx, top_scores in chunks:
+            for ref_idx, idx_row, score_row in zip(chunk, top_idx, top_scores):
+                finite = np.isfinite(score_row)  # 내림차순이라 -inf 는 뒤쪽에만 있음
+                for rank, (idx, score) in enumerate(zip(idx_row[finite], score_row[finite]), start=1):
+                    writer.writerow([int(ref_idx), titles[ref_idx], rank, int(idx), titles[idx], f"{score:.6f}"])
+            file.flush()
+            written += len(chunk)
+            if on_chunk is not None:
+                on_chunk(written)
+    return written
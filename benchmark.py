@@ -0,0 +1,385 @@
+# 추천 엔진 벤치마크
+# 사용 예) python benchmark.py ann --nprobe 1 2 4 8 16 32 --queries 500
+#         python benchmark.py loadtest --url http://127.0.0.1:8000 --concurrency 32 --requests 2000
+#         python benchmark.py keyword --keywords 생존 전략 퍼즐 --repeat 20
+#         python benchmark.py suite --output bench.json --baseline bench_prev.json --save-weights
+#         python benchmark.py quantize --candidates 0 100 300 --queries 500
+#   suite: ./model/ 산출물로 엔진별(brute-force / sparse-index / ann) 지연시간 / 처리량 / 메모리 +
+#          태그 겹침 기준 오프라인 순위 지표, 결합 가중치 튜닝 (evaluation.py) → JSON 보고서
+#          --quantization float16 int8 이면 양자화 엔진(재정렬 없음 / 재정렬)도 같이 측정
+#   quantize: 문서 벡터 float16 / int8 메모리와 float32 대비 recall@k (재정렬 후보 수별)
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+from urllib.parse import quote, urlsplit
+
+import numpy as np
+import pandas as pd
+
+import evaluation
+from ann_index import ANN_INDEX_FILE, BruteForceIndex, IVFIndex, recall_at_k
+from artifacts import BUNDLE_DIR, open_bundle
+from batch_recommend import BLEND_WEIGHTS_FILE, load_blend_weights, save_blend_weights, valid_rows_mask
+from inverted_index import InvertedIndex
+from doc_vectors import load_doc_vectors
+from feature_store import FEATURE_STORE_DIR, open_feature_store
+from quantization import QUANTIZATIONS, RERANK_CANDIDATES, QuantizedVectors, exact_scores
+from query_cache import QueryCache
+from recommender import DATA_FILE, RecommendationEngine
+
+
+def percentile_ms(latencies, q):
+    return float(np.percentile(latencies, q) * 1000) if latencies else 0.0
+
+
+def sample_queries(doc_vectors, n_queries, seed=0, valid_rows=None):
+    """0 벡터가 아닌 문서 (valid_rows 를 주면 그 안) 중에서 질의로 쓸 인덱스를 뽑는다"""
+    candidates = np.flatnonzero(np.any(doc_vectors, axis=1) if valid_rows is None else valid_rows)
+    rng = np.random.default_rng(seed)
+    return rng.choice(candidates, min(n_queries, len(candidates)), replace=False)
+
+
+def run_index(index, doc_vectors, queries, k, **search_kwargs):
+    """질의별 (결과 인덱스, 지연시간) 측정"""
+    results, latencies = [], []
+    for q in queries:
+        query = np.asarray(doc_vectors[q], dtype=np.float32)
+        start = time.perf_counter()
+        ids, _ = index.search(query, k=k, exclude=q, **search_kwargs)
+        latencies.append(time.perf_counter() - start)
+        results.append(ids)
+    return results, latencies
+
+
+def bench_ann(args):
+    if args.vectors:
+        doc_vectors = np.asarray(load_doc_vectors(args.vectors, mmap=False), dtype=np.float32)
+    else:
+        doc_vectors = np.asarray(open_feature_store(args.store).embedding, dtype=np.float32)
+    if args.rebuild:
+        start = time.perf_counter()
+        ivf = IVFIndex.build(doc_vectors, n_lists=args.n_lists)
+        print(f"IVF 인덱스 생성: {ivf.n_lists}개 군집, {time.perf_counter() - start:.2f}s")
+    else:
+        ivf = IVFIndex.load(doc_vectors, args.index)
+    queries = sample_queries(doc_vectors, args.queries)
+
+    exact_results, exact_lat = run_index(BruteForceIndex(doc_vectors), doc_vectors, queries, args.k)
+    exact_mean = np.mean(exact_lat)
+    print(f"\n문서 수: {len(doc_vectors)}, 질의 수: {len(queries)}, k={args.k}, 군집 수: {ivf.n_lists}")
+    print(f"{'engine':<14}{'recall@' + str(args.k):>10}{'avg(ms)':>10}{'p99(ms)':>10}{'speedup':>10}")
+    print(f"{'brute-force':<14}{1.0:>10.4f}{exact_mean * 1000:>10.3f}{percentile_ms(exact_lat, 99):>10.3f}{1.0:>10.2f}")
+
+    for nprobe in args.nprobe:
+        approx_results, lat = run_index(ivf, doc_vectors, queries, args.k, nprobe=nprobe)
+        recall = np.mean([recall_at_k(e, a, args.k) for e, a in zip(exact_results, approx_results)])
+        print(f"{'ivf/' + str(nprobe):<14}{recall:>10.4f}{np.mean(lat) * 1000:>10.3f}"
+              f"{percentile_ms(lat, 99):>10.3f}{exact_mean / np.mean(lat):>10.2f}")
+
+
+def quantized_vectors(store, doc_vectors, kind):
+    """저장소의 양자화 embedding (이전 저장소면 float32 행렬에서 생성)"""
+    quantized = store.quantized_embedding(kind) if store is not None else None
+    return quantized if quantized is not None else QuantizedVectors.from_vectors(doc_vectors, kind)
+
+
+def bench_quantize(args):
+    """Word2Vec 문서 벡터만으로 상위 k: float32 brute-force 대비 양자화 + 재정렬 recall@k / 지연시간 / 메모리"""
+    store = None
+    if args.vectors:
+        doc_vectors = np.asarray(load_doc_vectors(args.vectors, mmap=False), dtype=np.float32)
+    else:
+        store = open_feature_store(args.store)
+        doc_vectors = np.asarray(store.embedding, dtype=np.float32)
+    queries = sample_queries(doc_vectors, args.queries)
+    exact_results, exact_lat = run_index(BruteForceIndex(doc_vectors), doc_vectors, queries, args.k)
+    float32_mb = doc_vectors.nbytes / 2 ** 20
+
+    print(f"\n문서 수: {len(doc_vectors)}, 차원: {doc_vectors.shape[1]}, 질의 수: {len(queries)}, k={args.k}")
+    print(f"{'vectors':<10}{'rerank':>8}{'MB':>9}{'ratio':>7}{'recall@' + str(args.k):>10}{'avg(ms)':>9}{'p99(ms)':>9}")
+    print(f"{'float32':<10}{'-':>8}{float32_mb:>9.2f}{1.0:>7.2f}{1.0:>10.4f}"
+          f"{np.mean(exact_lat) * 1000:>9.3f}{percentile_ms(exact_lat, 99):>9.3f}")
+    for kind in args.quantization:
+        quantized = quantized_vectors(store, doc_vectors, kind)
+        for candidates in args.candidates:
+            recalls, latencies = [], []
+            for q, exact_ids in zip(queries, exact_results):
+                query = doc_vectors[q]
+                start = time.perf_counter()
+                scores = quantized.scores(query)
+                scores[q] = -np.inf
+                ids = np.argpartition(-scores, max(candidates, args.k) - 1)[:max(candidates, args.k)]
+                if candidates:
+                    ids = ids[np.argsort(-exact_scores(doc_vectors, query, ids), kind='stable')[:args.k]]
+                else:
+                    ids = ids[np.argsort(-scores[ids], kind='stable')[:args.k]]
+                latencies.append(time.perf_counter() - start)
+                recalls.append(recall_at_k(exact_ids, ids, args.k))
+            mb = quantized.nbytes / 2 ** 20
+            print(f"{kind:<10}{candidates or '-':>8}{mb:>9.2f}{mb / float32_mb:>7.2f}{np.mean(recalls):>10.4f}"
+                  f"{np.mean(latencies) * 1000:>9.3f}{percentile_ms(latencies, 99):>9.3f}")
+
+
+def bench_keyword(args):
+    """키워드 검색 지연시간: 일반(lexical) vs Word2Vec 검색어 확장(semantic) - 결과 캐시 없이 측정"""
+    engine = RecommendationEngine().load()
+    engine.query_cache = QueryCache(max_entries=0)  # 매번 점수 계산
+    if not engine.can_expand_queries():
+        print("이웃 단어 표가 없습니다 (05_1_Steam_doc_vectors.py 를 다시 실행하세요).")
+        return
+    for keyword in args.keywords:
+        engine.query_analyzer.analyze(keyword)  # 분석 캐시를 채워서 점수 계산 시간만 비교
+
+    print(f"{'mode':<10}{'avg(ms)':>10}{'p50(ms)':>10}{'p95(ms)':>10}{'overlap':>10}")
+    latencies = {}
+    results = {}
+    for mode in ('lexical', 'semantic'):
+        latencies[mode] = []
+        for _ in range(args.repeat):
+            for keyword in args.keywords:
+                start = time.perf_counter()
+                results[mode, keyword] = engine.rank_keyword(keyword, limit=args.top_n, semantic=mode == 'semantic')
+                latencies[mode].append(time.perf_counter() - start)
+    matched = [k for k in args.keywords if results['lexical', k]]  # 일반 검색 결과가 있는 키워드만 비교
+    for mode in ('lexical', 'semantic'):
+        # 확장 결과가 일반 결과와 얼마나 겹치는지 (1.0 이면 확장해도 결과가 같음)
+        overlap = np.mean([len({i for i, _ in results[mode, k]} & {i for i, _ in results['lexical', k]}) /
+                           len(results['lexical', k]) for k in matched]) if matched else 0.0
+        print(f"{mode:<10}{np.mean(latencies[mode]) * 1000:>10.3f}{percentile_ms(latencies[mode], 50):>10.3f}"
+              f"{percentile_ms(latencies[mode], 95):>10.3f}{overlap:>10.2f}")
+    extra = (np.mean(latencies['semantic']) - np.mean(latencies['lexical'])) * 1000
+    print(f"검색어 확장 추가 시간: 평균 {extra:.3f}ms")
+
+
+def bench_suite(args):
+    """엔진별 성능 + 오프라인 순위 지표 → JSON (--baseline 과 비교해서 회귀가 있으면 종료 코드 1)"""
+    if args.save_weights and not args.tune:
+        sys.exit("❌ --save-weights 는 --tune 과 함께 써야 합니다.")
+    if args.tune and not os.path.exists(args.tags):
+        sys.exit(f"❌ 태그 파일이 없어 가중치를 튜닝할 수 없습니다: {args.tags} (01_Crawling.py 가 작성)")
+    store = open_feature_store(args.store)
+    bundle = open_bundle(args.bundle)
+    tfidf_matrix = store.tfidf_matrix(bundle)
+    doc_vectors = np.asarray(store.embedding, dtype=np.float32)
+    inverted_index = (bundle.inverted_index if tfidf_matrix is bundle.tfidf_matrix
+                      else InvertedIndex.from_matrix(tfidf_matrix))
+    ivf = IVFIndex.load(doc_vectors, args.index) if os.path.exists(args.index) else IVFIndex.build(doc_vectors)
+    titles = store.titles.tolist()
+    # 추천 엔진과 같은 후보 범위 (빈 TF-IDF 행 / 0 문서 벡터 제외)
+    valid_rows = (np.asarray(store.valid_rows, dtype=bool) if store.valid_rows is not None
+                  else valid_rows_mask(tfidf_matrix, doc_vectors))
+    weights = tuple(args.weights) if args.weights else load_blend_weights()
+    quantized_list = [quantized_vectors(store, doc_vectors, kind) for kind in args.quantization]
+
+    def make_engines(weights):
+        return [evaluation.BruteForceEngine(tfidf_matrix, doc_vectors, weights, valid_rows),
+                evaluation.SparseIndexEngine(tfidf_matrix, doc_vectors, weights, inverted_index, args.candidates,
+                                             valid_rows=valid_rows),
+                evaluation.AnnEngine(tfidf_matrix, doc_vectors, weights, ivf, args.candidates, args.nprobe,
+                                     valid_rows=valid_rows),
+                *(evaluation.QuantizedEngine(tfidf_matrix, doc_vectors, weights, quantized, candidates, valid_rows)
+                  for quantized in quantized_list for candidates in (0, args.candidates))]
+
+    report = {
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'build': {'bundle': bundle.build_id, 'feature_store': store.build_id, 'n_games': len(titles)},
+        'config': {'k': args.k, 'queries': args.queries, 'candidates': args.candidates,
+                   'quantization': list(args.quantization), 'valid_rows': int(valid_rows.sum()),
+                   'nprobe': args.nprobe or ivf.nprobe, 'seed': args.seed, 'tags': args.tags,
+                   'min_jaccard': args.min_jaccard},
+        'engines': {},
+    }
+    # 관련성 (태그 파일이 있을 때만): tune 질의로 가중치를 고르고 test 질의로 평가
+    relevance = {}
+    if os.path.exists(args.tags):
+        tags = [row_tags if valid_rows[row] else set()  # 추천될 수 없는 게임은 질의 / 관련 게임에서 제외
+                for row, row_tags in enumerate(evaluation.load_tags(args.tags, store.game_ids.tolist(), titles))]
+        tagged = [row for row, row_tags in enumerate(tags) if row_tags]
+        relevance = evaluation.relevant_sets(tags, tagged, args.min_jaccard)
+        tune_rows, test_rows = evaluation.split_queries(relevance, seed=args.seed)
+        test_rows = test_rows[:args.queries]
+        print(f"관련성: 태그 있는 게임 {len(tagged)}개, 질의 tune {len(tune_rows)} / test {len(test_rows)}")
+        if args.tune:
+            grid = np.linspace(0, 1, args.grid_steps + 1)
+            best, scores = evaluation.tune_weights(
+                lambda w: evaluation.BruteForceEngine(tfidf_matrix, doc_vectors, w, valid_rows),
+                tune_rows[:args.queries], relevance, args.k, grid)
+            report['tuning'] = {'grid': [{'weights': list(w), **m} for w, m in scores], 'best_weights': list(best)}
+            print(f"가중치 튜닝 (tune nDCG@{args.k}): 최적 {best}, 현재 {weights}")
+            weights = best
+        queries = test_rows
+    else:
+        print(f"⚠️ 태그 파일이 없어 순위 지표는 생략합니다: {args.tags} (01_Crawling.py 가 작성)")
+        queries = sample_queries(doc_vectors, args.queries, seed=args.seed, valid_rows=valid_rows)
+    if len(queries) == 0:
+        sys.exit("❌ 평가할 질의가 없습니다 (태그가 겹치는 게임이 없거나 유효한 행이 없음).")
+    report['config']['weights'] = list(weights)
+
+    reference = None
+    print(f"\n{'engine':<16}{'p50(ms)':>9}{'p95(ms)':>9}{'p99(ms)':>9}{'qps':>9}{'index MB':>10}"
+          f"{'agree@k':>9}{'nDCG@k':>9}")
+    for engine in make_engines(weights):
+        results, performance = evaluation.measure_engine(engine, queries, args.k)
+        entry = {'performance': performance}
+        if reference is None:
+            reference = results  # 첫 엔진(brute-force)이 정확한 기준
+        entry['agreement_recall@k'] = evaluation.agreement(reference, results, args.k)
+        if relevance:
+            entry['quality'] = evaluation.ranking_metrics(results, relevance, args.k)
+        report['engines'][engine.name] = entry
+        print(f"{engine.name:<16}{performance['p50_ms']:>9.3f}{performance['p95_ms']:>9.3f}"
+              f"{performance['p99_ms']:>9.3f}{performance['throughput_qps']:>9.1f}{performance['index_mb']:>10.2f}"
+              f"{entry['agreement_recall@k']:>9.3f}{entry.get('quality', {}).get(f'ndcg@{args.k}', float('nan')):>9.4f}")
+
+    with open(args.output, 'w', encoding='utf-8') as file:
+        json.dump(report, file, ensure_ascii=False, indent=2)
+    print(f"\n📁 보고서: {args.output}")
+
+    if args.save_weights and 'tuning' in report:
+        quality = report['engines']['brute-force'].get('quality', {})
+        save_blend_weights(weights, args.weights_file, ndcg=quality.get(f'ndcg@{args.k}'),
+                           feature_store=store.build_id, created=report['created'])
+        print(f"✅ 결합 가중치 저장: {args.weights_file} {weights}")
+
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as file:
+            regressions = evaluation.compare_reports(json.load(file), report, args.latency_tolerance,
+                                                     args.quality_tolerance)
+        for message in regressions:
+            print(f"❌ 회귀: {message}")
+        if regressions:
+            sys.exit(1)
+        print("✅ 기준 보고서 대비 회귀 없음")
+
+
+async def _http_get(reader, writer, host, path):
+    """keep-alive 연결로 GET 1회 → 상태 코드"""
+    writer.write(f"GET {path} HTTP/1.1\r\nHost: {host}\r\nConnection: keep-alive\r\n\r\n".encode('latin-1'))
+    await writer.drain()
+    status = int((await reader.readline()).split()[1])
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b''):
+            break
+        name, _, value = line.decode('latin-1').partition(':')
+        if name.strip().lower() == 'content-length':
+            length = int(value)
+    await reader.readexactly(length)
+    return status
+
+
+async def _load_client(url, paths, n_requests, latencies, statuses):
+    parts = urlsplit(url)
+    reader, writer = await asyncio.open_connection(parts.hostname, parts.port or 80)
+    try:
+        for _ in range(n_requests):
+            path = random.choice(paths)
+            start = time.perf_counter()
+            statuses.append(await _http_get(reader, writer, parts.netloc, path))
+            latencies.append(time.perf_counter() - start)
+    finally:
+        writer.close()
+
+
+def bench_loadtest(args):
+    """server.py 에 동시 요청을 보내서 지연시간 백분위 / 처리량 측정"""
+    titles = pd.read_csv(args.data_file)['Title'].astype(str).tolist()
+    random.seed(0)
+    sample = random.sample(titles, min(args.sample, len(titles)))
+    paths = [f"/similar?title={quote(t)}&top_n={args.top_n}" for t in sample]
+    if args.keywords:
+        paths += [f"/search?q={quote(k)}&top_n={args.top_n}" for k in args.keywords]
+
+    latencies, statuses = [], []
+    per_client = max(1, args.requests // args.concurrency)
+
+    async def run():
+        await asyncio.gather(*[_load_client(args.url, paths, per_client, latencies, statuses)
+                               for _ in range(args.concurrency)])
+
+    start = time.perf_counter()
+    asyncio.run(run())
+    elapsed = time.perf_counter() - start
+
+    errors = sum(1 for s in statuses if s >= 500)
+    print(f"요청 수: {len(latencies)}, 동시 연결: {args.concurrency}, 소요: {elapsed:.2f}s")
+    print(f"처리량: {len(latencies) / elapsed:.1f} req/s, 5xx: {errors}")
+    for q in (50, 90, 95, 99):
+        print(f"p{q}: {percentile_ms(latencies, q):.2f} ms")
+    print(f"max: {max(latencies) * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="추천 엔진 벤치마크")
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    ann = sub.add_parser('ann', help="ANN 인덱스 recall@k / 지연시간 (brute-force 기준)")
+    ann.add_argument('--store', default=FEATURE_STORE_DIR)
+    ann.add_argument('--vectors', default=None, help="문서 벡터 .npy (생략 시 특징 저장소의 embedding)")
+    ann.add_argument('--index', default=ANN_INDEX_FILE)
+    ann.add_argument('--rebuild', action='store_true', help="저장된 인덱스 대신 새로 생성해서 측정")
+    ann.add_argument('--n-lists', type=int, default=None)
+    ann.add_argument('--nprobe', type=int, nargs='+', default=[1, 2, 4, 8, 16, 32])
+    ann.add_argument('--queries', type=int, default=500)
+    ann.add_argument('--k', type=int, default=10)
+    ann.set_defaults(func=bench_ann)
+
+    load = sub.add_parser('loadtest', help="server.py 동시 부하 테스트 (p50/p99 지연시간, 처리량)")
+    load.add_argument('--url', default='http://127.0.0.1:8000')
+    load.add_argument('--data-file', default=DATA_FILE)
+    load.add_argument('--concurrency', type=int, default=32)
+    load.add_argument('--requests', type=int, default=2000)
+    load.add_argument('--sample', type=int, default=200, help="질의로 사용할 게임 제목 수")
+    load.add_argument('--keywords', nargs='*', default=['생존', '전략', '퍼즐', 'shooter'])
+    load.add_argument('--top-n', type=int, default=10)
+    load.set_defaults(func=bench_loadtest)
+
+    quantize = sub.add_parser('quantize', help="양자화 문서 벡터 메모리 / float32 대비 recall@k (재정렬 후보 수별)")
+    quantize.add_argument('--store', default=FEATURE_STORE_DIR)
+    quantize.add_argument('--vectors', default=None, help="문서 벡터 .npy (생략 시 특징 저장소의 embedding)")
+    quantize.add_argument('--quantization', nargs='+', choices=QUANTIZATIONS, default=list(QUANTIZATIONS))
+    quantize.add_argument('--candidates', type=int, nargs='+', default=[0, 50, 100, RERANK_CANDIDATES],
+                          help="float32 재정렬 후보 수 (0: 재정렬 없음)")
+    quantize.add_argument('--queries', type=int, default=500)
+    quantize.add_argument('--k', type=int, default=10)
+    quantize.set_defaults(func=bench_quantize)
+
+    keyword = sub.add_parser('keyword', help="키워드 검색 지연시간 (일반 vs Word2Vec 검색어 확장)")
+    keyword.add_argument('--keywords', nargs='+', default=['생존', '전략', '퍼즐', '공포', 'shooter', 'racing'])
+    keyword.add_argument('--repeat', type=int, default=20)
+    keyword.add_argument('--top-n', type=int, default=10)
+    keyword.set_defaults(func=bench_keyword)
+
+    suite = sub.add_parser('suite', help="엔진별 지연시간 / 처리량 / 메모리 + 오프라인 순위 지표 (JSON 보고서)")
+    suite.add_argument('--store', default=FEATURE_STORE_DIR)
+    suite.add_argument('--bundle', default=BUNDLE_DIR)
+    suite.add_argument('--index', default=ANN_INDEX_FILE)
+    suite.add_argument('--tags', default=evaluation.TAGS_FILE, help="관련성 기준 태그 CSV (Title, Tags)")
+    suite.add_argument('--min-jaccard', type=float, default=evaluation.MIN_JACCARD)
+    suite.add_argument('--weights', type=float, nargs=2, default=None, metavar=('TFIDF', 'W2V'),
+                       help="결합 가중치 (생략 시 blend_weights.json 또는 기본값)")
+    suite.add_argument('--tune', action='store_true', help="tune 질의로 결합 가중치를 골라서 평가")
+    suite.add_argument('--grid-steps', type=int, default=10, help="TF-IDF 가중치 0 ~ 1 을 나눌 개수")
+    suite.add_argument('--save-weights', action='store_true', help="튜닝한 가중치를 blend_weights.json 에 저장 (--tune 필요)")
+    suite.add_argument('--weights-file', default=BLEND_WEIGHTS_FILE)
+    suite.add_argument('--queries', type=int, default=500)
+    suite.add_argument('--k', type=int, default=10)
+    suite.add_argument('--candidates', type=int, default=RERANK_CANDIDATES,
+                       help="sparse-index / ann / 양자화 엔진 재정렬 후보 수")
+    suite.add_argument('--nprobe', type=int, default=None)
+    suite.add_argument('--quantization', nargs='*', choices=QUANTIZATIONS, default=[],
+                       help="같이 측정할 양자화 문서 벡터 형식 (재정렬 없음 / 재정렬 엔진 둘 다)")
+    suite.add_argument('--seed', type=int, default=0)
+    suite.add_argument('--output', default='benchmark_report.json')
+    suite.add_argument('--baseline', default=None, help="비교할 이전 보고서 JSON")
+    suite.add_argument('--latency-tolerance', type=float, default=0.2, help="p95 지연시간 허용 증가 비율")
+    suite.add_argument('--quality-tolerance', type=float, default=0.02, help="순위 지표 허용 하락 폭")
+    suite.set_defaults(func=bench_suite)
+
+    args = parser.parse_args()
+    args.func(args)
@@ -0,0 +1,38 @@
+# 문서(게임 설명) 임베딩 행렬 생성 / 로드
+# Word2Vec 문장 벡터를 빌드 단계에서 한 번만 계산하고 L2 정규화한다 (특징 저장소의 embedding, feature_store.py).
+# 조회 시에는 행렬-벡터 곱 한 번으로 코사인 유사도를 구한다.
+import numpy as np
+
+
+def get_sentence_vector(tokens, model):
+    """Word2Vec 토큰 리스트로 문장 벡터 생성 (단순 평균)"""
+    valid_tokens = [token for token in tokens if token in model.wv]
+    if not valid_tokens:
+        return np.zeros(model.vector_size, dtype=np.float32)
+    return np.mean([model.wv[token] for token in valid_tokens], axis=0)
+
+
+def normalize_rows(matrix):
+    """행 단위 L2 정규화 (0 벡터는 그대로 0)"""
+    matrix = np.asarray(matrix, dtype=np.float32)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+def build_doc_vectors(token_lists, model):
+    """문서별 문장 벡터 행렬 생성 (단순 평균, 행 L2 정규화)"""
+    matrix = np.zeros((len(token_lists), model.vector_size), dtype=np.float32)
+    for i, tokens in enumerate(token_lists):
+        matrix[i] = get_sentence_vector(tokens, model)
+    return normalize_rows(matrix)
+
+
+def load_doc_vectors(path, mmap=True):
+    """.npy 로 저장된 문서 임베딩 행렬 로드 (benchmark.py --vectors, 기본: 읽기 전용 mmap)"""
+    return np.load(path, mmap_mode='r' if mmap else None)
+
+
+def cosine_scores(doc_vectors, ref_idx):
+    """정규화된 행렬 기준 ref_idx 문서와 전체 문서의 코사인 유사도 (행렬-벡터 곱 1회)"""
+    return doc_vectors @ doc_vectors[ref_idx]
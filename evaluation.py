@@ -0,0 +1,325 @@
+# "비슷한 게임" 추천의 오프라인 품질 평가 + 엔진별 성능 측정 (benchmark.py suite 에서 사용)
+# 관련성 기준: 태그 / 장르가 겹치는 게임
+#   태그 파일 (기본 ./Crawling_data/steam_game_tags.csv, 01_Crawling.py 가 상점 페이지 사용자 태그로 작성):
+#   Title, Tags, AppID 열, 태그는 ';' 또는 ',' 로 구분. AppID 로 특징 저장소 행과 맞추고, 없으면 정규화한 제목으로 맞춘다.
+#   두 게임의 태그 Jaccard 유사도가 min_jaccard 이상이면 관련 있음
+# 모든 엔진은 추천 엔진(recommender.py)과 같이 valid_rows (빈 TF-IDF 행 / 0 문서 벡터 제외) 안에서만 추천한다.
+# 질의 게임은 튜닝(tune) / 평가(test) 로 나누고, 결합 가중치는 tune 에서만 고른다 (test 는 held-out).
+# 엔진 (모두 search(ref_idx, k) → 게임 행 번호 배열)
+#   brute-force  : 전체 게임과 결합 유사도 (정확한 기준값)
+#   sparse-index : TF-IDF 역색인(MaxScore)으로 후보 → 결합 유사도로 재정렬
+#   ann          : 문서 벡터 IVF 로 후보 → 결합 유사도로 재정렬
+#   float16 / int8 (-rerank) : 양자화 문서 벡터로 전체 근사 결합 유사도 (-rerank: 상위 후보만 float32 로 재계산)
+import math
+import re
+import time
+import tracemalloc
+from collections import defaultdict
+
+import numpy as np
+import pandas as pd
+
+from ann_index import recall_at_k
+from batch_recommend import blended_scores, top_n_per_row, valid_rows_mask
+from feature_store import game_id_for
+from quantization import RERANK_CANDIDATES, exact_scores
+
+TAGS_FILE = './Crawling_data/steam_game_tags.csv'
+MIN_JACCARD = 0.3
+TAG_SEPARATOR = re.compile(r'[;,]')
+
+
+# ================================
+# 관련성 (태그 겹침)
+# ================================
+def catalog_title(title):
+    """02_Translate_Duple.py 와 같은 제목 정규화 (소문자, 연속 공백 하나로)"""
+    return re.sub(r'\s+', ' ', str(title).strip().lower())
+
+
+def load_tags(path, game_ids, titles):
+    """행 번호 → 태그 집합 (game_ids / titles: 특징 저장소 행 순서, 태그 파일에 없는 게임은 빈 집합)"""
+    df = pd.read_csv(path, encoding='utf-8-sig')  # 크롤러가 BOM 을 붙여서 저장
+    app_ids = df['AppID'] if 'AppID' in df.columns else [None] * len(df)
+    tags_by_id, tags_by_title = {}, {}
+    for title, app_id, tags in zip(df['Title'], app_ids, df['Tags'].fillna('')):
+        tag_set = {tag.strip().lower() for tag in TAG_SEPARATOR.split(str(tags)) if tag.strip()}
+        if not pd.isna(app_id):
+            tags_by_id.setdefault(game_id_for(title, app_id), tag_set)
+        tags_by_title.setdefault(catalog_title(title), tag_set)
+    return [tags_by_id.get(game_id, tags_by_title.get(catalog_title(title), set()))
+            for game_id, title in zip(game_ids, titles)]
+
+
+def relevant_sets(tags, query_rows, min_jaccard=MIN_JACCARD):
+    """질의 행 → 관련 게임 행 집합 (자기 자신 제외, 관련 게임이 없는 질의는 빠짐)"""
+    rows_by_tag = defaultdict(list)
+    for row, row_tags in enumerate(tags):
+        for tag in row_tags:
+            rows_by_tag[tag].append(row)
+    relevance = {}
+    for query in query_rows:
+        query_tags = tags[query]
+        candidates = {row for tag in query_tags for row in rows_by_tag[tag]} - {query}
+        relevant = {row for row in candidates
+                    if len(query_tags & tags[row]) / len(query_tags | tags[row]) >= min_jaccard}
+        if relevant:
+            relevance[int(query)] = relevant
+    return relevance
+
+
+def split_queries(query_rows, tune_fraction=0.5, seed=0):
+    """(tune, test) 행 번호 배열 - 같은 seed 면 빌드가 달라도 같은 분할"""
+    rows = np.array(sorted(query_rows), dtype=np.int64)
+    rng = np.random.default_rng(seed)
+    rng.shuffle(rows)
+    n_tune = int(len(rows) * tune_fraction)
+    return rows[:n_tune], rows[n_tune:]
+
+
+# ================================
+# 순위 지표 (관련 여부 0 / 1)
+# ================================
+def precision_at_k(ranked, relevant, k):
+    return sum(1 for row in ranked[:k] if row in relevant) / k
+
+
+def recall_at_k_relevant(ranked, relevant, k):
+    return sum(1 for row in ranked[:k] if row in relevant) / len(relevant)
+
+
+def ndcg_at_k(ranked, relevant, k):
+    dcg = sum(1 / math.log2(rank + 2) for rank, row in enumerate(ranked[:k]) if row in relevant)
+    ideal = sum(1 / math.log2(rank + 2) for rank in range(min(k, len(relevant))))
+    return dcg / ideal
+
+
+def reciprocal_rank(ranked, relevant):
+    for rank, row in enumerate(ranked, start=1):
+        if row in relevant:
+            return 1 / rank
+    return 0.0
+
+
+def ranking_metrics(results, relevance, k):
+    """results: 질의 행 → 추천 행 목록, relevance: 질의 행 → 관련 행 집합 → 지표별 평균"""
+    queries = [query for query in results if query in relevance]
+    if not queries:
+        return {}
+    metrics = {
+        f'precision@{k}': [precision_at_k(list(results[q]), relevance[q], k) for q in queries],
+        f'recall@{k}': [recall_at_k_relevant(list(results[q]), relevance[q], k) for q in queries],
+        f'ndcg@{k}': [ndcg_at_k(list(results[q]), relevance[q], k) for q in queries],
+        'mrr': [reciprocal_rank(list(results[q]), relevance[q]) for q in queries],
+    }
+    summary = {name: round(float(np.mean(values)), 6) for name, values in metrics.items()}
+    summary['queries'] = len(queries)
+    return summary
+
+
+# ================================
+# 엔진
+# ================================
+def _nbytes(*arrays):
+    return int(sum(np.asarray(array).nbytes for array in arrays))
+
+
+def _finite_top(ids, scores, k):
+    """점수 상위 k 개 중 제외(-inf)되지 않은 것만"""
+    top_idx, top_scores = top_n_per_row(scores[None, :], k)
+    return ids[top_idx[0][np.isfinite(top_scores[0])]]
+
+
+class BruteForceEngine:
+    name = 'brute-force'
+
+    def __init__(self, tfidf_matrix, doc_vectors, weights, valid_rows=None):
+        self.tfidf_matrix = tfidf_matrix
+        self.doc_vectors = doc_vectors
+        self.weights = weights
+        self.valid_rows = (np.asarray(valid_rows, dtype=bool) if valid_rows is not None
+                           else valid_rows_mask(tfidf_matrix, doc_vectors))
+
+    def search(self, ref_idx, k):
+        if not self.valid_rows[ref_idx]:
+            return np.empty(0, dtype=np.int64)  # 추천 엔진도 기준 게임이 유효하지 않으면 빈 결과
+        scores = blended_scores(self.tfidf_matrix, self.doc_vectors, [ref_idx], self.weights)[0]
+        scores[~self.valid_rows] = -np.inf
+        scores[ref_idx] = -np.inf  # 자기 자신 제외
+        return _finite_top(np.arange(len(scores)), scores, k)
+
+    def memory_bytes(self):
+        m = self.tfidf_matrix
+        return _nbytes(m.data, m.indices, m.indptr, self.doc_vectors)
+
+
+class _RerankEngine(BruteForceEngine):
+    """후보를 먼저 뽑고 후보만 결합 유사도로 재정렬"""
+
+    def __init__(self, tfidf_matrix, doc_vectors, weights, candidates=RERANK_CANDIDATES, valid_rows=None):
+        super().__init__(tfidf_matrix, doc_vectors, weights, valid_rows)
+        self.candidates = candidates
+
+    def candidate_ids(self, ref_idx):
+        raise NotImplementedError
+
+    def search(self, ref_idx, k):
+        if not self.valid_rows[ref_idx]:
+            return np.empty(0, dtype=np.int64)
+        ids = np.asarray(self.candidate_ids(ref_idx), dtype=np.int64)
+        ids = ids[(ids != ref_idx) & self.valid_rows[ids]]
+        if len(ids) == 0:
+            return ids
+        tfidf_weight, w2v_weight = self.weights
+        tfidf_sim = (self.tfidf_matrix[ids] @ self.tfidf_matrix[ref_idx].T).toarray().ravel()
+        w2v_sim = self.doc_vectors[ids] @ self.doc_vectors[ref_idx]
+        top_idx, _ = top_n_per_row((tfidf_weight * tfidf_sim + w2v_weight * w2v_sim)[None, :], k)
+        return ids[top_idx[0]]
+
+
+class SparseIndexEngine(_RerankEngine):
+    name = 'sparse-index'
+
+    def __init__(self, tfidf_matrix, doc_vectors, weights, inverted_index, candidates=RERANK_CANDIDATES,
+                 valid_rows=None):
+        super().__init__(tfidf_matrix, doc_vectors, weights, candidates, valid_rows)
+        self.inverted_index = inverted_index
+
+    def candidate_ids(self, ref_idx):
+        row = self.tfidf_matrix[ref_idx]
+        ids, _ = self.inverted_index.search(row.indices, row.data, k=self.candidates + 1)
+        return ids
+
+    def memory_bytes(self):
+        index = self.inverted_index
+        return super().memory_bytes() + _nbytes(index.indptr, index.doc_ids, index.weights, index.max_scores)
+
+
+class AnnEngine(_RerankEngine):
+    name = 'ann'
+
+    def __init__(self, tfidf_matrix, doc_vectors, weights, ivf_index, candidates=RERANK_CANDIDATES, nprobe=None,
+                 valid_rows=None):
+        super().__init__(tfidf_matrix, doc_vectors, weights, candidates, valid_rows)
+        self.ivf_index = ivf_index
+        self.nprobe = nprobe
+
+    def candidate_ids(self, ref_idx):
+        ids, _ = self.ivf_index.search(self.doc_vectors[ref_idx], k=self.candidates, exclude=ref_idx,
+                                       nprobe=self.nprobe)
+        return ids
+
+    def memory_bytes(self):
+        ivf = self.ivf_index
+        return super().memory_bytes() + _nbytes(ivf.centroids, ivf.list_offsets, ivf.list_ids)
+
+
+class QuantizedEngine(BruteForceEngine):
+    """양자화 문서 벡터로 전체 탐색 (candidates > 0 이면 상위 candidates 개를 float32 로 재정렬)
+
+    메모리는 TF-IDF + 양자화 행렬만 센다 (float32 원본은 mmap 으로 두고 재정렬 후보 행만 읽는다).
+    """
+
+    def __init__(self, tfidf_matrix, doc_vectors, weights, quantized, candidates=0, valid_rows=None):
+        super().__init__(tfidf_matrix, doc_vectors, weights, valid_rows)
+        self.quantized = quantized
+        self.candidates = candidates
+        self.name = f"{quantized.kind}-rerank" if candidates else quantized.kind
+
+    def search(self, ref_idx, k):
+        if not self.valid_rows[ref_idx]:
+            return np.empty(0, dtype=np.int64)
+        tfidf_weight, w2v_weight = self.weights
+        ref = np.asarray(self.doc_vectors[ref_idx], dtype=np.float32)
+        tfidf_sim = (self.tfidf_matrix @ self.tfidf_matrix[ref_idx].T).toarray().ravel()
+        scores = tfidf_weight * tfidf_sim + w2v_weight * self.quantized.scores(ref)
+        scores[~self.valid_rows] = -np.inf
+        scores[ref_idx] = -np.inf  # 자기 자신 제외
+        if not self.candidates:
+            return _finite_top(np.arange(len(scores)), scores, k)
+        ids = _finite_top(np.arange(len(scores)), scores, max(self.candidates, k))
+        exact = tfidf_weight * tfidf_sim[ids] + w2v_weight * exact_scores(self.doc_vectors, ref, ids)
+        return _finite_top(ids, exact, k)
+
+    def memory_bytes(self):
+        m = self.tfidf_matrix
+        return _nbytes(m.data, m.indices, m.indptr) + self.quantized.nbytes
+
+
+# ================================
+# 측정
+# ================================
+def _percentile_ms(latencies, q):
+    return round(float(np.percentile(latencies, q) * 1000), 4) if latencies else 0.0
+
+
+def measure_engine(engine, queries, k, memory_queries=50):
+    """질의별 결과 + 지연시간 백분위 / 처리량 / 메모리
+
+    메모리: 엔진이 쓰는 배열 크기(index_mb) + 질의 처리 중 추가로 할당한 최대 크기(peak_query_kb, tracemalloc).
+    tracemalloc 은 느리므로 지연시간과 따로 앞쪽 memory_queries 개 질의로만 잰다.
+    """
+    results, latencies = {}, []
+    start = time.perf_counter()
+    for query in queries:
+        query_start = time.perf_counter()
+        results[int(query)] = [int(row) for row in engine.search(int(query), k)]
+        latencies.append(time.perf_counter() - query_start)
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    for query in queries[:memory_queries]:
+        engine.search(int(query), k)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return results, {
+        'queries': len(latencies),
+        'mean_ms': round(float(np.mean(latencies)) * 1000, 4) if latencies else 0.0,
+        'p50_ms': _percentile_ms(latencies, 50),
+        'p90_ms': _percentile_ms(latencies, 90),
+        'p95_ms': _percentile_ms(latencies, 95),
+        'p99_ms': _percentile_ms(latencies, 99),
+        'throughput_qps': round(len(latencies) / elapsed, 2) if elapsed > 0 else 0.0,
+        'index_mb': round(engine.memory_bytes() / 2 ** 20, 3),
+        'peak_query_kb': round(peak / 1024, 1),
+    }
+
+
+def agreement(reference_results, results, k):
+    """brute-force 결과 대비 recall@k (근사 엔진이 정확한 상위 k 를 얼마나 찾았는지, 질의가 없으면 0)"""
+    if not reference_results:
+        return 0.0
+    return round(float(np.mean([recall_at_k(reference_results[q], results[q], k) for q in reference_results])), 6)
+
+
+def tune_weights(make_engine, tune_rows, relevance, k, grid):
+    """TF-IDF 가중치 후보별 tune 질의 nDCG → (가장 좋은 (TF-IDF, Word2Vec), [(가중치, 지표), ...])"""
+    scores = []
+    for tfidf_weight in grid:
+        weights = (round(float(tfidf_weight), 4), round(1 - float(tfidf_weight), 4))
+        engine = make_engine(weights)
+        results = {int(q): [int(r) for r in engine.search(int(q), k)] for q in tune_rows}
+        scores.append((weights, ranking_metrics(results, relevance, k)))
+    best = max(scores, key=lambda item: item[1].get(f'ndcg@{k}', 0.0))[0]
+    return best, scores
+
+
+# ================================
+# 빌드 간 비교
+# ================================
+def compare_reports(baseline, current, latency_tolerance=0.2, quality_tolerance=0.02):
+    """이전 보고서 대비 회귀 목록 (지연시간 p95 가 latency_tolerance 비율 이상 증가, 지표가 quality_tolerance 이상 하락)"""
+    regressions = []
+    for name, engine in current.get('engines', {}).items():
+        before = baseline.get('engines', {}).get(name)
+        if before is None:
+            continue
+        old_p95, new_p95 = before['performance']['p95_ms'], engine['performance']['p95_ms']
+        if old_p95 > 0 and new_p95 > old_p95 * (1 + latency_tolerance):
+            regressions.append(f"{name}: p95 {old_p95:.3f}ms → {new_p95:.3f}ms")
+        for metric, new_value in engine.get('quality', {}).items():
+            old_value = before.get('quality', {}).get(metric)
+            if metric != 'queries' and old_value is not None and new_value < old_value - quality_tolerance:
+                regressions.append(f"{name}: {metric} {old_value:.4f} → {new_value:.4f}")
+    return regressions
@@ -0,0 +1,157 @@
+# 게임별 특징 저장소 (추천 스크립트 06 / 08, 추천 엔진(07, server.py)이 같이 사용)
+# ./model/feature_store/  (CURRENT + builds/<build_id>/ 구성은 artifacts.write_array_dir 참고, 아래는 빌드 폴더 내용)
+#   manifest.json                      형식 버전, 빌드 id, 만들 때 쓴 TF-IDF 번들 build_id, 게임 수
+#   game_ids_offsets / blob .npy       게임 id (Steam AppID 'app:123', 없으면 제목 해시 'title:...')
+#   titles / descriptions / image_paths  표시용 메타데이터 (steam_game_translated.csv) 문자열 테이블
+#   tokens_offsets / blob .npy         Okt 토큰 (steam_game_token.csv, 공백으로 연결)
+#   tfidf_rows.npy                     게임 → TF-IDF 번들 행 번호
+#   embedding.npy                      Okt 토큰으로 만든 L2 정규화 Word2Vec 문서 벡터 (단순 평균)
+#                                      모든 진입점(06 / 07 / 08 / server.py / benchmark.py)이 이 embedding 하나만 쓴다.
+#   embedding_float16.npy              embedding 의 float16 사본 (quantization.py, 선택적으로 양자화 조회)
+#   embedding_int8 / _scales .npy      embedding 의 차원별 스케일 int8 사본
+#   valid_rows.npy                     추천 후보가 될 수 있는 게임 (TF-IDF 행이 비어 있지 않고 문서 벡터가 0 이 아님)
+#   neighbor_ids / neighbor_scores .npy  TF-IDF 열 번호별 Word2Vec 이웃 단어 표 (query_expansion.py, 검색어 확장)
+# 행 번호 = 게임 순서 (TF-IDF 번들 행 순서). 모든 경로가 같은 행 번호로 TF-IDF / 임베딩 / 메타데이터를 찾는다.
+# TF-IDF 와 Word2Vec 이 같은 토큰(03_Preprocessing.py)으로 만들어졌으므로 질의마다 다시 토큰화하지 않는다.
+import hashlib
+
+import numpy as np
+
+from artifacts import StringTable, encode_strings, open_array_dir, write_array_dir
+from doc_vectors import build_doc_vectors
+from quantization import QuantizedVectors, quantize_int8
+from query_expansion import NEIGHBOR_K, build_neighbor_table
+
+FEATURE_STORE_DIR = './model/feature_store'
+FEATURE_STORE_FORMAT = 'game-recommendation-features'
+FEATURE_STORE_VERSION = 1
+CATALOG_FILE = './Crawling_data/steam_game_translated.csv'
+TOKEN_FILE = './Crawling_data/steam_game_token.csv'
+
+
+class FeatureStoreError(Exception):
+    """특징 저장소가 없거나 TF-IDF 번들과 맞지 않음"""
+
+
+def game_id_for(title, app_id=None):
+    """안정적인 게임 id (제목이 바뀌어도 AppID 가 있으면 그대로)"""
+    app_id = str(app_id).strip().removesuffix('.0') if app_id is not None else ''  # pandas 가 float 로 읽은 경우
+    if app_id.isdigit():
+        return f"app:{app_id}"
+    return f"title:{hashlib.sha1(str(title).encode('utf-8')).hexdigest()[:16]}"
+
+
+def _first_by_title(df, columns):
+    """제목 → 첫 번째 행의 값들 (중복 제목은 첫 행 사용)"""
+    rows = {}
+    present = [column for column in columns if column in df.columns]
+    for values in zip(df['Title'].astype(str).str.strip(), *(df[column] for column in present)):
+        if values[0] not in rows:
+            rows[values[0]] = dict(zip(present, values[1:]))
+    return rows
+
+
+def build_feature_store(catalog_df, token_df, bundle, embedding_model, path=FEATURE_STORE_DIR, neighbor_k=NEIGHBOR_K):
+    """번역 CSV(메타데이터) + 토큰 CSV + TF-IDF 번들 + Word2Vec → 특징 저장소 → (manifest, 제외된 제목 목록)
+
+    게임 순서는 TF-IDF 번들 행 순서를 따르고, 제목으로 세 자료를 맞춘다.
+    번역 CSV 나 토큰 CSV 에 없는 번들 행은 제외한다.
+    """
+    catalog = _first_by_title(catalog_df, ['Description', 'AppID', 'image_path'])
+    tokens_by_title = _first_by_title(token_df, ['Description'])
+
+    game_ids, titles, descriptions, image_paths, token_texts, tfidf_rows, dropped = [], [], [], [], [], [], []
+    seen_ids = set()
+    for row, title in enumerate(bundle.titles.tolist()):
+        title = title.strip()
+        meta, tokens = catalog.get(title), tokens_by_title.get(title)
+        game_id = game_id_for(title, meta.get('AppID')) if meta is not None else None
+        if meta is None or tokens is None or game_id in seen_ids:
+            dropped.append(title)
+            continue
+        seen_ids.add(game_id)
+        game_ids.append(game_id)
+        titles.append(title)
+        description = meta.get('Description')
+        descriptions.append(str(description) if isinstance(description, str) else 'no description')
+        image_path = meta.get('image_path')
+        image_paths.append(str(image_path) if isinstance(image_path, str) else '')
+        token_texts.append(str(tokens['Description']))
+        tfidf_rows.append(row)
+
+    if not titles:
+        raise FeatureStoreError("TF-IDF 번들과 맞는 게임이 없습니다.")
+    token_lists = [text.split() for text in token_texts]
+    arrays = {'tfidf_rows': np.array(tfidf_rows, dtype=np.int32),
+              'embedding': build_doc_vectors(token_lists, embedding_model)}
+    arrays['embedding_float16'] = arrays['embedding'].astype(np.float16)
+    arrays['embedding_int8'], arrays['embedding_int8_scales'] = quantize_int8(arrays['embedding'])
+    tfidf_nnz = np.diff(np.asarray(bundle.tfidf_matrix.indptr))[arrays['tfidf_rows']]
+    arrays['valid_rows'] = (tfidf_nnz > 0) & np.any(arrays['embedding'], axis=1)
+    arrays['neighbor_ids'], arrays['neighbor_scores'] = build_neighbor_table(bundle.vectorizer, embedding_model,
+                                                                             k=neighbor_k)
+    for name, strings in (('game_ids', game_ids), ('titles', titles), ('descriptions', descriptions),
+                          ('image_paths', image_paths), ('tokens', token_texts)):
+        arrays[f'{name}_offsets'], arrays[f'{name}_blob'] = encode_strings(strings)
+
+    manifest = write_array_dir(arrays, path, FEATURE_STORE_FORMAT, FEATURE_STORE_VERSION, {
+        'bundle_build_id': bundle.build_id,
+        'n_games': len(titles),
+        'embedding_dim': int(arrays['embedding'].shape[1]),
+    })
+    return manifest, dropped
+
+
+class FeatureStore:
+    def __init__(self, path, manifest, arrays):
+        self.path = path
+        self.manifest = manifest
+        self.arrays = arrays
+        self.build_id = manifest['build_id']
+        self.bundle_build_id = manifest['bundle_build_id']
+        self.game_ids = StringTable(arrays['game_ids_offsets'], arrays['game_ids_blob'])
+        self.titles = StringTable(arrays['titles_offsets'], arrays['titles_blob'])
+        self.descriptions = StringTable(arrays['descriptions_offsets'], arrays['descriptions_blob'])
+        self.image_paths = StringTable(arrays['image_paths_offsets'], arrays['image_paths_blob'])
+        self.token_texts = StringTable(arrays['tokens_offsets'], arrays['tokens_blob'])
+        self.tfidf_rows = arrays['tfidf_rows']
+        self.embedding = arrays['embedding']
+        self.valid_rows = arrays.get('valid_rows')      # 이전 저장소면 None (로드할 때 계산)
+        self.neighbor_ids = arrays.get('neighbor_ids')  # 이웃 단어 표가 없는 저장소면 None
+        self.neighbor_scores = arrays.get('neighbor_scores')
+        self._rows = None
+
+    def __len__(self):
+        return self.manifest['n_games']
+
+    def tokens(self, row):
+        return self.token_texts[row].split()
+
+    def row_of(self, game_id):
+        """게임 id → 행 번호 (없으면 None, 처음 호출할 때 dict 생성)"""
+        if self._rows is None:
+            self._rows = {game_id: row for row, game_id in enumerate(self.game_ids.tolist())}
+        return self._rows.get(game_id)
+
+    def quantized_embedding(self, kind):
+        """양자화된 embedding (QuantizedVectors, 이 형식이 없는 이전 저장소면 None)"""
+        if kind == 'float16' and 'embedding_float16' in self.arrays:
+            return QuantizedVectors(self.arrays['embedding_float16'])
+        if kind == 'int8' and 'embedding_int8' in self.arrays:
+            return QuantizedVectors(self.arrays['embedding_int8'], self.arrays['embedding_int8_scales'])
+        return None
+
+    def tfidf_matrix(self, bundle):
+        """행 번호가 이 저장소와 같은 TF-IDF 행렬 (번들 빌드가 다르면 FeatureStoreError)"""
+        if bundle.build_id != self.bundle_build_id:
+            raise FeatureStoreError(f"TF-IDF 번들 불일치: 저장소 {self.bundle_build_id} / 번들 {bundle.build_id} "
+                                    f"(05_1_Steam_doc_vectors.py 를 다시 실행하세요)")
+        if len(self) == bundle.n_docs and np.array_equal(self.tfidf_rows, np.arange(len(self))):
+            return bundle.tfidf_matrix  # 제외된 행이 없으면 mmap 행렬 그대로
+        return bundle.tfidf_matrix[np.asarray(self.tfidf_rows)]
+
+
+def open_feature_store(path=FEATURE_STORE_DIR, verify=False):
+    manifest, arrays = open_array_dir(path, FEATURE_STORE_FORMAT, FEATURE_STORE_VERSION,
+                                      verify=verify, error=FeatureStoreError)
+    return FeatureStore(path, manifest, arrays)
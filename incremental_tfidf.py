@@ -0,0 +1,200 @@
+# 전체 재학습 없이 TF-IDF 를 갱신하는 증분 인덱서 (04_Steam_tfidf.py --incremental)
+# 어휘 / 문서 빈도(df) / 문서별 원시 단어 빈도(tf) 를 상태 파일로 유지한다.
+# - 새 문서: 토큰화해서 tf 행을 뒤에 추가하고 df 갱신 (새 단어는 어휘 끝에 추가)
+# - 바뀐 문서: 이전 행을 삭제 표시(tombstone) 하고 새 행 추가
+# - 삭제된 문서: 삭제 표시 + df 차감
+# idf 와 정규화는 내보낼 때 tf 행렬에 한 번에 곱해서 계산한다 (TfidfVectorizer(sublinear_tf=True) 와 같은 식).
+# 내보낼 때는 df > 0 인 단어만 알파벳 순서 열로 쓰므로, 결과(어휘 / idf / 행렬)가 전체 재학습과 같다.
+# 토큰화 / df 갱신은 바뀐 문서 수에 비례하고, 카탈로그 전체를 다시 fit 하지 않는다.
+# 내보내기(weighted_matrix)는 문서 수가 바뀌면 모든 단어의 idf 가 바뀌고 행 정규화도 다시 해야 하므로
+# 카탈로그 크기(nnz)에 비례한다 (벡터화된 행렬 연산 한 번, 번들 저장도 어차피 전체 배열을 쓴다).
+# 문서 키는 게임 id (feature_store.game_id_for, 같은 키가 또 나오면 '#2', '#3' ... 을 붙여서 행을 따로 유지).
+import hashlib
+from collections import Counter, defaultdict
+
+import numpy as np
+import scipy.sparse as sp
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.preprocessing import normalize
+
+TFIDF_STATE_FILE = './model/tfidf_state.npz'
+COMPACT_RATIO = 0.3  # 삭제 표시된 행이 이 비율을 넘으면 정리
+
+
+def content_hash(text):
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()[:16]
+
+
+def unique_keys(keys):
+    """중복 키에 등장 순서 번호를 붙인다 ['a', 'b', 'a'] → ['a', 'b', 'a#2'] (같은 게임이 두 행이어도 행별로 유지)"""
+    seen = defaultdict(int)
+    result = []
+    for key in keys:
+        seen[key] += 1
+        result.append(key if seen[key] == 1 else f"{key}#{seen[key]}")
+    return result
+
+
+class IncrementalTfidf:
+    """증분 TF-IDF 상태 (문서 키 = 게임 id, unique_keys 로 중복 제거된 키)"""
+
+    def __init__(self):
+        self.analyzer = TfidfVectorizer().build_analyzer()  # 04 의 TfidfVectorizer 와 같은 토큰 규칙
+        self.terms = []           # 단어 id → 단어
+        self.term_ids = {}        # 단어 → 단어 id
+        self.df = np.zeros(0, dtype=np.int64)
+        self.tf_blocks = []       # 원시 단어 빈도 CSR 블록들 (행 = 문서 행 id)
+        self.n_rows = 0
+        self.row_keys = []        # 행 id → 문서 키
+        self.row_hashes = []      # 행 id → 내용 해시
+        self.alive = np.zeros(0, dtype=bool)
+        self.key_rows = {}        # 문서 키 → 살아 있는 행 id
+
+    # ================================
+    # 저장 / 로드
+    # ================================
+    def tf_matrix(self):
+        """원시 단어 빈도 행렬 (n_rows x 어휘 크기)"""
+        n_terms = len(self.terms)
+        if len(self.tf_blocks) != 1 or self.tf_blocks[0].shape[1] != n_terms:
+            # 이전 블록은 나중에 추가된 단어 열이 없으므로 폭을 맞춘 뒤 합친다
+            blocks = [sp.csr_matrix((block.data, block.indices, block.indptr), shape=(block.shape[0], n_terms))
+                      for block in self.tf_blocks if block.shape[0]]
+            self.tf_blocks = [sp.vstack(blocks, format='csr') if blocks
+                              else sp.csr_matrix((0, n_terms), dtype=np.float32)]
+        return self.tf_blocks[0]
+
+    def save(self, path=TFIDF_STATE_FILE):
+        tf = self.tf_matrix()
+        np.savez(path, terms=np.array(self.terms, dtype=str), df=self.df,
+                 tf_data=tf.data, tf_indices=tf.indices, tf_indptr=tf.indptr,
+                 row_keys=np.array(self.row_keys, dtype=str), row_hashes=np.array(self.row_hashes, dtype=str),
+                 alive=self.alive)
+
+    @classmethod
+    def load(cls, path=TFIDF_STATE_FILE):
+        data = np.load(path)
+        state = cls()
+        state.terms = data['terms'].tolist()
+        state.term_ids = {term: i for i, term in enumerate(state.terms)}
+        state.df = data['df']
+        state.row_keys = data['row_keys'].tolist()
+        state.row_hashes = data['row_hashes'].tolist()
+        state.alive = data['alive']
+        state.n_rows = len(state.row_keys)
+        state.tf_blocks = [sp.csr_matrix((data['tf_data'], data['tf_indices'], data['tf_indptr']),
+                                         shape=(state.n_rows, len(state.terms)))]
+        state.key_rows = {key: row for row, key in enumerate(state.row_keys) if state.alive[row]}
+        return state
+
+    # ================================
+    # 갱신
+    # ================================
+    def _term_row(self, text):
+        counts = Counter()
+        for token in self.analyzer(text):
+            term_id = self.term_ids.get(token)
+            if term_id is None:
+                term_id = len(self.terms)
+                self.terms.append(token)
+                self.term_ids[token] = term_id
+            counts[term_id] += 1
+        return counts
+
+    def _append_rows(self, docs):
+        """[(키, 텍스트), ...] 를 새 행으로 추가"""
+        data, indices, indptr = [], [], [0]
+        for key, text in docs:
+            counts = self._term_row(text)
+            ids = sorted(counts)
+            indices.extend(ids)
+            data.extend(counts[i] for i in ids)
+            indptr.append(len(indices))
+            self.key_rows[key] = len(self.row_keys)
+            self.row_keys.append(key)
+            self.row_hashes.append(content_hash(text))
+        block = sp.csr_matrix((np.array(data, dtype=np.float32), np.array(indices, dtype=np.int32),
+                               np.array(indptr, dtype=np.int64)), shape=(len(docs), len(self.terms)))
+        if len(self.df) < len(self.terms):
+            self.df = np.concatenate([self.df, np.zeros(len(self.terms) - len(self.df), dtype=np.int64)])
+        np.add.at(self.df, block.indices, 1)
+        self.tf_blocks.append(block)
+        self.alive = np.concatenate([self.alive, np.ones(len(docs), dtype=bool)])
+        self.n_rows += len(docs)
+
+    def _tombstone(self, rows):
+        if not rows:
+            return
+        rows = np.asarray(rows, dtype=np.int64)
+        removed = self.tf_matrix()[rows]
+        np.subtract.at(self.df, removed.indices, 1)
+        self.alive[rows] = False
+        for row in rows:
+            self.key_rows.pop(self.row_keys[row], None)
+
+    def sync(self, docs):
+        """현재 카탈로그 [(키, 텍스트), ...] 와 상태를 맞춘다 → 변경 통계"""
+        current = dict(docs)  # 키는 유일해야 한다 (unique_keys)
+        added, changed = [], []
+        for key, text in current.items():
+            row = self.key_rows.get(key)
+            if row is None:
+                added.append((key, text))
+            elif self.row_hashes[row] != content_hash(text):
+                changed.append((key, text))
+        removed = [key for key in self.key_rows if key not in current]
+
+        self._tombstone([self.key_rows[key] for key, _ in changed] + [self.key_rows[key] for key in removed])
+        if added or changed:
+            self._append_rows(added + changed)
+        if self.n_rows and (~self.alive).sum() / self.n_rows > COMPACT_RATIO:
+            self.compact()
+        return {'added': len(added), 'changed': len(changed), 'removed': len(removed),
+                'unchanged': len(current) - len(added) - len(changed)}
+
+    def compact(self):
+        """삭제 표시된 행 제거 (어휘는 유지)"""
+        keep = np.flatnonzero(self.alive)
+        self.tf_blocks = [self.tf_matrix()[keep]]
+        self.row_keys = [self.row_keys[row] for row in keep]
+        self.row_hashes = [self.row_hashes[row] for row in keep]
+        self.alive = np.ones(len(keep), dtype=bool)
+        self.n_rows = len(keep)
+        self.key_rows = {key: row for row, key in enumerate(self.row_keys)}
+
+    # ================================
+    # 내보내기
+    # ================================
+    @property
+    def n_docs(self):
+        return int(self.alive.sum())
+
+    def export_terms(self):
+        """내보낼 단어 id (df > 0 인 단어만, 단어 알파벳 순서 = TfidfVectorizer 의 열 순서)
+
+        삭제 / 변경으로 df 가 0 이 된 단어는 상태에는 남지만 (다시 나올 수 있음) 어휘에서는 빠진다.
+        """
+        live = np.flatnonzero(self.df > 0)
+        return live[np.argsort(np.array(self.terms, dtype=object)[live], kind='stable')] if len(live) else live
+
+    def vocabulary(self):
+        """단어 → 내보낸 행렬의 열 번호"""
+        return {self.terms[term_id]: column for column, term_id in enumerate(self.export_terms())}
+
+    def idf(self):
+        """TfidfVectorizer(smooth_idf=True) 와 같은 idf (export_terms 순서)"""
+        return np.log((1 + self.n_docs) / (1 + self.df[self.export_terms()])) + 1
+
+    def weighted_matrix(self, keys):
+        """keys 순서대로 TF-IDF 행렬 (sublinear tf x idf, 행 L2 정규화, 열 = export_terms 순서)"""
+        rows = [self.key_rows[key] for key in keys]
+        matrix = self.tf_matrix()[rows][:, self.export_terms()].astype(np.float64)
+        matrix.data = 1 + np.log(matrix.data)
+        matrix = matrix @ sp.diags(self.idf())
+        return normalize(matrix.tocsr(), norm='l2')
+
+    def to_vectorizer(self):
+        """질의 변환용 TfidfVectorizer (어휘 / idf 를 현재 상태로 고정)"""
+        vectorizer = TfidfVectorizer(sublinear_tf=True, vocabulary=self.vocabulary())
+        vectorizer.idf_ = self.idf()
+        return vectorizer
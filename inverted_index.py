@@ -0,0 +1,94 @@
+# TF-IDF 역색인 (term → postings) 과 MaxScore 방식 상위 k 검색
+# tfidf_steam.mtx 를 CSC 로 바꿔서 단어별 (문서 id, 가중치) 배열과 단어별 최대 가중치를 저장한다.
+# 질의 점수는 질의 단어의 postings 에서만 누적하고,
+# 남은 단어들의 최대 점수 합이 현재 k 번째 점수보다 작아지면 새 후보 추가를 멈추고 기존 후보만 갱신한다.
+# → 키워드 검색 비용이 전체 문서 수가 아니라 질의 단어 postings 길이에 비례한다.
+import numpy as np
+
+INVERTED_INDEX_FILE = './model/tfidf_inverted_index.npz'
+
+
+class InvertedIndex:
+    """배열 기반 postings (CSC 와 같은 구조) + 단어별 최대 점수"""
+
+    def __init__(self, indptr, doc_ids, weights, max_scores, n_docs):
+        self.indptr = indptr          # 단어 t 의 postings = doc_ids[indptr[t]:indptr[t + 1]] (문서 id 오름차순)
+        self.doc_ids = doc_ids
+        self.weights = weights
+        self.max_scores = max_scores  # 단어별 최대 가중치 (상한)
+        self.n_docs = n_docs
+
+    @property
+    def n_terms(self):
+        return len(self.indptr) - 1
+
+    @classmethod
+    def from_matrix(cls, tfidf_matrix):
+        csc = tfidf_matrix.tocsc()
+        csc.sort_indices()
+        max_scores = np.asarray(csc.max(axis=0).todense(), dtype=np.float32).ravel()
+        return cls(csc.indptr.astype(np.int64), csc.indices.astype(np.int32), csc.data.astype(np.float32),
+                   max_scores, csc.shape[0])
+
+    def save(self, path=INVERTED_INDEX_FILE):
+        np.savez(path, indptr=self.indptr, doc_ids=self.doc_ids, weights=self.weights,
+                 max_scores=self.max_scores, n_docs=np.int64(self.n_docs))
+
+    @classmethod
+    def load(cls, path=INVERTED_INDEX_FILE):
+        data = np.load(path)
+        return cls(data['indptr'], data['doc_ids'], data['weights'], data['max_scores'], int(data['n_docs']))
+
+    def postings(self, term):
+        start, end = self.indptr[term], self.indptr[term + 1]
+        return self.doc_ids[start:end], self.weights[start:end]
+
+    def search(self, terms, query_weights, k=10):
+        """질의 단어 id / 가중치로 내적 점수 상위 k 개 (문서 id, 점수) 를 내림차순 반환"""
+        terms = np.asarray(terms, dtype=np.int64)
+        query_weights = np.asarray(query_weights, dtype=np.float32)
+        keep = (query_weights > 0) & (terms >= 0) & (terms < self.n_terms)
+        terms, query_weights = terms[keep], query_weights[keep]
+        empty = (np.zeros(0, dtype=np.int32), np.zeros(0, dtype=np.float32))
+        if len(terms) == 0 or k <= 0:
+            return empty
+
+        # 상한이 큰 단어부터 처리, remaining[i] = i 번째 이후 단어들의 상한 합
+        upper = query_weights * self.max_scores[terms]
+        order = np.argsort(-upper, kind='stable')
+        terms, query_weights, upper = terms[order], query_weights[order], upper[order]
+        remaining = np.cumsum(upper[::-1])[::-1]
+
+        cand_ids = np.zeros(0, dtype=np.int32)
+        cand_scores = np.zeros(0, dtype=np.float32)
+        for i, (term, q_weight) in enumerate(zip(terms, query_weights)):
+            ids, weights = self.postings(term)
+            if len(ids) == 0:
+                continue
+            theta = np.partition(cand_scores, len(cand_scores) - k)[len(cand_scores) - k] \
+                if len(cand_scores) >= k else 0.0
+            if len(cand_scores) >= k and remaining[i] <= theta:
+                # 남은 단어만으로는 새 문서가 상위 k 에 들 수 없음 → 기존 후보만 갱신하고 가망 없는 후보는 제거
+                alive = cand_scores + remaining[i] >= theta
+                cand_ids, cand_scores = cand_ids[alive], cand_scores[alive]
+                pos = np.minimum(np.searchsorted(ids, cand_ids), len(ids) - 1)
+                hit = ids[pos] == cand_ids
+                cand_scores[hit] += q_weight * weights[pos[hit]]
+            else:
+                merged_ids = np.concatenate([cand_ids, ids])
+                merged_scores = np.concatenate([cand_scores, q_weight * weights])
+                cand_ids, inverse = np.unique(merged_ids, return_inverse=True)
+                cand_scores = np.bincount(inverse, weights=merged_scores).astype(np.float32)
+
+        positive = cand_scores > 0
+        cand_ids, cand_scores = cand_ids[positive], cand_scores[positive]
+        if len(cand_scores) > k:
+            part = np.argpartition(-cand_scores, k - 1)[:k]
+            cand_ids, cand_scores = cand_ids[part], cand_scores[part]
+        order = np.argsort(-cand_scores, kind='stable')
+        return cand_ids[order], cand_scores[order]
+
+    def search_vector(self, query_vector, k=10):
+        """vectorizer.transform() 결과(1 x V 희소 행) 로 검색"""
+        row = query_vector.tocsr()
+        return self.search(row.indices, row.data, k)
@@ -0,0 +1,63 @@
+# 문서 벡터 양자화 (서빙 메모리 절약용, 선택 사항)
+# - float16 : 반정밀도 그대로 (float32 의 1/2)
+# - int8    : 차원별 스케일 scale[d] = max|x[:, d]| / 127 로 -127 ~ 127 정수 (float32 의 1/4 + 스케일 d 개)
+# 조회: 양자화 행렬 전체를 블록 단위로 훑어서 근사 내적 → 상위 RERANK_CANDIDATES 개만
+#       float32 원본 (mmap, 후보 행만 읽음) 으로 정확한 내적을 다시 계산해서 순위를 정한다.
+# 질의 벡터는 양자화하지 않는다 (float32 질의 x 양자화 문서).
+import numpy as np
+
+QUANTIZATIONS = ('float16', 'int8')
+RERANK_CANDIDATES = 300
+SCAN_BLOCK_ROWS = 16384  # 블록마다 float32 로 풀어서 곱하므로 임시 메모리 ~ 블록 행 수 x 차원 x 4 bytes
+
+
+def quantize_int8(vectors):
+    """(int8 코드 [n, d], 차원별 스케일 float32 [d]) - 복원값 = 코드 x 스케일"""
+    vectors = np.asarray(vectors, dtype=np.float32)
+    scales = (np.abs(vectors).max(axis=0) / 127 if len(vectors) else np.zeros(vectors.shape[1])).astype(np.float32)
+    codes = np.rint(vectors / np.where(scales > 0, scales, 1.0))
+    return np.clip(codes, -127, 127).astype(np.int8), scales
+
+
+class QuantizedVectors:
+    """양자화된 문서 벡터 행렬 (scores 로 전체 행과 근사 내적)"""
+
+    def __init__(self, codes, scales=None):
+        self.codes = codes
+        self.scales = scales  # int8 만 사용, float16 이면 None
+        self.kind = 'int8' if scales is not None else 'float16'
+
+    @classmethod
+    def from_vectors(cls, vectors, kind):
+        if kind == 'float16':
+            return cls(np.asarray(vectors, dtype=np.float16))
+        if kind == 'int8':
+            return cls(*quantize_int8(vectors))
+        raise ValueError(f"지원하지 않는 양자화 형식: {kind} (가능: {', '.join(QUANTIZATIONS)})")
+
+    def __len__(self):
+        return len(self.codes)
+
+    @property
+    def nbytes(self):
+        return int(self.codes.nbytes + (self.scales.nbytes if self.scales is not None else 0))
+
+    def scores(self, query, block_rows=SCAN_BLOCK_ROWS):
+        """전체 행과 float32 질의의 근사 내적 (float32 [n])"""
+        query = np.asarray(query, dtype=np.float32)
+        if self.scales is not None:
+            query = query * self.scales  # 코드 @ (질의 x 스케일) = 복원 행렬 @ 질의
+        out = np.empty(len(self.codes), dtype=np.float32)
+        for start in range(0, len(self.codes), block_rows):
+            block = np.asarray(self.codes[start:start + block_rows], dtype=np.float32)
+            out[start:start + len(block)] = block @ query
+        return out
+
+
+def exact_scores(vectors, query, ids):
+    """후보 행만 float32 원본으로 정확한 내적 (ids 순서대로)"""
+    ids = np.asarray(ids, dtype=np.int64)
+    order = np.argsort(ids, kind='stable')  # mmap 을 앞에서부터 순서대로 읽도록
+    scores = np.empty(len(ids), dtype=np.float32)
+    scores[order] = np.asarray(vectors[ids[order]], dtype=np.float32) @ np.asarray(query, dtype=np.float32)
+    return scores
@@ -0,0 +1,77 @@
+# 키워드 검색어 분석 (03_Preprocessing.py 와 같은 tokenizer.py 규칙)
+# TF-IDF 어휘는 Okt 원형 / 불용어 제거 토큰으로 만들어졌으므로 검색어도 같은 과정을 거쳐야 단어가 맞는다.
+#   "귀여운 고양이" → ('귀엽다', '고양이')
+# - Okt(JVM) 는 모델을 로드할 때 미리 띄워서(warm_up) 첫 검색이 느려지지 않게 한다.
+# - 분석 결과는 LRU 캐시에 둔다 (같은 검색어는 Okt 를 다시 부르지 않음).
+# - 분석 시간은 점수 계산과 따로 집계한다 (stats()).
+import logging
+import threading
+import time
+from collections import OrderedDict
+
+from query_cache import normalize_query
+from tokenizer import get_okt, tokenize_text
+
+DEFAULT_MAX_ENTRIES = 1024
+
+
+class QueryAnalyzer:
+    """검색어 → TF-IDF 어휘와 같은 규칙의 토큰 튜플 (스레드 안전)"""
+
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()  # 정규화된 검색어 → 토큰 튜플, 오래 안 쓴 것이 앞
+        self.lock = threading.Lock()
+        self.okt_lock = threading.Lock()  # Okt 인스턴스는 한 번에 한 스레드만 사용
+        self.hits = 0
+        self.misses = 0
+        self.analysis_seconds = 0.0  # 캐시 미적중 시 분석에 쓴 시간 합계
+        self.warm = False
+
+    def warm_up(self):
+        """Okt 인스턴스 생성 + 한 번 분석해서 JVM / 사전 로드 (실패하면 경고만)"""
+        start = time.perf_counter()
+        try:
+            with self.okt_lock:
+                get_okt()
+                tokenize_text("게임 검색 준비")
+            self.warm = True
+            logging.debug(f"⏱️ 검색어 분석기 준비: {(time.perf_counter() - start) * 1000:.0f}ms")
+        except Exception as e:
+            logging.warning(f"검색어 분석기(Okt) 준비 실패, 영어 토큰만 분석: {str(e)}")
+
+    def analyze(self, text):
+        key = normalize_query(text)
+        with self.lock:
+            tokens = self.entries.get(key)
+            if tokens is not None:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return tokens
+
+        start = time.perf_counter()
+        with self.okt_lock:
+            korean_tokens, english_tokens = tokenize_text(key)
+        tokens = tuple(korean_tokens + english_tokens)
+        elapsed = time.perf_counter() - start
+
+        with self.lock:
+            self.misses += 1
+            self.analysis_seconds += elapsed
+            self.entries[key] = tokens
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+        return tokens
+
+    def stats(self):
+        with self.lock:
+            lookups = self.hits + self.misses
+            return {
+                'warm': self.warm,
+                'size': len(self.entries),
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0,
+                'avg_analysis_ms': round(self.analysis_seconds / self.misses * 1000, 3) if self.misses else 0.0,
+            }
@@ -0,0 +1,81 @@
+# 추천 결과(점수 순 후보 목록) 캐시 - LRU + TTL
+# 키 = (질의 종류, 정규화된 입력, 모델 버전, 가중치, 개수)
+# 모델 파일을 다시 로드하면 버전이 바뀌고 캐시를 비우므로 이전 모델의 결과가 섞이지 않는다.
+# UI 의 "상위 10개 중 무작위 5개" 선택은 캐시에서 꺼낸 목록에 적용하므로 같은 질의라도 결과가 달라진다.
+import threading
+import time
+from collections import OrderedDict
+
+DEFAULT_MAX_ENTRIES = 512
+DEFAULT_TTL = 30 * 60  # 초
+
+
+class QueryCache:
+    """스레드 안전 LRU/TTL 캐시 (UI 추천 스레드와 GUI 스레드가 함께 사용)"""
+
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES, ttl=DEFAULT_TTL, clock=time.monotonic):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.clock = clock
+        self.entries = OrderedDict()  # 키 → (저장 시각, 값), 오래 안 쓴 것이 앞
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def get(self, key):
+        """캐시된 값 (없거나 만료되면 None)"""
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None and self.ttl is not None and self.clock() - entry[0] > self.ttl:
+                del self.entries[key]
+                self.expirations += 1
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key, value):
+        with self.lock:
+            self.entries[key] = (self.clock(), value)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+                self.evictions += 1
+
+    def get_or_compute(self, key, compute):
+        """캐시에 있으면 그대로, 없으면 compute() 결과를 저장하고 반환 (계산 중에는 잠금을 잡지 않음)"""
+        value = self.get(key)
+        if value is None:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def clear(self):
+        """모델 재로드 시 전체 무효화"""
+        with self.lock:
+            self.entries.clear()
+            self.invalidations += 1
+
+    def stats(self):
+        with self.lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': len(self.entries),
+                'max_entries': self.max_entries,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+                'invalidations': self.invalidations,
+            }
+
+
+def normalize_query(text):
+    return ' '.join(str(text).lower().split())
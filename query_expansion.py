@@ -0,0 +1,75 @@
+# Word2Vec 이웃 단어로 키워드 검색어 확장 ("생존" 검색으로 "서바이벌" 만 쓰인 게임도 찾기)
+# 빌드 단계(05_1_Steam_doc_vectors.py)에서 TF-IDF 어휘의 단어마다 Word2Vec 최근접 이웃 상위 k 개를
+# 고정 크기 표 (이웃 TF-IDF 열 번호 int32, 유사도 float16) 로 만들어 특징 저장소에 넣는다.
+# 검색 시에는 most_similar 를 돌리지 않고 표에서 질의 단어 행만 읽는다.
+#   확장 단어 가중치 = 원래 단어 가중치 x 유사도 x EXPANSION_WEIGHT (같은 이웃이 여러 번 나오면 가장 큰 값)
+#   원래 단어 + 확장 단어를 TF-IDF 역색인(MaxScore)으로 함께 점수 계산한다.
+import numpy as np
+
+from doc_vectors import normalize_rows
+
+NEIGHBOR_K = 10
+MIN_NEIGHBOR_SIMILARITY = 0.5
+EXPANSION_WEIGHT = 0.5
+MAX_EXPANSIONS_PER_TERM = 5
+
+
+def build_neighbor_table(vectorizer, embedding_model, k=NEIGHBOR_K, min_similarity=MIN_NEIGHBOR_SIMILARITY,
+                         block_size=512):
+    """TF-IDF 열 번호별 Word2Vec 이웃 → (ids int32 [n_terms, k], scores float16 [n_terms, k])
+
+    이웃도 TF-IDF 어휘 안에서만 찾는다 (검색할 수 없는 단어로 확장하지 않음). 없는 칸은 id -1.
+    """
+    n_terms = len(vectorizer.idf_)
+    ids = np.full((n_terms, k), -1, dtype=np.int32)
+    scores = np.zeros((n_terms, k), dtype=np.float16)
+
+    columns = []
+    vectors = []
+    for term, column in vectorizer.vocabulary_.items():
+        if term in embedding_model.wv:
+            columns.append(column)
+            vectors.append(embedding_model.wv[term])
+    top_k = min(k, len(columns) - 1)
+    if top_k <= 0:
+        return ids, scores
+    columns = np.array(columns, dtype=np.int32)
+    vectors = normalize_rows(np.array(vectors))
+
+    # 블록 단위 행렬 곱으로 코사인 유사도 → argpartition 상위 k (메모리 ~ block_size x 어휘 수)
+    for start in range(0, len(columns), block_size):
+        block = vectors[start:start + block_size] @ vectors.T
+        rows = np.arange(block.shape[0])
+        block[rows, start + rows] = -np.inf  # 자기 자신 제외
+        top = np.argpartition(-block, top_k - 1, axis=1)[:, :top_k]
+        top_scores = np.take_along_axis(block, top, axis=1)
+        order = np.argsort(-top_scores, axis=1, kind='stable')
+        top = np.take_along_axis(top, order, axis=1)
+        top_scores = np.take_along_axis(top_scores, order, axis=1)
+        keep = top_scores >= min_similarity
+        targets = columns[start:start + block_size]
+        ids[targets, :top_k] = np.where(keep, columns[top], -1)
+        scores[targets, :top_k] = np.where(keep, top_scores, 0)
+    return ids, scores
+
+
+def expand_query(terms, weights, neighbor_ids, neighbor_scores, expansion_weight=EXPANSION_WEIGHT,
+                 max_per_term=MAX_EXPANSIONS_PER_TERM):
+    """질의 (TF-IDF 열 번호, 가중치) → 이웃 단어를 더한 (열 번호, 가중치) (원래 단어 가중치는 그대로)"""
+    terms = np.asarray(terms, dtype=np.int64)
+    weights = np.asarray(weights, dtype=np.float32)
+    if len(terms) == 0:
+        return terms, weights
+    expanded_ids = np.asarray(neighbor_ids[terms, :max_per_term], dtype=np.int64)
+    expanded_weights = (weights[:, None] * expansion_weight *
+                        np.asarray(neighbor_scores[terms, :max_per_term], dtype=np.float32))
+    keep = (expanded_ids >= 0) & ~np.isin(expanded_ids, terms)
+    expanded_ids, expanded_weights = expanded_ids[keep], expanded_weights[keep]
+
+    # 같은 이웃은 가장 큰 가중치 하나만
+    order = np.lexsort((-expanded_weights, expanded_ids))
+    expanded_ids, expanded_weights = expanded_ids[order], expanded_weights[order]
+    first = np.ones(len(expanded_ids), dtype=bool)
+    first[1:] = expanded_ids[1:] != expanded_ids[:-1]
+    return (np.concatenate([terms, expanded_ids[first]]),
+            np.concatenate([weights, expanded_weights[first]]))
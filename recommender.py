@@ -0,0 +1,315 @@
+# Qt 없이 동작하는 추천 엔진 (07_ui_final.py 와 server.py 가 같이 사용)
+# ./Crawling_data/, ./model/ 의 로컬 파일만 읽는다 (네트워크 접근 없음)
+# 게임 목록 / 문서 벡터는 특징 저장소(feature_store.py)에서 읽어서 TF-IDF 와 같은 행 번호를 쓴다.
+# 특징 저장소가 없으면 게임 목록만 CSV 에서 읽고 추천 모델은 사용하지 않는다 (05_1_Steam_doc_vectors.py 필요).
+# quantization='float16' / 'int8' 이면 양자화 문서 벡터로 전체를 훑고 상위 후보만 float32 로 재정렬한다.
+import logging
+import time
+
+import numpy as np
+import pandas as pd
+
+from artifacts import BUNDLE_DIR, open_bundle
+from autocomplete import TitleAutocomplete
+from batch_recommend import load_blend_weights, top_n_per_row, valid_rows_mask
+from doc_vectors import cosine_scores
+from feature_store import FEATURE_STORE_DIR, FeatureStoreError, open_feature_store
+from inverted_index import InvertedIndex
+from quantization import RERANK_CANDIDATES, QuantizedVectors, exact_scores
+from query_analyzer import QueryAnalyzer
+from query_cache import QueryCache, normalize_query
+from query_expansion import expand_query
+from title_index import TitleIndex
+
+DATA_FILE = "./Crawling_data/steam_game_translated.csv"
+
+
+class RecommendationEngine:
+    """게임 제목 / 키워드 기반 추천 (점수 순 후보 목록 반환)"""
+
+    def __init__(self, data_file=DATA_FILE, weights=None, bundle_dir=BUNDLE_DIR, store_dir=FEATURE_STORE_DIR,
+                 quantization=None, rerank_candidates=RERANK_CANDIDATES):
+        """weights: (TF-IDF, Word2Vec) 결합 가중치 (생략 시 ./model/blend_weights.json 또는 기본값)
+        quantization: None (float32) / 'float16' / 'int8' - 비슷한 게임 점수 계산에 쓸 문서 벡터 형식
+        """
+        self.data_file = data_file
+        self.quantization = quantization
+        self.rerank_candidates = rerank_candidates
+        self.bundle_dir = bundle_dir
+        self.store_dir = store_dir
+        self.bundle = None
+        self.store = None
+        self.weights = tuple(weights) if weights is not None else load_blend_weights()
+        self.game_data = None
+        self.titles = []
+        self.game_titles = []
+        self.game_descriptions = {}
+        self.game_images = {}
+        self.title_index = None
+        self.autocomplete = None
+        self.doc_vectors = None
+        self.quantized_vectors = None
+        self.tfidf_matrix = None
+        self.tfidf_vectorizer = None
+        self.tfidf_index = None
+        self.valid_rows = None  # 추천 후보가 될 수 있는 행 (bool 배열, 모델 로드 시 한 번 계산)
+        self.models_loaded = False
+        self.model_version = None
+        self.query_cache = QueryCache()
+        self.query_analyzer = QueryAnalyzer()
+
+    def load(self):
+        self.load_catalog()
+        self.load_models()
+        return self
+
+    def load_catalog(self):
+        """게임 목록 로드 (특징 저장소, 없으면 CSV) - 실패 시 예외"""
+        try:
+            self.store = open_feature_store(self.store_dir)
+        except FeatureStoreError as e:
+            logging.warning(f"특징 저장소 사용 불가, CSV 로 로드: {str(e)}")
+            self.store = None
+            self.load_catalog_csv()
+        else:
+            self.game_data = None
+            self.titles = self.store.titles.tolist()  # 행 번호 = 특징 저장소 행
+            self.game_descriptions = dict(zip(self.titles, self.store.descriptions.tolist()))
+            self.game_images = {title: path for title, path in zip(self.titles, self.store.image_paths.tolist())
+                                if path}
+            logging.debug(f"특징 저장소 로드: build {self.store.build_id}, 게임 {len(self.store)}개")
+
+        # 게임 제목 목록 생성 (행 순서 유지, 중복 제거)
+        self.game_titles = list(dict.fromkeys(self.titles))
+        if not self.game_titles:
+            raise ValueError("게임 제목 목록이 비어 있습니다.")
+        logging.debug(f"로드된 게임 수: {len(self.game_titles)}, 처음 5개: {self.game_titles[:5]}")
+
+        # 제목 찾기용 인덱스 (정확 일치 dict + 3-gram postings) / 자동 완성 (자모 분해 + 오타 허용)
+        self.title_index = TitleIndex(self.titles)
+        self.autocomplete = TitleAutocomplete(self.titles)
+
+    def load_catalog_csv(self):
+        """게임 CSV 로드 및 검증 (특징 저장소가 없을 때)"""
+        try:
+            game_data = pd.read_csv(self.data_file, encoding='utf-8')
+        except UnicodeDecodeError:
+            logging.warning("UTF-8로 CSV 로드 실패, cp949로 재시도")
+            game_data = pd.read_csv(self.data_file, encoding='cp949')
+
+        # 데이터 검증
+        required_columns = ['Title', 'Description']
+        missing_columns = [col for col in required_columns if col not in game_data.columns]
+        if missing_columns:
+            raise ValueError(f"CSV 파일에 필수 열이 없습니다: {missing_columns}")
+        if game_data.empty:
+            raise ValueError("CSV 파일이 비어 있습니다.")
+
+        # 데이터 전처리
+        game_data['Title'] = game_data['Title'].astype(str).str.strip()
+        game_data['Description'] = game_data['Description'].fillna('no description')
+        self.game_data = game_data
+        self.titles = game_data['Title'].tolist()  # 행 인덱스 = TF-IDF / 문서 벡터 행 (같다고 가정)
+        self.game_descriptions = game_data.set_index('Title')['Description'].to_dict()
+        self.game_images = game_data.set_index('Title').get('image_path', pd.Series(dtype=str)).to_dict()
+
+    def load_models(self):
+        self.bundle = None
+        self.tfidf_index = None
+        if self.store is not None:
+            self.load_store_models()
+        else:
+            logging.error("특징 저장소가 없어 추천 모델을 사용할 수 없습니다. "
+                          "05_1_Steam_doc_vectors.py 를 먼저 실행하세요.")
+
+        self.models_loaded = (self.doc_vectors is not None and
+                              self.tfidf_matrix is not None and
+                              self.tfidf_vectorizer is not None)
+        self.valid_rows = self.compute_valid_rows() if self.models_loaded else None
+        self.quantized_vectors = self.load_quantized_vectors() if self.models_loaded else None
+
+        # 새 모델을 읽었으므로 이전 결과 캐시는 버린다 (버전도 캐시 키에 포함)
+        bundle_version = self.bundle.build_id if self.bundle is not None else 'missing'
+        self.model_version = f"{bundle_version}:{self.store.build_id if self.store is not None else 'missing'}"
+        if self.quantized_vectors is not None:
+            self.model_version += f":{self.quantized_vectors.kind}"  # 재정렬 전 후보가 달라질 수 있음
+        self.query_cache.clear()
+        self.query_analyzer.warm_up()  # 첫 키워드 검색에서 Okt(JVM) 시작 비용이 나가지 않도록
+        logging.debug(f"모델 로드 상태: models_loaded={self.models_loaded}, version={self.model_version}")
+
+    def compute_valid_rows(self):
+        """TF-IDF 행이 비어 있지 않고 문서 벡터가 0 이 아닌 행 (특징 저장소에 있으면 그대로 사용)"""
+        start = time.perf_counter()
+        if self.store is not None and self.store.valid_rows is not None:
+            valid_rows = np.asarray(self.store.valid_rows, dtype=bool)
+        else:
+            valid_rows = valid_rows_mask(self.tfidf_matrix, self.doc_vectors)
+        logging.debug(f"유효 행: {int(valid_rows.sum())}/{len(valid_rows)}개, "
+                      f"{(time.perf_counter() - start) * 1000:.1f}ms")
+        return valid_rows
+
+    def load_quantized_vectors(self):
+        """양자화 문서 벡터 (저장소에 없으면 float32 행렬에서 만든다, quantization=None 이면 None)"""
+        if self.quantization is None:
+            return None
+        try:
+            quantized = self.store.quantized_embedding(self.quantization) if self.store is not None else None
+            if quantized is None:
+                logging.warning(f"저장된 {self.quantization} 문서 벡터가 없어 로드할 때 양자화합니다.")
+                quantized = QuantizedVectors.from_vectors(self.doc_vectors, self.quantization)
+        except Exception as e:
+            logging.error(f"양자화 문서 벡터 로드 오류, float32 로 계산합니다: {str(e)}")
+            return None
+        logging.debug(f"양자화 문서 벡터: {quantized.kind}, {quantized.nbytes / 2 ** 20:.1f}MB "
+                      f"(float32 {self.doc_vectors.nbytes / 2 ** 20:.1f}MB), 재정렬 후보 {self.rerank_candidates}개")
+        return quantized
+
+    def load_store_models(self):
+        """특징 저장소의 문서 벡터 + 같은 행 순서로 맞춘 TF-IDF 번들"""
+        try:
+            self.bundle = open_bundle(self.bundle_dir)
+            self.tfidf_matrix = self.store.tfidf_matrix(self.bundle)
+            self.tfidf_vectorizer = self.bundle.vectorizer
+            # 번들 역색인은 번들 행 번호 기준이므로, 제외된 행이 있으면 맞춘 행렬에서 다시 만든다
+            self.tfidf_index = (self.bundle.inverted_index if self.tfidf_matrix is self.bundle.tfidf_matrix
+                                else InvertedIndex.from_matrix(self.tfidf_matrix))
+            self.doc_vectors = self.store.embedding
+            logging.debug(f"특징 저장소 모델 로드 완료: 번들 build {self.bundle.build_id}, "
+                          f"TF-IDF {self.tfidf_matrix.shape}, 문서 벡터 {self.doc_vectors.shape}")
+        except Exception as e:
+            logging.error(f"특징 저장소 / 모델 번들 로드 오류: {str(e)}")
+            self.tfidf_matrix = None
+            self.tfidf_vectorizer = None
+            self.tfidf_index = None
+            self.doc_vectors = None
+
+    def find_title(self, user_input):
+        """대소문자 무시 부분 일치로 가장 잘 맞는 게임 제목과 행 인덱스 찾기 (없으면 (None, None))
+
+        정확 일치 > 앞부분 일치 > 단어 시작 일치 > 중간 일치 순
+        """
+        return self.title_index.find(user_input)
+
+    def suggest_titles(self, prefix, limit=10):
+        """자동 완성 후보 제목 (일치 품질 순, 부분 일치가 부족하면 오타 허용 후보 포함)"""
+        return [match.title for match in self.autocomplete.suggest(prefix, limit=limit)]
+
+    def rank_similar(self, title=None, index=None, limit=10):
+        """기준 게임과 비슷한 게임 [(행 인덱스, 점수), ...] 점수 내림차순"""
+        logging.debug(f"rank_similar 시작: 제목={title}, 인덱스={index}")
+        if not self.models_loaded or self.tfidf_matrix.shape[0] == 0:
+            logging.warning("필수 모델이 로드되지 않았습니다.")
+            return []
+
+        # 게임 인덱스 결정
+        if index is not None:
+            if not (0 <= index < len(self.titles)):
+                logging.warning(f"유효하지 않은 인덱스: {index}")
+                return []
+            game_idx = index
+            game_title = self.titles[game_idx]
+        else:
+            game_idx = self.title_index.exact(title) if title is not None else None
+            if game_idx is None:
+                logging.warning(f"제목 '{title}'이 데이터에 없습니다.")
+                return []
+            game_title = self.titles[game_idx]
+        logging.debug(f"선택된 게임: {game_title}, 인덱스: {game_idx}")
+
+        key = ('similar', int(game_idx), self.model_version, tuple(self.weights), limit)
+        return list(self.query_cache.get_or_compute(key, lambda: self._score_similar(game_idx, game_title, limit)))
+
+    def _score_similar(self, game_idx, game_title, limit):
+        """rank_similar 의 실제 점수 계산 (캐시 미적중 시)"""
+        # TF-IDF 행은 이미 L2 정규화되어 있으므로 내적 = 코사인 (행렬 전체 재정규화 생략)
+        tfidf_ref = self.tfidf_matrix[game_idx]
+        if tfidf_ref.nnz == 0:
+            logging.warning(f"TF-IDF 벡터가 비어 있습니다: {game_title}")
+            return []
+        tfidf_cosine_sim = (self.tfidf_matrix @ tfidf_ref.T).toarray().ravel()
+
+        # Word2Vec 기반 코사인 유사도 (정규화된 문서 벡터 행렬과 행렬-벡터 곱 1회)
+        if not np.any(self.doc_vectors[game_idx]):
+            logging.warning(f"Word2Vec 참조 벡터가 0입니다: {game_title}")
+            return []
+        ref_vector = np.asarray(self.doc_vectors[game_idx], dtype=np.float32)
+        if self.quantized_vectors is not None:
+            w2v_cosine_sim = self.quantized_vectors.scores(ref_vector)  # 근사값 (아래에서 후보만 재계산)
+        else:
+            w2v_cosine_sim = np.asarray(cosine_scores(self.doc_vectors, game_idx), dtype=np.float64)
+
+        # TF-IDF와 Word2Vec 결합 (유효하지 않은 행 / 자기 자신은 후보에서 제외)
+        tfidf_weight, w2v_weight = self.weights
+        combined_sim = tfidf_weight * tfidf_cosine_sim + w2v_weight * w2v_cosine_sim
+        combined_sim[~self.valid_rows] = -np.inf
+        combined_sim[game_idx] = -np.inf
+        n_candidates = int(self.valid_rows.sum()) - int(self.valid_rows[game_idx])
+        if n_candidates <= 0:
+            logging.warning("유효한 벡터가 없습니다.")
+            return []
+
+        # 상위 limit 개만 argpartition 으로 선택 후 정렬
+        n_top = min(limit, n_candidates)
+        if self.quantized_vectors is None:
+            top_idx, top_scores = top_n_per_row(combined_sim[None, :], n_top)
+            top_idx, top_scores = top_idx[0], top_scores[0]
+        else:
+            # 근사 점수 상위 후보만 float32 원본으로 Word2Vec 유사도를 다시 계산해서 재정렬
+            candidate_idx = top_n_per_row(combined_sim[None, :],
+                                          min(max(self.rerank_candidates, n_top), n_candidates))[0][0]
+            exact_sim = (tfidf_weight * tfidf_cosine_sim[candidate_idx] +
+                         w2v_weight * exact_scores(self.doc_vectors, ref_vector, candidate_idx))
+            order, top_scores = top_n_per_row(exact_sim[None, :], n_top)
+            top_idx, top_scores = candidate_idx[order[0]], top_scores[0]
+        sim_scores = [(int(i), float(score)) for i, score in zip(top_idx, top_scores)]
+        logging.debug(f"rank_similar 완료: 후보 {n_candidates}개 중 {len(sim_scores)}개")
+        return sim_scores
+
+    def can_expand_queries(self):
+        """Word2Vec 이웃 단어 표가 있어서 semantic 키워드 검색을 할 수 있는지"""
+        return self.store is not None and self.store.neighbor_ids is not None
+
+    def rank_keyword(self, keyword, limit=10, semantic=False):
+        """키워드와 관련된 게임 [(행 인덱스, 점수), ...] 점수 내림차순 (점수 > 0 만)
+
+        semantic=True 면 질의 단어를 Word2Vec 이웃 단어로 확장해서 검색 (이웃 단어 표가 없으면 일반 검색)
+        """
+        logging.debug(f"rank_keyword 시작: 키워드={keyword}")
+        if not self.models_loaded or self.tfidf_index is None:
+            logging.warning("TF-IDF 모델이 로드되지 않았습니다.")
+            return []
+
+        # 인덱스와 같은 Okt / 불용어 규칙으로 분석 (활용형이 달라도 같은 토큰 → 같은 캐시 항목)
+        start = time.perf_counter()
+        tokens = self.query_analyzer.analyze(keyword)
+        analysis_ms = (time.perf_counter() - start) * 1000
+        query = ('tokens', tokens) if tokens else ('raw', normalize_query(keyword))
+        if semantic and not self.can_expand_queries():
+            logging.warning("이웃 단어 표가 없어 검색어 확장 없이 검색합니다 (05_1_Steam_doc_vectors.py 를 다시 실행하세요).")
+            semantic = False
+
+        start = time.perf_counter()
+        key = ('semantic' if semantic else 'keyword', query, self.model_version, tuple(self.weights), limit)
+        ranked = list(self.query_cache.get_or_compute(
+            key, lambda: self._score_keyword(keyword, tokens, limit, semantic)))
+        logging.debug(f"⏱️ 키워드 검색: 질의 분석 {analysis_ms:.2f}ms, 점수 계산 {(time.perf_counter() - start) * 1000:.2f}ms, "
+                      f"토큰={list(tokens)}, 확장={semantic}")
+        return ranked
+
+    def _score_keyword(self, keyword, tokens, limit, semantic=False):
+        """rank_keyword 의 실제 점수 계산 (캐시 미적중 시)
+
+        분석 결과가 비어 있으면 (Okt 를 쓸 수 없는 경우 등) 입력 문자열을 그대로 변환한다.
+        """
+        keyword_vector = self.tfidf_vectorizer.transform([' '.join(tokens) if tokens else keyword])
+        logging.debug(f"키워드 벡터 형상: {keyword_vector.shape}, 질의 단어 수: {keyword_vector.nnz}")
+
+        row = keyword_vector.tocsr()
+        terms, weights = row.indices, row.data
+        if semantic:
+            terms, weights = expand_query(terms, weights, self.store.neighbor_ids, self.store.neighbor_scores)
+            logging.debug(f"검색어 확장: 단어 {keyword_vector.nnz}개 → {len(terms)}개")
+
+        # 역색인에서 질의 단어 postings 만 누적해서 상위 limit 개 선택
+        similar_indices, scores = self.tfidf_index.search(terms, weights, k=limit)
+        return [(int(i), float(s)) for i, s in zip(similar_indices, scores) if i < len(self.titles)]
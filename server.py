@@ -0,0 +1,266 @@
+# Qt 없이 추천을 제공하는 HTTP/JSON 서버 (asyncio + 점수 계산용 프로세스 풀)
+# 사용 예) python server.py --host 0.0.0.0 --port 8000 --workers 4
+#         python server.py --quantization int8   (문서 벡터를 int8 로 훑고 상위 후보만 float32 로 재정렬)
+#   GET /similar?title=<게임 제목>&top_n=10&page=1
+#   GET /search?q=<키워드>&top_n=10&page=1&mode=semantic   (mode=semantic: Word2Vec 이웃 단어로 검색어 확장)
+#   GET /suggest?q=<입력 중인 제목>&limit=10   (자동 완성)
+#   GET /healthz   (요청을 처리한 워커 하나의 모델 로드 여부, 로드 실패 시 503)
+#   GET /stats     (응답한 워커의 결과 캐시 적중 / 미적중 / 제거 횟수)
+# 모델 파일은 각 워커 프로세스가 시작할 때 한 번만 로드한다 (문서 벡터는 mmap 이라 프로세스 간 페이지 공유).
+import argparse
+import asyncio
+import json
+import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from urllib.parse import parse_qs, urlsplit
+
+from quantization import QUANTIZATIONS
+from recommender import DATA_FILE, RecommendationEngine
+
+DEFAULT_TOP_N = 10
+MAX_TOP_N = 100
+MAX_RESULTS = 1000  # page * top_n 상한
+MAX_SUGGESTIONS = 50
+
+STATUS_TEXT = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+               500: "Internal Server Error", 503: "Service Unavailable"}
+
+# ================================
+# 워커 프로세스 (CPU 작업)
+# ================================
+_engine = None
+
+
+class EngineUnavailable(Exception):
+    """워커에서 카탈로그 / 모델 로드에 실패함 (503)"""
+
+
+def _init_worker(data_file, quantization=None):
+    # 초기화 함수에서 예외가 나면 프로세스 풀 전체가 깨지므로, 로그만 남기고 엔진 없이 시작한다
+    global _engine
+    try:
+        _engine = RecommendationEngine(data_file, quantization=quantization).load()
+    except Exception as e:
+        logging.error(f"워커 {os.getpid()} 추천 엔진 로드 실패: {type(e).__name__}: {str(e)}")
+        _engine = None
+
+
+def _require_engine():
+    if _engine is None:
+        raise EngineUnavailable("추천 엔진이 로드되지 않았습니다.")
+    return _engine
+
+
+def _worker_ready():
+    return _engine is not None and _engine.models_loaded
+
+
+def _worker_stats():
+    if _engine is None:
+        return {'pid': os.getpid(), 'ready': False}
+    return {'pid': os.getpid(), 'ready': _engine.models_loaded, 'model_version': _engine.model_version,
+            'query_cache': _engine.query_cache.stats(), 'query_analyzer': _engine.query_analyzer.stats()}
+
+
+def _similar(title, limit):
+    engine = _require_engine()
+    matched_title, index = engine.find_title(title)
+    if index is None:
+        return None, []
+    ranked = engine.rank_similar(index=index, limit=limit)
+    return matched_title, [(idx, engine.titles[idx], score) for idx, score in ranked]
+
+
+def _search(keyword, limit, semantic=False):
+    engine = _require_engine()
+    ranked = engine.rank_keyword(keyword, limit=limit, semantic=semantic)
+    return [(idx, engine.titles[idx], score) for idx, score in ranked]
+
+
+def _suggest(prefix, limit):
+    return [(match.row, match.title, match.kind, match.score)
+            for match in _require_engine().autocomplete.suggest(prefix, limit)]
+
+
+# ================================
+# HTTP 처리 (이벤트 루프)
+# ================================
+def parse_paging(params):
+    """top_n / page 파라미터 검증 → (top_n, page)"""
+    top_n = int(params.get('top_n', [DEFAULT_TOP_N])[0])
+    page = int(params.get('page', [1])[0])
+    if not (1 <= top_n <= MAX_TOP_N):
+        raise ValueError(f"top_n 은 1 ~ {MAX_TOP_N} 사이여야 합니다.")
+    if page < 1 or page * top_n > MAX_RESULTS:
+        raise ValueError(f"page 범위를 벗어났습니다 (page * top_n <= {MAX_RESULTS}).")
+    return top_n, page
+
+
+def parse_content_length(headers):
+    """Content-Length 헤더 검증 (없으면 0, 숫자가 아니거나 음수면 ValueError)"""
+    value = headers.get('content-length', '')
+    if not value:
+        return 0
+    if not value.isdecimal():
+        raise ValueError(f"Content-Length 가 올바르지 않습니다: {value!r}")
+    return int(value)
+
+
+def paginate(ranked, top_n, page):
+    start = (page - 1) * top_n
+    return [{'rank': start + rank, 'index': int(idx), 'title': title, 'score': round(float(score), 6)}
+            for rank, (idx, title, score) in enumerate(ranked[start:start + top_n], start=1)]
+
+
+class RecommendationServer:
+    def __init__(self, executor):
+        self.executor = executor
+
+    async def run_in_worker(self, func, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, func, *args)
+
+    async def dispatch(self, method, target):
+        if method != 'GET':
+            return 405, {'error': "GET 요청만 지원합니다."}
+        url = urlsplit(target)
+        params = parse_qs(url.query)
+        start = time.perf_counter()
+
+        if url.path == '/healthz':
+            ready = await self.run_in_worker(_worker_ready)
+            return (200 if ready else 503), {'ready': ready}
+
+        if url.path == '/stats':
+            return 200, await self.run_in_worker(_worker_stats)
+
+        if url.path == '/suggest':
+            prefix = params.get('q', [''])[0]
+            limit = int(params.get('limit', [10])[0])
+            if not prefix.strip():
+                return 400, {'error': "q 파라미터가 필요합니다."}
+            if not (1 <= limit <= MAX_SUGGESTIONS):
+                raise ValueError(f"limit 은 1 ~ {MAX_SUGGESTIONS} 사이여야 합니다.")
+            suggestions = await self.run_in_worker(_suggest, prefix, limit)
+            return 200, {
+                'query': prefix,
+                'results': [{'index': int(row), 'title': title, 'match': kind, 'score': round(score, 6)}
+                            for row, title, kind, score in suggestions],
+                'took_ms': round((time.perf_counter() - start) * 1000, 3),
+            }
+
+        if url.path == '/similar':
+            title = params.get('title', [''])[0].strip()
+            if not title:
+                return 400, {'error': "title 파라미터가 필요합니다."}
+            top_n, page = parse_paging(params)
+            matched_title, ranked = await self.run_in_worker(_similar, title, page * top_n)
+            if matched_title is None:
+                return 404, {'error': f"'{title}' 게임을 찾을 수 없습니다."}
+            payload = {'query': title, 'matched_title': matched_title}
+        elif url.path == '/search':
+            keyword = params.get('q', [''])[0].strip()
+            if not keyword:
+                return 400, {'error': "q 파라미터가 필요합니다."}
+            mode = params.get('mode', ['lexical'])[0]
+            if mode not in ('lexical', 'semantic'):
+                raise ValueError("mode 는 lexical 또는 semantic 이어야 합니다.")
+            top_n, page = parse_paging(params)
+            ranked = await self.run_in_worker(_search, keyword, page * top_n, mode == 'semantic')
+            payload = {'query': keyword, 'mode': mode}
+        else:
+            return 404, {'error': f"알 수 없는 경로: {url.path}"}
+
+        payload.update({
+            'page': page,
+            'top_n': top_n,
+            'total': len(ranked),
+            'results': paginate(ranked, top_n, page),
+            'took_ms': round((time.perf_counter() - start) * 1000, 3),
+        })
+        return 200, payload
+
+    async def handle_connection(self, reader, writer):
+        """HTTP/1.1 keep-alive 연결 처리"""
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b'\r\n', b'\n', b''):
+                        break
+                    name, _, value = line.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+
+                body_read = False  # 본문 길이를 모르면 다음 요청 경계도 모르므로 응답 후 연결을 닫는다
+                try:
+                    method, target, version = request_line.decode('latin-1').split()
+                    content_length = parse_content_length(headers)
+                    if content_length:
+                        await reader.readexactly(content_length)
+                    body_read = True
+                    status, payload = await self.dispatch(method, target)
+                except asyncio.IncompleteReadError:
+                    raise  # 본문을 다 받기 전에 연결이 끊김 (응답하지 않고 닫는다)
+                except ValueError as e:
+                    version = 'HTTP/1.1'
+                    status, payload = 400, {'error': str(e)}
+                except EngineUnavailable as e:
+                    status, payload = 503, {'error': str(e)}
+                except Exception as e:
+                    logging.error(f"요청 처리 오류: {request_line!r} - {e}")
+                    status, payload = 500, {'error': str(e)}
+
+                connection = headers.get('connection', '').lower()
+                keep_alive = connection != 'close' if version == 'HTTP/1.1' else connection == 'keep-alive'
+                keep_alive = keep_alive and body_read
+                body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+                writer.write(
+                    f"HTTP/1.1 {status} {STATUS_TEXT.get(status, '')}\r\n"
+                    f"Content-Type: application/json; charset=utf-8\r\n"
+                    f"Content-Length: {len(body)}\r\n"
+                    f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode('latin-1') + body)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionResetError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+
+async def serve(host, port, workers, data_file, quantization=None):
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(data_file, quantization)) as executor:
+        server = RecommendationServer(executor)
+        # 워커 수만큼 준비 확인을 보내서 워커를 미리 띄우고 모델 로드를 기다린다
+        # (같은 워커가 여러 번 받을 수 있으므로 모든 워커를 확인한다는 보장은 없다)
+        ready = await asyncio.gather(*[server.run_in_worker(_worker_ready) for _ in range(workers)])
+        if not all(ready):
+            logging.warning("모델 로드에 실패한 워커가 있습니다. 그 워커가 처리한 요청은 503 을 반환합니다.")
+        http_server = await asyncio.start_server(server.handle_connection, host, port)
+        logging.info(f"추천 서버 시작: http://{host}:{port} (워커 {workers}개)")
+        async with http_server:
+            await http_server.serve_forever()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="게임 추천 HTTP/JSON 서버")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--data-file', default=DATA_FILE)
+    parser.add_argument('--quantization', choices=QUANTIZATIONS, default=None,
+                        help="비슷한 게임 점수 계산에 양자화 문서 벡터 사용 (생략 시 float32)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    try:
+        asyncio.run(serve(args.host, args.port, args.workers, args.data_file, args.quantization))
+    except KeyboardInterrupt:
+        logging.info("추천 서버 종료")
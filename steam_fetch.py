@@ -0,0 +1,142 @@
+# 브라우저 없이 Steam 상점 페이지를 가져오는 HTTP 수집기 (01_Crawling.py 의 빠른 경로)
+# keep-alive 연결 풀을 쓰는 requests.Session 에 한국어 / 나이 확인 쿠키를 미리 넣어두고
+# lxml 로 제목 / 설명 / 사용자 태그를 파싱한다. 실패하면 FetchError 를 던지고, 크롤러가 Selenium 으로 다시 시도한다.
+# 태그는 오프라인 평가(evaluation.py)의 관련성 기준으로 쓴다 (없어도 실패로 보지 않음).
+# base_url 을 바꾸면 로컬 스텁 서버를, parse_game_page 에 저장된 HTML 을 넣으면 오프라인으로 확인할 수 있다.
+#   python steam_fetch.py 730                 (앱 ID 로 가져오기)
+#   python steam_fetch.py saved_page.html     (저장된 HTML 파싱)
+import re
+import sys
+
+import requests
+from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+STORE_BASE_URL = "https://store.steampowered.com"
+USER_AGENT = ("Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
+              "Chrome/120.0.0.0 Safari/537.36")
+
+# 01_Crawling.py 의 setup_korean_language 와 같은 쿠키
+KOREAN_COOKIES = {
+    'Steam_Language': 'koreana',
+    'language': 'koreana',
+    'steamCountry': 'KR%7C37d90c1b1f756ad3bb4e20b0c8739de4',
+    'steamCurrencyId': '23',
+}
+# 나이 확인 통과 (1990-01-01 생)
+AGE_GATE_COOKIES = {
+    'birthtime': '631152001',
+    'lastagecheckage': '1-0-1990',
+    'wants_mature_content': '1',
+}
+
+TITLE_SELECTORS = [
+    ".apphub_AppName",
+    "h1.apphub_AppName",
+    "#appHubAppName",
+    ".page_title_area .apphub_AppName",
+]
+DESC_SELECTORS = [
+    "#game_area_description",
+    ".game_description_snippet",
+    ".game_area_description",
+    ".game_page_autocollapse_ctn",
+    ".game_description",
+]
+# 상점 페이지 "이 제품의 인기 사용자 태그" (접혀 있는 태그 포함, '+' 버튼은 a 가 아니라 제외)
+TAG_SELECTOR = ".glance_tags.popular_tags a.app_tag"
+MIN_DESCRIPTION_LENGTH = 21
+TAG_SEPARATOR = ';'
+
+
+class FetchError(Exception):
+    """HTTP 로 게임 정보를 얻지 못함 (Selenium 으로 다시 시도해야 함)"""
+
+
+def create_session(pool_size=8, retries=2):
+    """keep-alive 연결 풀 + 재시도 + 한국어/나이 확인 쿠키가 설정된 세션"""
+    session = requests.Session()
+    retry = Retry(total=retries, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504))
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({
+        'User-Agent': USER_AGENT,
+        'Accept-Language': 'ko-KR,ko;q=0.9',
+    })
+    # 도메인을 지정하지 않으면 모든 호스트로 전송된다 (로컬 스텁 서버 포함)
+    for name, value in {**KOREAN_COOKIES, **AGE_GATE_COOKIES}.items():
+        session.cookies.set(name, value)
+    return session
+
+
+def _first_text(soup, selectors, min_length=1):
+    for selector in selectors:
+        for elem in soup.select(selector):
+            text = re.sub(r'\s+', ' ', elem.get_text(' ', strip=True)).strip()
+            if text and len(text) >= min_length:
+                return text
+    return None
+
+
+def parse_tags(soup):
+    """인기 사용자 태그 목록 (페이지 순서 = 인기순, 중복 제거)"""
+    tags = []
+    for elem in soup.select(TAG_SELECTOR):
+        tag = re.sub(r'\s+', ' ', elem.get_text(' ', strip=True)).strip()
+        if tag and tag not in tags:
+            tags.append(tag)
+    return tags
+
+
+def parse_game_page(html):
+    """상점 페이지 HTML → (제목, 설명, 태그 목록). 제목 / 설명이 없으면 FetchError"""
+    soup = BeautifulSoup(html, 'lxml')
+    if soup.select_one('#ageYear') is not None or soup.select_one('#app_agegate') is not None:
+        raise FetchError("나이 확인 페이지")
+    title = _first_text(soup, TITLE_SELECTORS)
+    if not title:
+        raise FetchError("제목을 찾을 수 없음")
+    description = _first_text(soup, DESC_SELECTORS, min_length=MIN_DESCRIPTION_LENGTH)
+    if not description:
+        raise FetchError("설명을 찾을 수 없음")
+    return title, description, parse_tags(soup)
+
+
+class SteamPageFetcher:
+    """앱 ID 로 상점 페이지를 가져와서 제목/설명 추출 (스레드마다 하나씩 사용)"""
+
+    def __init__(self, session=None, base_url=STORE_BASE_URL, timeout=10):
+        self.session = session or create_session()
+        self.base_url = base_url.rstrip('/')
+        self.timeout = timeout
+
+    def app_url(self, app_id):
+        return f"{self.base_url}/app/{app_id}/?l=koreana"
+
+    def fetch(self, app_id):
+        try:
+            response = self.session.get(self.app_url(app_id), timeout=self.timeout)
+        except requests.RequestException as e:
+            raise FetchError(f"요청 실패: {e}") from e
+        if response.status_code != 200:
+            raise FetchError(f"HTTP {response.status_code}")
+        if 'agecheck' in response.url:
+            raise FetchError("나이 확인 페이지로 이동됨")
+        return parse_game_page(response.content)
+
+    def close(self):
+        self.session.close()
+
+
+if __name__ == "__main__":
+    target = sys.argv[1]
+    if target.endswith('.html'):
+        with open(target, 'rb') as file:
+            title, description, tags = parse_game_page(file.read())
+    else:
+        title, description, tags = SteamPageFetcher().fetch(target)
+    print(f"제목: {title}")
+    print(f"설명: {description[:200]}")
+    print(f"태그: {', '.join(tags) or '없음'}")
@@ -0,0 +1,78 @@
+# 증분 TF-IDF 가 전체 재학습(TfidfVectorizer(sublinear_tf=True).fit_transform)과 같은 결과를 내는지 확인
+#   python -m pytest -q test_incremental_tfidf.py
+import numpy as np
+import pytest
+
+pytest.importorskip('sklearn')
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+from incremental_tfidf import IncrementalTfidf, unique_keys
+
+CATALOG = [
+    ('app:10', "space shooter with roguelike upgrades"),
+    ('app:20', "cozy farming and fishing in a quiet village"),
+    ('app:30', "tactical strategy shooter with squad upgrades"),
+    ('app:40', "puzzle platformer about time and gravity"),
+]
+
+
+def assert_same_as_refit(state, docs):
+    keys = [key for key, _ in docs]
+    texts = [text for _, text in docs]
+    refit = TfidfVectorizer(sublinear_tf=True)
+    expected = refit.fit_transform(texts)
+
+    assert state.vocabulary() == refit.vocabulary_
+    np.testing.assert_allclose(state.idf(), refit.idf_)
+    np.testing.assert_allclose(state.weighted_matrix(keys).toarray(), expected.toarray(), atol=1e-12)
+
+    vectorizer = state.to_vectorizer()
+    queries = ["upgrades shooter", "fishing village", "gravity puzzle squad"]
+    np.testing.assert_allclose(vectorizer.transform(queries).toarray(), refit.transform(queries).toarray(),
+                               atol=1e-12)
+
+
+def test_initial_build_matches_refit():
+    state = IncrementalTfidf()
+    state.sync(CATALOG)
+    assert_same_as_refit(state, CATALOG)
+
+
+def test_add_change_remove_matches_refit():
+    state = IncrementalTfidf()
+    state.sync(CATALOG)
+
+    docs = [
+        ('app:10', "space shooter with roguelike upgrades"),
+        ('app:20', "cozy farming sim with cooking"),           # 변경: fishing / village 는 df 0 이 됨
+        ('app:40', "puzzle platformer about time and gravity"),
+        ('app:50', "racing game with drift upgrades"),          # 추가
+    ]                                                            # app:30 삭제: tactical / squad 도 df 0
+    stats = state.sync(docs)
+    assert stats == {'added': 1, 'changed': 1, 'removed': 1, 'unchanged': 2}
+    assert 'squad' not in state.vocabulary()
+    assert_same_as_refit(state, docs)
+
+    # 상태 저장 / 로드 뒤에도 같음 + 빠졌던 단어가 다시 나오는 경우
+    docs.append(('app:60', "squad tactics in a fishing village"))
+    state.sync(docs)
+    assert_same_as_refit(state, docs)
+
+
+def test_save_load_roundtrip(tmp_path):
+    state = IncrementalTfidf()
+    state.sync(CATALOG)
+    state.sync(CATALOG[1:])
+    path = tmp_path / 'state.npz'
+    state.save(path)
+    assert_same_as_refit(IncrementalTfidf.load(path), CATALOG[1:])
+
+
+def test_duplicate_titles_keep_separate_rows():
+    keys = unique_keys(['title:abc', 'app:1', 'title:abc'])
+    assert keys == ['title:abc', 'app:1', 'title:abc#2']
+    docs = list(zip(keys, ["strategy game", "farming game", "horror survival"]))
+    state = IncrementalTfidf()
+    state.sync(docs)
+    assert state.n_docs == 3
+    assert_same_as_refit(state, docs)
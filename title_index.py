@@ -0,0 +1,158 @@
+# 게임 제목 검색 인덱스 (추천 엔진의 제목 찾기, autocomplete.py 의 후보 생성)
+# 로드할 때 한 번 만든다.
+# - 정규화(소문자, 공백 정리)한 제목 목록
+# - 정확 일치: 제목 → 행 번호 dict
+# - 부분 일치 / 오타: 3-gram → 제목 id postings
+# 부분 일치는 가장 짧은 3-gram postings 만 확인하고, 결과는 일치 품질 순으로 정렬한다.
+#   정확 일치 > 앞부분 일치 > 단어 시작 일치 > 중간 일치 (같은 등급이면 앞쪽 위치, 짧은 제목 순)
+# 부분 일치가 없으면 3-gram 겹침(Dice 계수)으로 비슷한 제목을 찾는다.
+import heapq
+from bisect import bisect_right
+from collections import Counter, defaultdict, namedtuple
+
+NGRAM_SIZE = 3
+MIN_FUZZY_SIMILARITY = 0.3
+
+# kind: 'exact' / 'prefix' / 'word' / 'substring' / 'fuzzy'
+TitleMatch = namedtuple('TitleMatch', ['title', 'row', 'kind', 'score'])
+MATCH_KINDS = ('exact', 'prefix', 'word', 'substring')
+
+
+def normalize_title(text):
+    return ' '.join(str(text).lower().split())
+
+
+def ngrams(text, n=NGRAM_SIZE):
+    return {text[i:i + n] for i in range(len(text) - n + 1)}
+
+
+class TitleIndex:
+    def __init__(self, titles, normalize=normalize_title):
+        """titles: 행 번호 순서의 제목 목록 (중복 제목은 첫 번째 행만 사용)
+
+        normalize: 제목 / 질의 정규화 함수 (자동 완성은 한글 자모 분해 키를 쓴다)
+        """
+        self.normalize = normalize
+        self.titles = []        # 제목 id → 원래 제목 (CSV 순서, 중복 제거)
+        self.rows = []          # 제목 id → 행 번호
+        self.normalized = []    # 제목 id → 정규화된 제목
+        self.title_rows = {}    # 원래 제목 → 행 번호
+        self.normalized_ids = {}  # 정규화된 제목 → 제목 id
+        for row, title in enumerate(titles):
+            title = str(title)
+            if title in self.title_rows:
+                continue
+            self.title_rows[title] = row
+            key = normalize(title)
+            self.normalized_ids.setdefault(key, len(self.titles))
+            self.titles.append(title)
+            self.rows.append(row)
+            self.normalized.append(key)
+
+        self.grams = defaultdict(list)  # 3-gram → 제목 id (오름차순)
+        self.gram_counts = []
+        for title_id, text in enumerate(self.normalized):
+            title_grams = ngrams(text)
+            self.gram_counts.append(len(title_grams))
+            for gram in title_grams:
+                self.grams[gram].append(title_id)
+
+        # 3글자 미만 질의는 postings 대신 전체 제목을 이어 붙인 문자열에서 str.find 로 찾는다
+        self._blob = '\n'.join(self.normalized)
+        self._starts = []
+        offset = 0
+        for text in self.normalized:
+            self._starts.append(offset)
+            offset += len(text) + 1
+
+    def __len__(self):
+        return len(self.titles)
+
+    def exact(self, title):
+        """정확히 같은 제목의 행 번호 (대소문자 / 공백 차이는 무시, 없으면 None)"""
+        row = self.title_rows.get(title)
+        if row is not None:
+            return row
+        title_id = self.normalized_ids.get(self.normalize(title))
+        return None if title_id is None else self.rows[title_id]
+
+    # ================================
+    # 후보 생성
+    # ================================
+    def _substring_ids(self, query):
+        if len(query) >= NGRAM_SIZE:
+            postings = [self.grams.get(gram) for gram in ngrams(query)]
+            if not all(postings):
+                return []
+            shortest = min(postings, key=len)
+            return [title_id for title_id in shortest if query in self.normalized[title_id]]
+
+        found = []
+        pos = self._blob.find(query)
+        while pos >= 0:
+            title_id = bisect_right(self._starts, pos) - 1
+            found.append(title_id)
+            # 같은 제목 안의 다음 위치는 건너뛴다
+            pos = self._blob.find(query, self._starts[title_id] + len(self.normalized[title_id]) + 1)
+        return found
+
+    def _match_key(self, title_id, query):
+        text = self.normalized[title_id]
+        pos = text.find(query)
+        if text == query:
+            tier = 0
+        elif pos == 0:
+            tier = 1
+        elif text[pos - 1] == ' ':
+            tier = 2
+        else:
+            tier = 3
+        return tier, pos, len(text), title_id
+
+    def fuzzy_ids(self, query, limit, exclude=(), min_similarity=MIN_FUZZY_SIMILARITY, max_grams=None):
+        """3-gram 겹침(Dice 계수) 상위 [(제목 id, 유사도), ...] (query 는 정규화된 문자열)
+
+        max_grams: postings 가 짧은(드문) 3-gram 만 이 개수까지 사용 (긴 질의의 지연 시간 상한)
+        """
+        query_grams = ngrams(query)
+        if not query_grams:
+            return []
+        postings = [self.grams[gram] for gram in query_grams if gram in self.grams]
+        if max_grams is not None and len(postings) > max_grams:
+            postings = sorted(postings, key=len)[:max_grams]
+        common = Counter()
+        for title_ids in postings:
+            common.update(title_ids)
+        # 겹치는 3-gram 수 상위 후보만 Dice 계수로 다시 정렬
+        scored = []
+        for title_id, n_common in common.most_common(limit * 5 + len(exclude)):
+            if title_id in exclude:
+                continue
+            similarity = 2 * n_common / (len(query_grams) + self.gram_counts[title_id])
+            if similarity >= min_similarity:
+                scored.append((-similarity, title_id))
+        return [(title_id, -neg) for neg, title_id in heapq.nsmallest(limit, scored)]
+
+    # ================================
+    # 검색
+    # ================================
+    def search(self, query, limit=10, fuzzy=True):
+        """일치 품질 순 [TitleMatch, ...] (부분 일치가 limit 개 미만이면 비슷한 제목으로 채움)"""
+        query = self.normalize(query)
+        if not query or limit <= 0:
+            return []
+        keys = heapq.nsmallest(limit, (self._match_key(title_id, query) for title_id in self._substring_ids(query)))
+        matches = [TitleMatch(self.titles[title_id], self.rows[title_id], MATCH_KINDS[tier], 1.0 / (1 + tier))
+                   for tier, _, _, title_id in keys]
+        if fuzzy and len(matches) < limit:
+            exclude = {key[-1] for key in keys}
+            matches += [TitleMatch(self.titles[title_id], self.rows[title_id], 'fuzzy', similarity * 0.2)
+                        for title_id, similarity in self.fuzzy_ids(query, limit - len(matches), exclude)]
+        return matches
+
+    def find(self, query):
+        """가장 잘 맞는 부분 일치 제목과 행 번호 (없으면 (None, None), 오타 보정 없음)"""
+        matches = self.search(query, limit=1, fuzzy=False)
+        if not matches:
+            return None, None
+        return matches[0].title, matches[0].row
@@ -0,0 +1,84 @@
+# 토큰화 결과 캐시 (steam_game_token.csv 옆 SQLite 파일)
+# 키 = hash(제목 + 설명 + 불용어 버전) → 설명이 바뀌었거나 불용어를 수정한 문서만 다시 Okt 로 처리한다.
+import hashlib
+import json
+import os
+import sqlite3
+
+from tokenizer import stopwords_version, tokenize_corpus
+
+
+def token_cache_path(token_csv_path):
+    """steam_game_token.csv → steam_game_token_cache.sqlite (같은 폴더)"""
+    root, _ = os.path.splitext(token_csv_path)
+    return f"{root}_cache.sqlite"
+
+
+def document_key(title, description, version):
+    return hashlib.sha256(f"{title}\x00{description}\x00{version}".encode('utf-8')).hexdigest()
+
+
+class TokenCache:
+    """문서 해시 → (한국어 토큰, 영어 토큰)"""
+
+    def __init__(self, path):
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS tokens (
+                key TEXT PRIMARY KEY,
+                korean TEXT NOT NULL,
+                english TEXT NOT NULL
+            )
+        """)
+        self.conn.commit()
+
+    def get_many(self, keys):
+        found = {}
+        keys = list(keys)
+        for start in range(0, len(keys), 500):  # SQLite 변수 개수 제한
+            chunk = keys[start:start + 500]
+            rows = self.conn.execute(
+                f"SELECT key, korean, english FROM tokens WHERE key IN ({','.join('?' * len(chunk))})", chunk)
+            for key, korean, english in rows:
+                found[key] = (json.loads(korean), json.loads(english))
+        return found
+
+    def put_many(self, entries):
+        """entries: [(key, 한국어 토큰, 영어 토큰), ...]"""
+        self.conn.executemany("INSERT OR REPLACE INTO tokens VALUES (?, ?, ?)",
+                              [(key, json.dumps(korean, ensure_ascii=False), json.dumps(english, ensure_ascii=False))
+                               for key, korean, english in entries])
+        self.conn.commit()
+
+    def prune(self, keep_keys):
+        """이번 코퍼스에서 쓰이지 않은 항목 삭제 (삭제된 게임 / 이전 불용어 버전)"""
+        self.conn.execute("CREATE TEMP TABLE IF NOT EXISTS keep (key TEXT PRIMARY KEY)")
+        self.conn.execute("DELETE FROM keep")
+        self.conn.executemany("INSERT OR IGNORE INTO keep VALUES (?)", [(key,) for key in keep_keys])
+        removed = self.conn.execute("DELETE FROM tokens WHERE key NOT IN (SELECT key FROM keep)").rowcount
+        self.conn.commit()
+        return removed
+
+    def close(self):
+        self.conn.close()
+
+
+def tokenize_corpus_cached(rows, cache, workers=None):
+    """캐시에 없는 문서만 토큰화해서 입력 순서대로 [(한국어 토큰, 영어 토큰), ...] 반환
+
+    반환: (결과 리스트, 캐시 적중 수, 새로 토큰화한 수)
+    """
+    rows = list(rows)
+    version = stopwords_version()
+    keys = [document_key(title, description, version) for title, description in rows]
+    cached = cache.get_many(set(keys))
+
+    missing = [i for i, key in enumerate(keys) if key not in cached]
+    fresh = list(tokenize_corpus([rows[i] for i in missing], workers=workers)) if missing else []
+    cache.put_many([(keys[i], korean, english) for i, (korean, english) in zip(missing, fresh)])
+    cache.prune(keys)
+
+    results = [cached.get(key) for key in keys]
+    for i, tokens in zip(missing, fresh):
+        results[i] = tokens
+    return results, len(rows) - len(missing), len(missing)
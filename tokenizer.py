@@ -0,0 +1,102 @@
+# 게임 설명 토큰화 (03_Preprocessing.py, 검색어 분석 query_analyzer.py 에서 사용)
+# 한국어는 Okt 형태소 분석(명사/형용사/동사, 원형), 영어는 알파벳 단어만 추출하고 불용어를 제거한다.
+# tokenize_corpus 는 문서를 여러 조각으로 나눠 프로세스 풀에서 처리한다 (워커마다 Okt 인스턴스 1개).
+import hashlib
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+
+# 불용어 리스트
+korean_stop_words = {'게임', '이다', '있다', '한다', '되다', '위해', '통해', '것', '수', '때', '더', '매우', '정말',
+                     '아주', '하다', '당신', '플레이어', '플레이', '모든', '사용', '다른', '않다', '많다', '없다',
+                     '다양하다', '새롭다', '되어다', '만들다', '사람', '가지', '자신', '대한', '우리', '시간', '가장',
+                     '보다', '같다', '오다', '가다', '따르다',
+                     '받다', '포함', '가능하다', '크다', '거나', '시작', '제공', '기능',
+                     '시스템', '추가', '무료', '가장', '보다', '그것', '그녀', '아니다', '이상', '동안', '명의', '진행', '기반', '개발',
+                     '목표', '방법', '모두', '최고', '하나', '모드', '맵', '아이템', '레벨', '스킬'}
+english_stop_words = {'game', 'games', 'player', 'players', 'play', 'playing', 'the', 'a', 'an', 'and', 'or', 'but',
+                      'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by', 'is', 'are', 'was', 'were', 'be', 'been',
+                      'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could', 'should', 'may', 'might',
+                      'can', 'must', 'this', 'that', 'these', 'those', 'prologue', 'mode', 'map', 'item', 'level',
+                      'skill'}
+
+KOREAN_POS_TAGS = {'Noun', 'Adjective', 'Verb'}
+NON_KOREAN = re.compile(r'[^가-힣\s]')
+NON_ENGLISH = re.compile(r'[^a-zA-Z\s]')
+
+# 토큰화 규칙(필터 조건 등)을 바꾸면 올린다 → 토큰 캐시가 자동으로 무효화된다
+TOKENIZER_VERSION = 1
+
+
+def stopwords_version():
+    """불용어 / 품사 / 토큰화 규칙 버전 해시 (불용어를 수정하면 값이 바뀐다)"""
+    parts = [str(TOKENIZER_VERSION), '|'.join(sorted(KOREAN_POS_TAGS)),
+             '|'.join(sorted(korean_stop_words)), '|'.join(sorted(english_stop_words))]
+    return hashlib.sha256('\x00'.join(parts).encode('utf-8')).hexdigest()[:16]
+
+
+_okt = None
+
+
+def get_okt():
+    """프로세스당 Okt 인스턴스 1개 (JVM 시작 비용이 커서 재사용)"""
+    global _okt
+    if _okt is None:
+        from konlpy.tag import Okt
+        _okt = Okt()
+    return _okt
+
+
+def extract_korean_tokens(text):
+    """한국어 토큰 추출"""
+    korean_text = NON_KOREAN.sub(' ', text)
+    if not korean_text.strip():
+        return []
+
+    try:
+        tokened = get_okt().pos(korean_text, stem=True)
+        return [word for word, tag in tokened
+                if tag in KOREAN_POS_TAGS and len(word) > 1 and word not in korean_stop_words]
+    except:
+        return []
+
+
+def extract_english_tokens(text):
+    """영어 토큰 추출 - 3글자 이상, 불용어 제거, 순수 알파벳만"""
+    english_text = NON_ENGLISH.sub(' ', text)
+    if not english_text.strip():
+        return []
+    return [word for word in english_text.lower().split()
+            if len(word) >= 3 and word not in english_stop_words and word.isalpha()]
+
+
+def tokenize_text(text):
+    """문자열 → (한국어 토큰, 영어 토큰)"""
+    return extract_korean_tokens(text), extract_english_tokens(text)
+
+
+def tokenize_document(title, description):
+    """Title + Description → (한국어 토큰, 영어 토큰)"""
+    return tokenize_text(f"{str(title).strip()} {description}")
+
+
+def _tokenize_shard(rows):
+    return [tokenize_document(title, description) for title, description in rows]
+
+
+def tokenize_corpus(rows, workers=None, shard_size=64):
+    """[(title, description), ...] → 입력 순서대로 (한국어 토큰, 영어 토큰) 생성
+
+    workers=1 이면 현재 프로세스에서 순차 처리.
+    """
+    rows = list(rows)
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        for row in rows:
+            yield tokenize_document(*row)
+        return
+    shards = [rows[i:i + shard_size] for i in range(0, len(rows), shard_size)]
+    with ProcessPoolExecutor(max_workers=workers, initializer=get_okt) as executor:
+        # map 은 제출 순서대로 결과를 돌려주므로 문서 순서가 유지된다
+        for shard_result in executor.map(_tokenize_shard, shards):
+            yield from shard_result
@@ -0,0 +1,353 @@
+# 게임 트레일러(유튜브 영상 id) 조회 + 캐시 (07_ui_final.py 의 영상 미리보기)
+# 예전에는 클릭할 때마다 새 headless Chrome 을 띄워 유튜브 검색 → 3번째 썸네일 → 종료 (수 초) 했다.
+# - 캐시: 게임 제목 → 영상 id 를 SQLite 에 TTL 과 함께 저장 (못 찾은 결과도 짧게 저장)
+# - 캐시 미적중: HTTP 로 검색 결과 HTML 에서 영상 id 추출 → 실패하면 재사용하는 Chrome 드라이버로 조회
+# - 조회는 스레드 풀에서 하고, 같은 제목을 동시에 여러 번 요청하면 한 번만 조회한다.
+# - lookup(cancel=...) 에 취소 표시(is_set())를 주면 드라이버 대기 중에도 조회를 중단한다.
+# 검색 URL 을 바꾸면 로컬 스텁 페이지로 확인할 수 있다: python trailer_lookup.py --self-test
+import argparse
+import hashlib
+import logging
+import re
+import sqlite3
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qs, quote_plus, urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+TRAILER_CACHE_FILE = './Crawling_data/trailer_cache.sqlite'
+TRAILER_TTL = 7 * 24 * 3600        # 찾은 영상 id 유지 기간 (초)
+TRAILER_MISS_TTL = 24 * 3600       # 못 찾은 결과 유지 기간
+YOUTUBE_SEARCH_URL = "https://www.youtube.com/results?search_query={query}"
+SEARCH_SUFFIX = "trailershort"
+RESULT_POSITION = 2                # 기존 동작과 같이 3번째 검색 결과 사용 (없으면 첫 번째)
+USER_AGENT = ("Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
+              "Chrome/120.0.0.0 Safari/537.36")
+CHROME_BINARY = r"C:\Program Files\Google\Chrome\Application\chrome.exe"
+VIDEO_ID_PATTERN = re.compile(r'(?:"videoId":"|/shorts/|/watch\?v=)([\w-]{11})')
+
+
+class TrailerLookupCancelled(Exception):
+    """조회가 취소됨 (결과는 캐시에 저장하지 않음)"""
+
+
+def check_cancelled(cancel, title):
+    if cancel is not None and cancel.is_set():
+        raise TrailerLookupCancelled(title)
+
+
+def search_url(title, template=YOUTUBE_SEARCH_URL):
+    return template.format(query=quote_plus(f"{title} {SEARCH_SUFFIX}"))
+
+
+def embed_url(video_id):
+    return f"https://www.youtube.com/embed/{video_id}?autoplay=1"
+
+
+def extract_video_id(url):
+    """유튜브 영상 / 쇼츠 링크 → 영상 id (알 수 없는 형식이면 None)"""
+    parsed_url = urlparse(url)
+    if "/shorts/" in parsed_url.path:
+        return parsed_url.path.split("/shorts/")[1].split("/")[0] or None
+    if "watch" in parsed_url.path:
+        return parse_qs(parsed_url.query).get("v", [None])[0]
+    return None
+
+
+def pick_result(video_ids):
+    """검색 결과 영상 id 목록 중 사용할 것 (3번째, 부족하면 첫 번째)"""
+    if not video_ids:
+        return None
+    return video_ids[RESULT_POSITION] if len(video_ids) > RESULT_POSITION else video_ids[0]
+
+
+# ================================
+# 캐시
+# ================================
+class TrailerCache:
+    """게임 제목 → 영상 id (None = 찾지 못함) SQLite 캐시 (여러 스레드에서 공유)"""
+
+    def __init__(self, path=TRAILER_CACHE_FILE, ttl=TRAILER_TTL, miss_ttl=TRAILER_MISS_TTL):
+        self.ttl = ttl
+        self.miss_ttl = miss_ttl
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS trailers (
+                key TEXT PRIMARY KEY,
+                title TEXT NOT NULL,
+                video_id TEXT,
+                fetched_at REAL NOT NULL
+            )
+        """)
+        self.conn.commit()
+
+    @staticmethod
+    def key(title):
+        return hashlib.sha256(' '.join(title.lower().split()).encode('utf-8')).hexdigest()
+
+    def get(self, title):
+        """(적중 여부, 영상 id) - 만료된 항목은 미적중"""
+        with self.lock:
+            row = self.conn.execute("SELECT video_id, fetched_at FROM trailers WHERE key = ?",
+                                    (self.key(title),)).fetchone()
+        if row is None:
+            return False, None
+        video_id, fetched_at = row
+        ttl = self.ttl if video_id else self.miss_ttl
+        if time.time() - fetched_at > ttl:
+            return False, None
+        return True, video_id
+
+    def put(self, title, video_id):
+        with self.lock:
+            self.conn.execute("INSERT OR REPLACE INTO trailers VALUES (?, ?, ?, ?)",
+                              (self.key(title), title, video_id, time.time()))
+            self.conn.commit()
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
+
+
+# ================================
+# 조회 방법 (앞에서부터 시도)
+# ================================
+class HttpTrailerResolver:
+    """브라우저 없이 검색 결과 HTML 에서 영상 id 추출 (keep-alive 세션 재사용)"""
+
+    def __init__(self, template=YOUTUBE_SEARCH_URL, timeout=5, pool_size=4):
+        self.template = template
+        self.timeout = timeout
+        self.session = requests.Session()
+        retry = Retry(total=1, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504))
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update({'User-Agent': USER_AGENT, 'Accept-Language': 'ko-KR,ko;q=0.9'})
+
+    def resolve(self, title, cancel=None):
+        response = self.session.get(search_url(title, self.template), timeout=self.timeout)
+        response.raise_for_status()
+        video_ids = list(dict.fromkeys(VIDEO_ID_PATTERN.findall(response.text)))  # 순서 유지 중복 제거
+        return pick_result(video_ids)
+
+    def close(self):
+        self.session.close()
+
+
+def create_chrome_driver(binary_location=CHROME_BINARY):
+    """유튜브 검색용 headless Chrome (selenium 은 여기서 처음 import)"""
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+
+    chrome_options = Options()
+    chrome_options.add_argument("--headless")
+    chrome_options.add_argument("--disable-gpu")
+    chrome_options.add_argument("--no-sandbox")
+    if binary_location:
+        chrome_options.binary_location = binary_location
+    return webdriver.Chrome(options=chrome_options)
+
+
+class SeleniumTrailerResolver:
+    """Chrome 드라이버 하나를 계속 재사용 (조회마다 브라우저를 띄우지 않음)"""
+
+    def __init__(self, template=YOUTUBE_SEARCH_URL, driver_factory=create_chrome_driver, wait_seconds=10):
+        self.template = template
+        self.driver_factory = driver_factory
+        self.wait_seconds = wait_seconds
+        self.driver = None
+        self.lock = threading.Lock()  # 드라이버는 한 번에 한 조회만
+
+    def resolve(self, title, cancel=None):
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.webdriver.support.ui import WebDriverWait
+
+        thumbnails_present = EC.presence_of_all_elements_located((By.XPATH, '//*[@id="thumbnail"]/yt-image/img'))
+
+        def thumbnails_or_cancelled(driver):
+            check_cancelled(cancel, title)  # 대기 중 취소되면 바로 중단
+            return thumbnails_present(driver)
+
+        with self.lock:
+            check_cancelled(cancel, title)
+            if self.driver is None:
+                self.driver = self.driver_factory()
+                logging.debug("트레일러 조회용 Chrome 드라이버 시작")
+            try:
+                self.driver.get(search_url(title, self.template))
+                thumbnails = WebDriverWait(self.driver, self.wait_seconds, poll_frequency=0.2).until(
+                    thumbnails_or_cancelled)
+                links = [thumbnail.find_element(By.XPATH, "./ancestor::a[@id='thumbnail']").get_attribute("href")
+                         for thumbnail in thumbnails[:RESULT_POSITION + 1]]
+            except TrailerLookupCancelled:
+                raise
+            except Exception:
+                # 드라이버가 죽었을 수 있으므로 다음 조회 때 새로 띄운다
+                self.close_driver()
+                raise
+        video_ids = [video_id for video_id in (extract_video_id(link) for link in links if link) if video_id]
+        return pick_result(list(dict.fromkeys(video_ids)))
+
+    def close_driver(self):
+        if self.driver is not None:
+            try:
+                self.driver.quit()
+            except Exception:
+                pass
+            self.driver = None
+
+    def close(self):
+        with self.lock:
+            self.close_driver()
+
+
+# ================================
+# 조회 서비스
+# ================================
+class TrailerService:
+    """캐시 → 조회 방법 순서로 영상 id 를 찾는 스레드 풀"""
+
+    def __init__(self, cache, resolvers, workers=3):
+        self.cache = cache
+        self.resolvers = resolvers
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='trailer')
+        self.in_flight = {}  # 제목 → Future (같은 제목 중복 조회 방지)
+        self.title_locks = defaultdict(threading.Lock)  # 같은 제목은 한 스레드만 조회, 나머지는 캐시 결과 사용
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def lookup(self, title, cancel=None):
+        """영상 id (찾지 못하면 None) - 현재 스레드에서 실행, 취소되면 TrailerLookupCancelled"""
+        with self.lock:
+            title_lock = self.title_locks[title]
+        while not title_lock.acquire(timeout=0.1):
+            check_cancelled(cancel, title)
+        try:
+            return self._lookup(title, cancel)
+        finally:
+            title_lock.release()
+
+    def _lookup(self, title, cancel):
+        found, video_id = self.cache.get(title)
+        if found:
+            self.hits += 1
+            return video_id
+        self.misses += 1
+        for resolver in self.resolvers:
+            check_cancelled(cancel, title)
+            start = time.perf_counter()
+            try:
+                video_id = resolver.resolve(title, cancel)
+            except TrailerLookupCancelled:
+                raise
+            except Exception as e:
+                logging.warning(f"트레일러 조회 실패 ({type(resolver).__name__}): {title}, {str(e)}")
+                continue
+            logging.debug(f"트레일러 조회 ({type(resolver).__name__}): {title} → {video_id}, "
+                          f"{(time.perf_counter() - start) * 1000:.0f}ms")
+            if video_id:
+                break
+        self.cache.put(title, video_id)
+        return video_id
+
+    def submit(self, title):
+        """백그라운드 조회 Future (이미 조회 중인 제목이면 같은 Future)"""
+        with self.lock:
+            future = self.in_flight.get(title)
+            if future is None:
+                future = self.executor.submit(self.lookup, title)
+                self.in_flight[title] = future
+                future.add_done_callback(lambda _, title=title: self._done(title))
+            return future
+
+    def _done(self, title):
+        with self.lock:
+            self.in_flight.pop(title, None)
+
+    def prefetch(self, titles):
+        return [self.submit(title) for title in titles]
+
+    def close(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        for resolver in self.resolvers:
+            resolver.close()
+        self.cache.close()
+
+
+def create_trailer_service(cache_path=TRAILER_CACHE_FILE, template=YOUTUBE_SEARCH_URL, use_selenium=True, workers=3):
+    resolvers = [HttpTrailerResolver(template)]
+    if use_selenium:
+        resolvers.append(SeleniumTrailerResolver(template))
+    return TrailerService(TrailerCache(cache_path), resolvers, workers=workers)
+
+
+def self_test():
+    """로컬 스텁 검색 페이지로 HTTP 조회 / 캐시 동작 확인"""
+    import os
+    import tempfile
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    video_ids = ['aaaaaaaaaa1', 'bbbbbbbbbb2', 'cccccccccc3']
+    requests_seen = []
+
+    class StubHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            requests_seen.append(self.path)
+            body = ''.join(f'<a id="thumbnail" href="/watch?v={video_id}"></a>' for video_id in video_ids)
+            body += '<script>var ytInitialData = {"videoId":"cccccccccc3"};</script>'
+            if 'nothing' in self.path:
+                body = '<html>no results</html>'
+            data = body.encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/html; charset=utf-8')
+            self.send_header('Content-Length', str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    template = f"http://127.0.0.1:{server.server_address[1]}/results?search_query={{query}}"
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        service = create_trailer_service(os.path.join(tmp_dir, 'trailers.sqlite'), template, use_selenium=False)
+        try:
+            assert service.lookup("Portal 2") == 'cccccccccc3', "3번째 결과를 사용해야 함"
+            assert service.lookup("Portal 2") == 'cccccccccc3' and len(requests_seen) == 1, "두 번째는 캐시 적중"
+            assert service.lookup("nothing here") is None
+            results = [future.result() for future in service.prefetch([f"Game {i}" for i in range(5)])]
+            assert results == ['cccccccccc3'] * 5 and len(requests_seen) == 7
+            assert extract_video_id("https://www.youtube.com/shorts/abcdefghijk") == 'abcdefghijk'
+        finally:
+            service.close()
+            server.shutdown()
+    print(f"✅ 트레일러 조회 self-test 통과 (스텁 요청 {len(requests_seen)}회)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="게임 트레일러 영상 id 조회")
+    parser.add_argument('titles', nargs='*', help="게임 제목")
+    parser.add_argument('--self-test', action='store_true', help="로컬 스텁 페이지로 동작 확인")
+    parser.add_argument('--no-selenium', action='store_true')
+    args = parser.parse_args()
+
+    if args.self_test:
+        self_test()
+    else:
+        service = create_trailer_service(use_selenium=not args.no_selenium)
+        try:
+            for title, future in zip(args.titles, service.prefetch(args.titles)):
+                video_id = future.result()
+                print(f"{title}: {embed_url(video_id) if video_id else '영상 없음'}")
+        finally:
+            service.close()
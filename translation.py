@@ -0,0 +1,172 @@
+# 게임 설명 번역 (02_Translate_Duple.py 에서 사용)
+# - 동시 요청 수를 세마포어로 제한하고, 짧은 설명은 여러 개를 한 요청으로 묶어서 번역
+# - 실패 시 지수 백오프로 재시도
+# - 결과는 (원문 해시, 원문 언어, 대상 언어) 를 키로 SQLite 에 저장 → 다시 실행하면 새로 바뀐 설명만 번역
+# - 번역기는 translate(texts, src, dest) 코루틴만 있으면 교체 가능 (테스트용 StubBackend)
+import asyncio
+import hashlib
+import random
+import sqlite3
+import time
+
+TRANSLATION_CACHE_FILE = './Crawling_data/translation_cache.sqlite'
+SHORT_TEXT_LIMIT = 500     # 이보다 짧은 설명은 묶어서 번역
+BATCH_CHAR_LIMIT = 4000    # 한 번에 보내는 묶음의 최대 글자 수
+BATCH_SIZE_LIMIT = 20      # 한 번에 보내는 묶음의 최대 개수
+
+
+# ================================
+# 번역기 (교체 가능)
+# ================================
+class GoogleTransBackend:
+    """googletrans 비동기 번역기"""
+
+    def __init__(self):
+        from googletrans import Translator
+        self.translator = Translator()
+
+    async def translate(self, texts, src, dest):
+        results = await self.translator.translate(texts, src=src, dest=dest)
+        return [result.text for result in results]
+
+
+class StubBackend:
+    """네트워크 없이 동작하는 테스트용 번역기 (접두어만 붙여서 돌려준다)"""
+
+    def __init__(self, delay=0.0, fail_rate=0.0):
+        self.delay = delay
+        self.fail_rate = fail_rate
+        self.calls = 0
+
+    async def translate(self, texts, src, dest):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if random.random() < self.fail_rate:
+            raise RuntimeError("stub 번역 실패")
+        return [f"[{src}→{dest}] {text}" for text in texts]
+
+
+# ================================
+# 번역 캐시
+# ================================
+def cache_key(text, src, dest):
+    return hashlib.sha256(f"{src}\x00{dest}\x00{text}".encode('utf-8')).hexdigest()
+
+
+class TranslationCache:
+    """원문 해시 + 언어 → 번역문 (SQLite)"""
+
+    def __init__(self, path=TRANSLATION_CACHE_FILE):
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS translations (
+                key TEXT PRIMARY KEY,
+                src TEXT NOT NULL,
+                dest TEXT NOT NULL,
+                translated TEXT NOT NULL,
+                created REAL NOT NULL
+            )
+        """)
+        self.conn.commit()
+
+    def get_many(self, keys):
+        found = {}
+        keys = list(keys)
+        for start in range(0, len(keys), 500):  # SQLite 변수 개수 제한
+            chunk = keys[start:start + 500]
+            rows = self.conn.execute(
+                f"SELECT key, translated FROM translations WHERE key IN ({','.join('?' * len(chunk))})", chunk)
+            found.update(rows.fetchall())
+        return found
+
+    def put_many(self, entries):
+        """entries: [(key, src, dest, translated), ...]"""
+        now = time.time()
+        self.conn.executemany("INSERT OR REPLACE INTO translations VALUES (?, ?, ?, ?, ?)",
+                              [(key, src, dest, translated, now) for key, src, dest, translated in entries])
+        self.conn.commit()
+
+    def close(self):
+        self.conn.close()
+
+
+# ================================
+# 동시 / 묶음 번역
+# ================================
+def make_batches(jobs):
+    """jobs: [(위치, 원문, 원문 언어)] → 같은 언어의 짧은 설명끼리 묶은 리스트"""
+    batches, open_batches = [], {}
+    for job in jobs:
+        _, text, src = job
+        if len(text) >= SHORT_TEXT_LIMIT:
+            batches.append([job])
+            continue
+        batch = open_batches.get(src)
+        if batch is None or len(batch) >= BATCH_SIZE_LIMIT or \
+                sum(len(j[1]) for j in batch) + len(text) > BATCH_CHAR_LIMIT:
+            batch = []
+            open_batches[src] = batch
+            batches.append(batch)
+        batch.append(job)
+    return batches
+
+
+async def _translate_batch(backend, batch, dest, semaphore, retries, base_delay):
+    texts = [text for _, text, _ in batch]
+    src = batch[0][2]
+    for attempt in range(retries + 1):
+        async with semaphore:
+            try:
+                translated = await backend.translate(texts, src, dest)
+                if len(translated) != len(texts):
+                    raise ValueError(f"번역 결과 개수 불일치: {len(translated)} / {len(texts)}")
+                return translated
+            except Exception as e:
+                error = e
+        if attempt < retries:
+            await asyncio.sleep(base_delay * (2 ** attempt) * (1 + random.random()))
+    raise error
+
+
+async def translate_all(items, backend, cache=None, dest='ko', concurrency=8, retries=3, base_delay=1.0,
+                        on_progress=None):
+    """items: [(원문, 원문 언어 or None)] → 번역문 리스트 (언어가 None 이면 원문 그대로, 실패해도 원문)
+
+    반환: (번역문 리스트, 통계 dict)
+    """
+    results = [text for text, _ in items]
+    jobs = [(i, text, src) for i, (text, src) in enumerate(items) if src is not None]
+    stats = {'total': len(items), 'skipped': len(items) - len(jobs), 'cached': 0, 'translated': 0, 'failed': 0}
+
+    # 캐시에 있는 것은 바로 채운다
+    keys = {i: cache_key(text, src, dest) for i, text, src in jobs}
+    cached = cache.get_many(set(keys.values())) if cache is not None else {}
+    pending = []
+    for job in jobs:
+        hit = cached.get(keys[job[0]])
+        if hit is not None:
+            results[job[0]] = hit
+            stats['cached'] += 1
+        else:
+            pending.append(job)
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run(batch):
+        try:
+            translated = await _translate_batch(backend, batch, dest, semaphore, retries, base_delay)
+        except Exception as e:
+            stats['failed'] += len(batch)
+            if on_progress:
+                on_progress(batch, None, e)
+            return
+        for (i, _, src), text in zip(batch, translated):
+            results[i] = text
+        if cache is not None:
+            cache.put_many([(keys[i], src, dest, text) for (i, _, src), text in zip(batch, translated)])
+        stats['translated'] += len(batch)
+        if on_progress:
+            on_progress(batch, translated, None)
+
+    await asyncio.gather(*[run(batch) for batch in make_batches(pending)])
+    return results, stats
@@ -0,0 +1,169 @@
+# GUI 스레드 밖에서 실행하는 작업 (07_ui_final.py)
+# - TaskExecutor: QThreadPool 에서 함수를 실행하고 결과를 시그널로 GUI 스레드에 전달
+#   같은 group 으로 새 작업을 넣으면 이전 작업을 취소 (다른 게임을 클릭하면 이전 영상 조회 중단)
+#   취소된 작업의 결과는 버린다.
+# - EventLoopStallMonitor: 짧은 주기 타이머가 늦게 도착한 시간 = 이벤트 루프가 멈춘 시간
+#   상호작용(클릭 ~ 결과 표시) 동안의 최대 정지 시간을 로그로 남긴다.
+import itertools
+import logging
+import threading
+import time
+
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, QTimer, pyqtSignal
+
+
+class CancelToken:
+    """작업 함수에 cancel= 로 전달되는 취소 표시 (threading.Event 와 같은 is_set())"""
+
+    def __init__(self):
+        self._event = threading.Event()
+
+    def cancel(self):
+        self._event.set()
+
+    def is_set(self):
+        return self._event.is_set()
+
+
+class TaskSignals(QObject):
+    finished = pyqtSignal(int, object)  # (작업 id, 결과)
+    failed = pyqtSignal(int, str)       # (작업 id, 오류 메시지)
+
+
+class Task(QRunnable):
+    def __init__(self, task_id, fn, args, token, signals):
+        super().__init__()
+        self.task_id = task_id
+        self.fn = fn
+        self.args = args
+        self.token = token
+        self.signals = signals
+
+    def run(self):
+        if self.token.is_set():
+            return
+        try:
+            result = self.fn(*self.args, cancel=self.token)
+        except Exception as e:
+            if not self.token.is_set():
+                self.signals.failed.emit(self.task_id, f"{type(e).__name__}: {str(e)}")
+            return
+        self.signals.finished.emit(self.task_id, result)
+
+
+class TaskExecutor(QObject):
+    """QThreadPool 기반 작업 실행기 (취소 / group 단위 대체 / 시그널로 결과 전달)"""
+
+    def __init__(self, max_threads=4, parent=None):
+        super().__init__(parent)
+        self.pool = QThreadPool()
+        self.pool.setMaxThreadCount(max_threads)
+        self.signals = TaskSignals()
+        self.signals.finished.connect(self._on_finished)
+        self.signals.failed.connect(self._on_failed)
+        self.ids = itertools.count(1)
+        self.tasks = {}   # 작업 id → (group, token, on_result, on_error, 제출 시각)
+        self.groups = {}  # group → {작업 id}
+
+    def submit(self, fn, *args, group=None, supersede=True, priority=0, on_result=None, on_error=None):
+        """fn(*args, cancel=token) 을 스레드 풀에서 실행 → 작업 id
+
+        supersede=True 이면 같은 group 의 이전 작업을 취소한다.
+        priority 가 높은 작업이 대기열에서 먼저 실행된다 (클릭한 게임 > 미리 조회).
+        on_result / on_error 는 GUI 스레드에서 호출된다 (취소된 작업은 호출하지 않음).
+        """
+        if group is not None and supersede:
+            self.cancel_group(group)
+        task_id = next(self.ids)
+        token = CancelToken()
+        self.tasks[task_id] = (group, token, on_result, on_error, time.perf_counter())
+        if group is not None:
+            self.groups.setdefault(group, set()).add(task_id)
+        self.pool.start(Task(task_id, fn, args, token, self.signals), priority)
+        return task_id
+
+    def cancel(self, task_id):
+        entry = self.tasks.pop(task_id, None)
+        if entry is None:
+            return
+        group, token = entry[0], entry[1]
+        token.cancel()
+        if group is not None:
+            self.groups.get(group, set()).discard(task_id)
+        logging.debug(f"작업 취소: id={task_id}, group={group}")
+
+    def cancel_group(self, group):
+        for task_id in list(self.groups.pop(group, ())):
+            self.cancel(task_id)
+
+    def pending(self):
+        return len(self.tasks)
+
+    def _finish(self, task_id):
+        entry = self.tasks.pop(task_id, None)
+        if entry is None:
+            return None  # 취소된 작업 (결과 버림)
+        group = entry[0]
+        if group is not None:
+            self.groups.get(group, set()).discard(task_id)
+        logging.debug(f"작업 완료: id={task_id}, group={group}, {(time.perf_counter() - entry[4]) * 1000:.0f}ms")
+        return entry
+
+    def _on_finished(self, task_id, result):
+        entry = self._finish(task_id)
+        if entry is not None and entry[2] is not None:
+            entry[2](result)
+
+    def _on_failed(self, task_id, error_msg):
+        entry = self._finish(task_id)
+        if entry is None:
+            return
+        logging.error(f"작업 실패: id={task_id}, group={entry[0]}, {error_msg}")
+        if entry[3] is not None:
+            entry[3](error_msg)
+
+    def shutdown(self):
+        for task_id in list(self.tasks):
+            self.cancel(task_id)
+        self.pool.clear()  # 아직 시작하지 않은 작업 제거
+
+
+class EventLoopStallMonitor(QObject):
+    """GUI 이벤트 루프가 멈춘 최대 시간을 상호작용별로 기록"""
+
+    def __init__(self, interval_ms=10, parent=None):
+        super().__init__(parent)
+        self.interval = interval_ms / 1000
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self._tick)
+        self.last_tick = None
+        self.interactions = {}  # 이름 → (시작 시각, 최대 정지 시간 초)
+
+    def start(self):
+        self.last_tick = time.perf_counter()
+        self.timer.start(int(self.interval * 1000))
+
+    def _tick(self):
+        now = time.perf_counter()
+        stall = max(0.0, now - self.last_tick - self.interval)
+        self.last_tick = now
+        for name, (started, max_stall) in self.interactions.items():
+            if stall > max_stall:
+                self.interactions[name] = (started, stall)
+
+    def begin(self, name):
+        """상호작용 시작 (같은 이름이 진행 중이면 이전 것은 대체된 것으로 기록)"""
+        if name in self.interactions:
+            self.end(name, superseded=True)
+        self.interactions[name] = (time.perf_counter(), 0.0)
+
+    def end(self, name, superseded=False):
+        entry = self.interactions.pop(name, None)
+        if entry is None:
+            return
+        started, max_stall = entry
+        # 마지막 tick 이후 지금까지도 정지 시간에 포함 (결과 표시 직전까지 막혀 있었을 수 있음)
+        max_stall = max(max_stall, time.perf_counter() - self.last_tick - self.interval)
+        status = " (대체됨)" if superseded else ""
+        logging.info(f"⏱️ {name}{status}: {(time.perf_counter() - started) * 1000:.0f}ms, "
+                     f"최대 이벤트 루프 정지 {max(max_stall, 0.0) * 1000:.0f}ms")